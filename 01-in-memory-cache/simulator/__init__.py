@@ -0,0 +1,35 @@
+"""
+Trace-driven cache simulator.
+
+Replays access traces through LRUCache and any other policy with the
+same get/put interface, and reports miss ratio, ops/sec and peak memory
+per (trace, policy, capacity) as JSON:
+
+    python3 -m simulator --trace zipf:alpha=0.9 --trace loop:loop_size=6000 \\
+        --policy LRU --policy ARC --policy my_module:MyCache \\
+        --capacity 1000 --capacity 5000 --out report.json
+
+The cache implementations live in ../solution, which uses flat imports
+(from lru_cache import LRUCache); that directory is put on sys.path
+here so the simulator runs against them unchanged.
+"""
+
+import os
+import sys
+
+_SOLUTION = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "solution")
+if _SOLUTION not in sys.path:
+    sys.path.insert(0, _SOLUTION)
+
+from simulator.runner import replay, run_suite, simulate  # noqa: E402
+from simulator.specs import POLICIES, TRACE_KINDS, parse_policy, parse_trace  # noqa: E402
+
+__all__ = [
+    "POLICIES",
+    "TRACE_KINDS",
+    "parse_policy",
+    "parse_trace",
+    "replay",
+    "run_suite",
+    "simulate",
+]
@@ -0,0 +1,56 @@
+"""
+Command line: python3 -m simulator [options] (run from 01-in-memory-cache/).
+"""
+
+import argparse
+import json
+import sys
+
+from simulator import POLICIES, TRACE_KINDS, parse_policy, parse_trace, run_suite
+
+DEFAULT_TRACES = ["zipf:alpha=0.8", "zipf:alpha=1.0", "scan", "loop:loop_size=6000", "mixed"]
+DEFAULT_CAPACITIES = [1_000, 5_000, 20_000]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="simulator",
+        description="Replay cache access traces and report miss ratio, ops/sec and peak memory as JSON.",
+    )
+    parser.add_argument(
+        "--trace", action="append", dest="traces",
+        help=f"kind:param=value,... with kind in {list(TRACE_KINDS)} (repeatable)",
+    )
+    parser.add_argument(
+        "--policy", action="append", dest="policies",
+        help=f"one of {list(POLICIES)} or module:Class (repeatable; default: all)",
+    )
+    parser.add_argument("--capacity", action="append", dest="capacities", type=int, help="repeatable")
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--no-memory", action="store_true", help="skip the (slow) tracemalloc pass")
+    args = parser.parse_args(argv)
+
+    traces = dict(parse_trace(spec) for spec in args.traces or DEFAULT_TRACES)
+    policies = dict(parse_policy(spec) for spec in args.policies or POLICIES)
+    capacities = args.capacities or DEFAULT_CAPACITIES
+
+    def progress(row):
+        memory = f"{row['peak_memory_bytes'] / 1e6:8.2f} MB" if row["peak_memory_bytes"] is not None else ""
+        print(
+            f"{row['trace']:<32} {row['policy']:<12} {row['capacity']:>8}"
+            f"{row['miss_ratio']:>9.2%}{row['ops_per_sec']:>12,.0f} op/s {memory}",
+            file=sys.stderr,
+        )
+
+    report = run_suite(traces, policies, capacities, measure_memory=not args.no_memory, progress=progress)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
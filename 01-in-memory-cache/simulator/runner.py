@@ -0,0 +1,131 @@
+"""
+Replay traces through caches and collect the numbers.
+
+Each (trace, policy, capacity) cell is run TWICE, because measuring
+memory distorts speed:
+
+    1. timing pass  — the trace is pulled in 64K-key chunks and only the
+                      get/put loop over each chunk is timed, so trace
+                      generation or file parsing never counts as cache
+                      time, and memory stays bounded by one chunk
+    2. memory pass  — the trace is materialized into a list FIRST, then
+                      the same replay runs under tracemalloc, which
+                      records every allocation (several times slower);
+                      the peak minus the baseline is the cache's peak
+                      footprint. Keys are shared with the trace list, so
+                      it counts the cache's own structures, not the key
+                      objects, and none of the trace generator's work
+
+Replays are read-through, like bench_policies.py: get(key), and put(key)
+on a miss.
+
+NEW CONCEPT — tracemalloc:
+    Standard-library allocation tracer. get_traced_memory() returns
+    (current, peak) bytes allocated by Python since start(), so peak
+    includes short-lived garbage, not just what is still alive.
+"""
+
+import itertools
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional
+
+from simulator.specs import PolicyFactory, TraceFactory
+
+_CHUNK = 1 << 16
+
+
+def replay(cache: Any, trace: Iterable[Any]) -> tuple[int, int, float]:
+    """
+    Replay a trace read-through. Returns (requests, misses, seconds spent
+    in cache calls).
+    """
+    get = cache.get
+    put = cache.put
+    requests = misses = 0
+    elapsed = 0.0
+    iterator = iter(trace)
+    while chunk := list(itertools.islice(iterator, _CHUNK)):
+        started = time.perf_counter()
+        for key in chunk:
+            if get(key) is None:
+                misses += 1
+                put(key, key)
+        elapsed += time.perf_counter() - started
+        requests += len(chunk)
+    return requests, misses, elapsed
+
+
+def peak_memory(factory: PolicyFactory, capacity: int, trace: Iterable[Any]) -> int:
+    """
+    Peak bytes allocated while building the cache and replaying the trace.
+    The trace is read before tracing starts, so generating or parsing it
+    is not counted.
+    """
+    keys = list(trace)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        cache = factory(capacity)
+        get = cache.get
+        put = cache.put
+        for key in keys:
+            if get(key) is None:
+                put(key, key)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def simulate(
+    factory: PolicyFactory,
+    capacity: int,
+    make_trace: TraceFactory,
+    measure_memory: bool = True,
+) -> dict[str, Any]:
+    """
+    Run one (policy, capacity, trace) cell. Returns its report row.
+    """
+    requests, misses, elapsed = replay(factory(capacity), make_trace())
+    return {
+        "capacity": capacity,
+        "requests": requests,
+        "misses": misses,
+        "miss_ratio": misses / requests if requests else 0.0,
+        "ops_per_sec": requests / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_bytes": peak_memory(factory, capacity, make_trace()) if measure_memory else None,
+    }
+
+
+def run_suite(
+    traces: dict[str, TraceFactory],
+    policies: dict[str, PolicyFactory],
+    capacities: list[int],
+    measure_memory: bool = True,
+    progress: Optional[Callable[[dict[str, Any]], None]] = None,
+) -> dict[str, Any]:
+    """
+    Every trace × policy × capacity. Returns the JSON-ready report.
+
+    progress, if given, is called with each result row as it finishes.
+    """
+    results = []
+    for trace_name, make_trace in traces.items():
+        for policy_name, factory in policies.items():
+            for capacity in capacities:
+                row = {"trace": trace_name, "policy": policy_name}
+                row.update(simulate(factory, capacity, make_trace, measure_memory))
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "traces": list(traces),
+        "policies": list(policies),
+        "capacities": capacities,
+        "results": results,
+    }
@@ -0,0 +1,91 @@
+"""
+Policy and trace specs — the strings accepted on the command line.
+
+    policy: a name from POLICIES ("LRU", "ARC", ...) or "module:Class" for
+            any class constructed as Class(capacity) with get/put
+    trace:  "kind:param=value,param=value", e.g.
+                zipf:length=1000000,keyspace=100000,alpha=0.9
+                csv:path=trace.csv,column=key
+                binary:path=trace.bin,record_format=<IQIq,key_field=1
+
+Trace specs resolve to a zero-argument FACTORY, not a trace: every run
+calls it again to get a fresh stream, so a file is re-read from the
+start instead of being held in memory between runs.
+"""
+
+import importlib
+from typing import Any, Callable, Iterable
+
+from arc_cache import ARCCache
+from clock_cache import ClockCache
+from lfu_cache import LFUCache
+from lru_cache import LRUCache
+from s3fifo_cache import S3FIFOCache
+from slru_cache import SegmentedLRUCache
+from tinylfu_cache import TinyLFUCache
+from traces import loop_trace, mixed_trace, read_binary_trace, read_csv_trace, scan_trace, zipf_trace
+
+PolicyFactory = Callable[[int], Any]
+TraceFactory = Callable[[], Iterable[Any]]
+
+POLICIES: dict[str, PolicyFactory] = {
+    "LRU": LRUCache,
+    "CLOCK": ClockCache,
+    "LFU": LFUCache,
+    "W-TinyLFU": TinyLFUCache,
+    "ARC": ARCCache,
+    "SLRU": SegmentedLRUCache,
+    "S3-FIFO": S3FIFOCache,
+}
+
+# Synthetic kinds get these unless the spec overrides them
+_DEFAULT_LENGTH = 500_000
+_DEFAULT_KEYSPACE = 100_000
+
+TRACE_KINDS: dict[str, Callable[..., Iterable[Any]]] = {
+    "zipf": lambda length=_DEFAULT_LENGTH, keyspace=_DEFAULT_KEYSPACE, **kw: zipf_trace(length, keyspace, **kw),
+    "scan": lambda length=_DEFAULT_LENGTH, keyspace=_DEFAULT_KEYSPACE, **kw: scan_trace(length, keyspace, **kw),
+    "loop": lambda length=_DEFAULT_LENGTH, loop_size=10_000, **kw: loop_trace(length, loop_size, **kw),
+    "mixed": lambda length=_DEFAULT_LENGTH, keyspace=_DEFAULT_KEYSPACE, **kw: mixed_trace(length, keyspace, **kw),
+    "csv": read_csv_trace,
+    "binary": read_binary_trace,
+}
+
+
+def parse_policy(spec: str) -> tuple[str, PolicyFactory]:
+    """
+    Resolve a policy spec to (name, factory).
+    """
+    if spec in POLICIES:
+        return spec, POLICIES[spec]
+    if ":" in spec:
+        module_name, _, attr = spec.partition(":")
+        return spec, getattr(importlib.import_module(module_name), attr)
+    raise ValueError(f"Unknown policy: '{spec}'. Available: {list(POLICIES)} or module:Class")
+
+
+def parse_trace(spec: str) -> tuple[str, TraceFactory]:
+    """
+    Resolve a trace spec to (name, factory). The spec itself is the name.
+    """
+    kind, _, params = spec.partition(":")
+    if kind not in TRACE_KINDS:
+        raise ValueError(f"Unknown trace kind: '{kind}'. Available: {list(TRACE_KINDS)}")
+    kwargs = dict(_parse_param(param) for param in params.split(",") if param)
+    make = TRACE_KINDS[kind]
+    return spec, lambda: make(**kwargs)
+
+
+def _parse_param(param: str) -> tuple[str, Any]:
+    """
+    "alpha=0.9" → ("alpha", 0.9). Numbers become int/float, the rest stays str.
+    """
+    name, sep, raw = param.partition("=")
+    if not sep:
+        raise ValueError(f"Trace parameter must be name=value, got '{param}'")
+    for convert in (int, float):
+        try:
+            return name, convert(raw)
+        except ValueError:
+            pass
+    return name, raw
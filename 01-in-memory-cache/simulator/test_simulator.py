@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from lru_cache import LRUCache
+from simulator import parse_policy, parse_trace, run_suite, simulate
+from simulator.__main__ import main
+from simulator.mrc import lru_mrc, lru_mrc_array
+from simulator.mrc import main as mrc_main
+from traces import loop_trace, mixed_trace, read_binary_trace, read_csv_trace, write_binary_trace, zipf_trace
+
+
+class TestTraces:
+    """Generators and file readers yield keys lazily."""
+
+    def test_loop_trace(self):
+        assert list(loop_trace(7, 3, start=10)) == [10, 11, 12, 10, 11, 12, 10]
+
+    def test_mixed_trace_length_and_phases(self):
+        keys = list(mixed_trace(5000, keyspace=100, burst=100, seed=1))
+        assert len(keys) == 5000
+        assert any(key < 100 for key in keys)              # zipf phase
+        assert any(100 <= key < 110 for key in keys)       # loop phase (keyspace // 10 keys)
+        assert any(key >= 110 for key in keys)             # scan phase
+
+    def test_csv_trace_by_index_and_name(self, tmp_path):
+        path = tmp_path / "trace.csv"
+        path.write_text("ts,key\n1,a\n2,b\n3,a\n")
+        assert list(read_csv_trace(str(path), column="key")) == ["a", "b", "a"]
+        assert list(read_csv_trace(str(path), column=1, header=True)) == ["a", "b", "a"]
+
+    def test_binary_trace_round_trip(self, tmp_path):
+        path = str(tmp_path / "trace.bin")
+        assert write_binary_trace(path, range(100_000)) == 100_000
+        keys = read_binary_trace(path)
+        assert next(keys) == 0
+        assert sum(1 for _ in keys) == 99_999
+
+    def test_binary_trace_truncated(self, tmp_path):
+        path = tmp_path / "trace.bin"
+        path.write_bytes(b"\x00" * 12)
+        try:
+            list(read_binary_trace(str(path)))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+class TestSimulator:
+    """Specs, single runs and the JSON report."""
+
+    def test_parse_specs(self):
+        name, make = parse_trace("loop:length=10,loop_size=4")
+        assert name == "loop:length=10,loop_size=4"
+        assert list(make()) == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+        assert parse_policy("LRU")[0] == "LRU"
+        assert parse_policy("clock_cache:ClockCache")[1].__name__ == "ClockCache"
+        for bad in ("nope", "zipf:alpha"):
+            try:
+                parse_policy(bad) if bad == "nope" else parse_trace(bad)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+    def test_lru_loop_larger_than_cache_always_misses(self):
+        _, make = parse_trace("loop:length=1000,loop_size=11")
+        row = simulate(parse_policy("LRU")[1], 10, make)
+        assert row["requests"] == 1000
+        assert row["miss_ratio"] == 1.0
+        assert row["ops_per_sec"] > 0
+        assert row["peak_memory_bytes"] > 0
+
+    def test_peak_memory_excludes_trace_generation(self):
+        def make():
+            scratch = [bytes(1000) for _ in range(10_000)]  # ~10 MB of parser garbage
+            yield from range(len(scratch) // 1000)
+
+        row = simulate(parse_policy("LRU")[1], 10, make)
+        assert 0 < row["peak_memory_bytes"] < 1_000_000
+
+    def test_run_suite_report(self):
+        traces = dict([parse_trace("zipf:length=2000,keyspace=500")])
+        policies = dict(parse_policy(name) for name in ("LRU", "ARC"))
+        report = run_suite(traces, policies, [50, 100], measure_memory=False)
+
+        assert len(report["results"]) == 4
+        row = report["results"][0]
+        assert (row["trace"], row["policy"], row["capacity"]) == ("zipf:length=2000,keyspace=500", "LRU", 50)
+        assert row["peak_memory_bytes"] is None
+        lru = {r["capacity"]: r["miss_ratio"] for r in report["results"] if r["policy"] == "LRU"}
+        assert lru[100] <= lru[50]
+        json.dumps(report)
+
+    def test_cli_writes_json(self, tmp_path, capsys):
+        out = tmp_path / "report.json"
+        assert main(["--trace", "scan:length=3000,keyspace=300", "--policy", "S3-FIFO",
+                     "--capacity", "100", "--out", str(out)]) == 0
+        report = json.loads(out.read_text())
+        assert report["policies"] == ["S3-FIFO"]
+        assert 0 < report["results"][0]["miss_ratio"] < 1
+        assert "S3-FIFO" in capsys.readouterr().err
+
+
+def _lru_miss_ratio(trace, capacity):
+    cache = LRUCache(capacity)
+    misses = 0
+    for key in trace:
+        if cache.get(key) is None:
+            misses += 1
+            cache.put(key, key)
+    return misses / len(trace)
+
+
+class TestMissRatioCurve:
+    """One-pass stack distances match LRUCache at every capacity."""
+
+    def test_stack_distances(self):
+        mrc = lru_mrc("abcba")
+        assert mrc.cold_misses == 3
+        assert mrc.distance_counts == [0, 0, 1, 1]
+        assert mrc.hits(1) == 0 and mrc.hits(2) == 1 and mrc.hits(3) == 2 and mrc.hits(100) == 2
+        assert mrc.miss_ratio(0) == 1.0
+
+    def test_matches_lru_simulation(self):
+        # Long enough to renumber the Fenwick tree several times
+        trace = list(mixed_trace(6000, keyspace=400, burst=500, seed=7))
+        mrc = lru_mrc(trace)
+        for capacity in (1, 10, 45, 200, 400, 5000):
+            assert mrc.miss_ratio(capacity) == _lru_miss_ratio(trace, capacity)
+
+    def test_numpy_path_agrees(self):
+        np = pytest.importorskip("numpy")
+        trace = list(zipf_trace(20_000, 2_000, seed=3))
+        expected = lru_mrc(trace)
+        mrc = lru_mrc_array(np.array(trace))
+        assert mrc.cold_misses == expected.cold_misses
+        assert mrc.distance_counts == expected.distance_counts
+        assert lru_mrc_array(np.array([], dtype=np.int64)).requests == 0
+
+    def test_cli_curve(self, tmp_path):
+        out = tmp_path / "mrc.json"
+        path = tmp_path / "trace.bin"
+        write_binary_trace(str(path), loop_trace(50, 5))
+        assert mrc_main(["--trace", f"binary:path={path}", "--trace", "loop:length=50,loop_size=5",
+                         "--capacity", "4", "--capacity", "5", "--out", str(out)]) == 0
+        for row in json.loads(out.read_text())["results"]:
+            assert row["requests"] == 50 and row["max_distance"] == 5
+            assert [point["miss_ratio"] for point in row["curve"]] == [1.0, 0.1]
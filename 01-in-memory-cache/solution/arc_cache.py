@@ -0,0 +1,198 @@
+"""
+ARC Cache — Adaptive Replacement Cache (Megiddo & Modha).
+
+LRU only knows recency; LFU only knows frequency. ARC keeps both and
+learns, from its own mistakes, how much space each deserves.
+
+    T1: live keys seen ONCE recently        (recency)
+    T2: live keys seen TWICE or more        (frequency)
+    B1: ghost keys recently evicted from T1 (keys only, no values)
+    B2: ghost keys recently evicted from T2
+
+         B1 ghosts ◄── T1 ──┤ p ├── T2 ──► B2 ghosts
+                      |T1| + |T2| <= capacity
+                      |B1| + |B2| <= capacity
+
+    p is the adaptive target size of T1:
+      - miss that hits a B1 ghost → "evicted from T1 too early"  → p grows
+      - miss that hits a B2 ghost → "evicted from T2 too early"  → p shrinks
+
+    REPLACE (make room in T1 ∪ T2):
+      evict the LRU of T1 into B1 if |T1| > p (or == p on a B2 ghost hit),
+      otherwise evict the LRU of T2 into B2.
+
+All four lists are DoublyLinkedLists of Nodes with a hashmap per list, so
+every step is O(1). Ghost nodes keep their key but drop their value.
+"""
+
+from typing import Any, Optional
+
+from doubly_linked_list import DoublyLinkedList
+from models import Node
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache with the LRUCache interface.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self._p = 0.0
+
+        self._t1, self._t2 = DoublyLinkedList(), DoublyLinkedList()
+        self._b1, self._b2 = DoublyLinkedList(), DoublyLinkedList()
+
+        # key → (node, list that holds it)
+        self._map: dict[str, tuple[Node, DoublyLinkedList]] = {}
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._ghost_hits = 0
+
+    def _move(self, node: Node, source: DoublyLinkedList, target: DoublyLinkedList):
+        """
+        Move a node from one list to the head (MRU end) of another.
+        """
+        source.remove(node)
+        target.add_to_head(node)
+        self._map[node.key] = (node, target)
+
+    def _replace(self, in_b2: bool):
+        """
+        Demote one live entry to its ghost list to make room.
+        """
+        t1_size = len(self._t1)
+        # Room already free (after delete()) — nothing to demote
+        if t1_size + len(self._t2) < self.capacity:
+            return
+        if t1_size and (t1_size > self._p or (in_b2 and t1_size == self._p) or self._t2.is_empty()):
+            source, ghosts = self._t1, self._b1
+        else:
+            source, ghosts = self._t2, self._b2
+        node = source.tail.prev
+        node.value = None
+        self._move(node, source, ghosts)
+        self._evictions += 1
+
+    def _forget(self, ghosts: DoublyLinkedList):
+        """
+        Drop the oldest ghost of a ghost list entirely.
+        """
+        node = ghosts.remove_tail()
+        del self._map[node.key]
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value. A hit in T1 or T2 promotes the key to T2's head.
+        """
+        entry = self._map.get(key)
+        if entry is None or entry[1] is self._b1 or entry[1] is self._b2:
+            self._misses += 1
+            return None
+        node, source = entry
+        self._move(node, source, self._t2)
+        self._hits += 1
+        return node.value
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        entry = self._map.get(key)
+
+        # Case 1: Live key — update value and promote to T2
+        if entry is not None and (entry[1] is self._t1 or entry[1] is self._t2):
+            node, source = entry
+            node.value = value
+            self._move(node, source, self._t2)
+            return
+
+        # Case 2: Ghost hit in B1 — recency was undervalued, grow p
+        if entry is not None and entry[1] is self._b1:
+            node = entry[0]
+            delta = max(len(self._b2) / len(self._b1), 1)
+            self._p = min(self._p + delta, self.capacity)
+            self._ghost_hits += 1
+            self._replace(in_b2=False)
+            node.value = value
+            self._move(node, self._b1, self._t2)
+            return
+
+        # Case 3: Ghost hit in B2 — frequency was undervalued, shrink p
+        if entry is not None:
+            node = entry[0]
+            delta = max(len(self._b1) / len(self._b2), 1)
+            self._p = max(self._p - delta, 0)
+            self._ghost_hits += 1
+            self._replace(in_b2=True)
+            node.value = value
+            self._move(node, self._b2, self._t2)
+            return
+
+        # Case 4: Brand-new key — make room, then insert at T1's head
+        l1 = len(self._t1) + len(self._b1)
+        if l1 == self.capacity:
+            if len(self._t1) < self.capacity:
+                self._forget(self._b1)
+                self._replace(in_b2=False)
+            else:
+                # B1 is empty and T1 fills the cache — evict T1's LRU outright
+                node = self._t1.remove_tail()
+                del self._map[node.key]
+                self._evictions += 1
+        else:
+            total = l1 + len(self._t2) + len(self._b2)
+            if total >= self.capacity:
+                if total == 2 * self.capacity:
+                    self._forget(self._b2)
+                self._replace(in_b2=False)
+
+        node = Node(key, value)
+        self._t1.add_to_head(node)
+        self._map[key] = (node, self._t1)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a live key. Ghost entries are dropped silently.
+        """
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return False
+        node, source = entry
+        source.remove(node)
+        return source is self._t1 or source is self._t2
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the stats of the cache, including the adaptation target p.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "ghost_hits": self._ghost_hits,
+            "p": self._p,
+            "t1": len(self._t1),
+            "t2": len(self._t2),
+            "b1": len(self._b1),
+            "b2": len(self._b2),
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._map.get(key)
+        return entry is not None and (entry[1] is self._t1 or entry[1] is self._t2)
+
+    def __repr__(self) -> str:
+        return f"ARCCache(capacity={self.capacity}, p={self._p:.1f}, T1={self._t1}, T2={self._t2})"
@@ -0,0 +1,206 @@
+"""
+Array-backed LRU Cache — same API as LRUCache, no per-entry objects.
+
+LRUCache allocates one Node dataclass per entry. Every Node carries a
+__dict__, and its prev/next references form reference cycles, so the
+garbage collector has to track (and repeatedly traverse) every entry.
+With millions of entries that means hundreds of bytes per item and long
+gen-2 collection pauses.
+
+This engine stores the same doubly linked list in parallel arrays
+indexed by an integer "slot":
+
+    slot:     0      1      2      3    ...  capacity (sentinel)
+    _keys:   "a"    "b"    None   "d"
+    _values:  1      2     None    4
+    _prev:   [int] [int]  [int]  [int]  ← array("i"), 4 bytes per link
+    _next:   [int] [int]  [int]  [int]
+
+The sentinel slot (index == capacity) plays the role of both HEAD and
+TAIL sentinels: _next[sentinel] is the most recent slot and
+_prev[sentinel] is the least recent one.
+
+FREE-SLOT LIST:
+    Unused slots are chained through the _next array itself, starting at
+    _free_head. Allocating and releasing a slot is O(1) and costs no
+    extra memory.
+
+NEW CONCEPT — array.array:
+    A typed, compact C array. array("i") stores raw 32-bit ints, not
+    Python int objects, and is invisible to the garbage collector.
+"""
+
+from array import array
+from typing import Any, Optional
+
+# Marks the end of the free-slot chain
+_NIL = -1
+
+
+class ArrayLRUCache:
+    """
+    LRU Cache backed by preallocated parallel arrays.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self._sentinel = capacity
+        self._map: dict[str, int] = {}
+
+        # Entry storage — one slot per entry, preallocated up front
+        self._keys: list[Any] = [None] * capacity
+        self._values: list[Any] = [None] * capacity
+
+        # Links — the sentinel points at itself while the list is empty
+        self._prev = array("i", [capacity]) * (capacity + 1)
+        self._next = array("i", range(1, capacity + 2))
+        self._next[capacity - 1] = _NIL
+        self._next[capacity] = capacity
+        self._free_head = 0
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ─── Slot list operations ──────────────────────────────────
+
+    def _add_to_head(self, slot: int):
+        """
+        Link a slot right after the sentinel (most recently used).
+        """
+        sentinel = self._sentinel
+        first = self._next[sentinel]
+        self._prev[slot] = sentinel
+        self._next[slot] = first
+        self._prev[first] = slot
+        self._next[sentinel] = slot
+
+    def _unlink(self, slot: int):
+        """
+        Detach a slot from the recency list.
+        """
+        prev_slot = self._prev[slot]
+        next_slot = self._next[slot]
+        self._next[prev_slot] = next_slot
+        self._prev[next_slot] = prev_slot
+
+    def _move_to_head(self, slot: int):
+        """
+        Mark a slot as most recently used.
+        """
+        if self._next[self._sentinel] != slot:
+            self._unlink(slot)
+            self._add_to_head(slot)
+
+    def _release(self, slot: int):
+        """
+        Clear a slot and push it onto the free-slot list.
+        """
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._next[slot] = self._free_head
+        self._free_head = slot
+
+    # ─── Public API ────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+        """
+        slot = self._map.get(key)
+        if slot is None:
+            self._misses += 1
+            return None
+        self._move_to_head(slot)
+        self._hits += 1
+        return self._values[slot]
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        # Case 1: Key already exists — update value and move to head
+        slot = self._map.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            self._move_to_head(slot)
+            return
+
+        if self._free_head != _NIL:
+            # Case 2: Free slot available — pop it off the free list
+            slot = self._free_head
+            self._free_head = self._next[slot]
+        else:
+            # Case 3: Full — recycle the LRU slot in place
+            slot = self._prev[self._sentinel]
+            self._unlink(slot)
+            del self._map[self._keys[slot]]
+            self._evictions += 1
+
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._add_to_head(slot)
+        self._map[key] = slot
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        slot = self._map.pop(key, None)
+        if slot is None:
+            return False
+        self._unlink(slot)
+        self._release(slot)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the stats of the cache.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self._map),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the cache.
+        """
+        return len(self._map)
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Support 'in' operator: if "key" in cache
+        """
+        return key in self._map
+
+    def __repr__(self) -> str:
+        """
+        Walk the slot list from most to least recent.
+        """
+        items = []
+        slot = self._next[self._sentinel]
+        while slot != self._sentinel:
+            items.append(f"[{self._keys[slot]}:{self._values[slot]}]")
+            slot = self._next[slot]
+        listing = "HEAD ↔ " + " ↔ ".join(items) + " ↔ TAIL" if items else "HEAD ↔ TAIL (empty)"
+        return f"ArrayLRUCache(capacity={self.capacity}, size={len(self._map)}, items={listing})"
+
+
+if __name__ == "__main__":
+    cache = ArrayLRUCache(capacity=3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")
+    cache.put("d", 4)  # Evicts 'b'
+    print(cache)
+    print(cache.stats())
@@ -0,0 +1,179 @@
+"""
+Async LRU Cache — LRUCache for asyncio code with async loaders.
+
+Inside one event loop there are no threads, so LRUCache itself is safe
+to call from coroutines. What is missing is loading: if 100 coroutines
+miss the same key while the loader is awaiting a database, all 100
+start their own load.
+
+get_or_load(key, coro_factory) keeps one in-flight asyncio Task per key:
+
+    coroutine 1 ──miss──► create Task(load) ──┐
+    coroutine 2 ──miss──► await same Task ────┼──► one database call
+    coroutine 3 ──miss──► await same Task ────┘
+
+    - Success → value is cached, every awaiter gets it
+    - Failure → nothing is cached, every awaiter gets the exception
+    - An awaiter being cancelled does NOT cancel the shared load
+      (asyncio.shield); the load is cancelled only when its LAST awaiter
+      goes away
+    - put()/delete() during a load win: the stale load result is handed
+      to its awaiters but not cached
+
+The hot path stays synchronous: get() is a plain LRUCache lookup with no
+await, no Task and no Future. get_or_load() only creates a Task on miss.
+
+NEW CONCEPT — asyncio.shield:
+    await asyncio.shield(task) waits for task, but cancelling the waiter
+    does not propagate into task. Used here so one impatient caller
+    cannot kill a load other callers are waiting for.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from lru_cache import LRUCache
+
+
+class _Load:
+    """
+    One in-flight load and how many coroutines are awaiting it.
+    """
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncLRUCache:
+    """
+    asyncio-friendly LRU cache with coalesced async loading.
+    """
+    def __init__(self, capacity: int, default_ttl: Optional[float] = None):
+        self._cache = LRUCache(capacity, default_ttl=default_ttl)
+        self._inflight: dict[str, _Load] = {}
+
+        # stats
+        self._loads = 0
+        self._coalesced = 0
+        self._load_failures = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._cache.capacity
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Synchronous lookup — no await on the hit path.
+        """
+        return self._cache.get(key)
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Put a value. Any in-flight load for key will not overwrite it.
+        """
+        self._inflight.pop(key, None)
+        self._cache.put(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value. Any in-flight load for key will not be cached.
+        """
+        self._inflight.pop(key, None)
+        return self._cache.delete(key)
+
+    async def get_or_load(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value, or await a (shared) load of it.
+
+        coro_factory is called at most once per concurrent miss, e.g.
+        lambda: fetch_user(user_id). A None result is returned but not
+        cached.
+        """
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        load = self._inflight.get(key)
+        if load is None:
+            task = asyncio.get_running_loop().create_task(self._load(key, coro_factory))
+            load = self._inflight[key] = _Load(task)
+            self._loads += 1
+        else:
+            self._coalesced += 1
+
+        load.waiters += 1
+        try:
+            return await asyncio.shield(load.task)
+        finally:
+            load.waiters -= 1
+            # Last awaiter gave up (cancelled) — nobody wants this load anymore.
+            # Forget it now, not when the task runs, so a caller arriving
+            # meanwhile starts a fresh load instead of joining a doomed one.
+            if load.waiters == 0 and not load.task.done():
+                load.task.cancel()
+                self._forget(key, load.task)
+
+    async def _load(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the loader, cache the result only if this load is still current.
+        """
+        task = asyncio.current_task()
+        try:
+            value = await coro_factory()
+        except asyncio.CancelledError:
+            self._forget(key, task)
+            raise
+        except Exception:
+            self._load_failures += 1
+            self._forget(key, task)
+            raise
+
+        current = self._inflight.get(key)
+        if current is not None and current.task is task and value is not None:
+            self._cache.put(key, value)
+        self._forget(key, task)
+        return value
+
+    def _forget(self, key: str, task: Optional[asyncio.Task]):
+        """
+        Remove key's in-flight entry if it still belongs to task.
+        """
+        current = self._inflight.get(key)
+        if current is not None and current.task is task:
+            del self._inflight[key]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        LRUCache stats plus loads, coalesced awaits and failed loads.
+        """
+        return {
+            **self._cache.stats(),
+            "loads": self._loads,
+            "coalesced": self._coalesced,
+            "load_failures": self._load_failures,
+            "inflight": len(self._inflight),
+        }
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+    def __repr__(self) -> str:
+        return f"AsyncLRUCache(capacity={self.capacity}, size={len(self)}, inflight={len(self._inflight)})"
+
+
+if __name__ == "__main__":
+    async def main():
+        cache = AsyncLRUCache(capacity=100)
+
+        async def fetch(n: int) -> int:
+            await asyncio.sleep(0.2)
+            return n * n
+
+        results = await asyncio.gather(*(cache.get_or_load("sq:7", lambda: fetch(7)) for _ in range(50)))
+        print(f"50 concurrent loads → {set(results)}")
+        print(cache.stats())
+
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+Backing stores — where PersistentCache reads misses from and writes to.
+
+Any object with these three methods works (structural typing):
+
+    load(key)           → value or None
+    store_many(items)   → upsert [(key, value), ...] in ONE transaction
+    delete_many(keys)   → delete [key, ...] in ONE transaction
+
+The batch methods matter: write-behind flushes hundreds of coalesced
+writes at once, and one transaction per batch is orders of magnitude
+faster than one per key in SQLite.
+
+NEW CONCEPT — typing.Protocol:
+    Describes the methods a class must have, without inheritance.
+    SQLiteStore never mentions BackingStore, yet type checkers accept it
+    anywhere a BackingStore is expected ("duck typing", but checked).
+"""
+
+import pickle
+import sqlite3
+import threading
+from typing import Any, Iterable, Optional, Protocol
+
+
+class BackingStore(Protocol):
+    """
+    Persistent key-value storage behind a cache.
+    """
+    def load(self, key: str) -> Optional[Any]: ...
+
+    def store_many(self, items: Iterable[tuple[str, Any]]) -> None: ...
+
+    def delete_many(self, keys: Iterable[str]) -> None: ...
+
+
+class SQLiteStore:
+    """
+    BackingStore on a local SQLite table. Values are pickled.
+
+    One connection shared by the caller's threads and the flush worker,
+    serialized by a lock (SQLite allows one writer at a time anyway).
+    """
+    def __init__(self, path: str = ":memory:", table: str = "cache"):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: '{table}'")
+
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def store_many(self, items: Iterable[tuple[str, Any]]) -> None:
+        rows = [(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for key, value in items]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} (key, value) VALUES (?, ?) "
+                f"ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows,
+            )
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        rows = [(key,) for key in keys]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"SQLiteStore(path={self.path!r}, table={self.table!r})"
@@ -0,0 +1,59 @@
+"""
+Per-key cost: a Python loop of get()/put() vs get_many()/put_many().
+
+Simulates request handlers that look up a batch of keys at once. The
+cache holds CAPACITY keys; each batch asks for BATCH random keys from a
+keyspace twice that size (so about half hit), then fills the misses.
+
+Run:
+    python3 bench_bulk.py
+"""
+
+import random
+import time
+
+from lru_cache import LRUCache
+
+CAPACITY = 100_000
+KEYSPACE = 200_000
+ROUNDS = 200
+
+
+def loop_handler(cache: LRUCache, keys: list[int]):
+    found = {}
+    for key in keys:
+        value = cache.get(key)
+        if value is not None:
+            found[key] = value
+    for key in keys:
+        if key not in found:
+            cache.put(key, key)
+
+
+def batch_handler(cache: LRUCache, keys: list[int]):
+    found = cache.get_many(keys)
+    cache.put_many((key, key) for key in keys if key not in found)
+
+
+def run(handler, batch_size: int) -> float:
+    """
+    Return nanoseconds per key for one handler style.
+    """
+    rng = random.Random(batch_size)
+    cache = LRUCache(CAPACITY)
+    cache.put_many((key, key) for key in range(0, KEYSPACE, 2))
+    batches = [[rng.randrange(KEYSPACE) for _ in range(batch_size)] for _ in range(ROUNDS)]
+
+    started = time.perf_counter()
+    for keys in batches:
+        handler(cache, keys)
+    elapsed = time.perf_counter() - started
+    return elapsed / (ROUNDS * batch_size) * 1e9
+
+
+if __name__ == "__main__":
+    print(f"{'batch':>8}{'loop ns/key':>14}{'batch ns/key':>15}{'speedup':>10}")
+    for batch_size in (50, 100, 500):
+        loop_ns = run(loop_handler, batch_size)
+        batch_ns = run(batch_handler, batch_size)
+        print(f"{batch_size:>8}{loop_ns:>14.0f}{batch_ns:>15.0f}{loop_ns / batch_ns:>9.2f}x")
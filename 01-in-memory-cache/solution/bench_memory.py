@@ -0,0 +1,99 @@
+"""
+Memory + GC benchmark: LRUCache (Node objects) vs ArrayLRUCache (slots).
+
+Reports, for each engine:
+    bytes/entry   → traced allocations after filling the cache / entries
+    fill gc pause → total time spent in automatic GC while filling
+    full gc pause → time for one explicit gen-2 collection with the
+                    cache alive (what a long-running server keeps paying)
+
+Keys and values are allocated BEFORE measuring, so only the cache's own
+bookkeeping is counted.
+
+Run:
+    python3 bench_memory.py            # 500_000 entries
+    python3 bench_memory.py 5000000    # production-sized
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from array_lru_cache import ArrayLRUCache
+from lru_cache import LRUCache
+
+
+class GCPauseTimer:
+    """
+    Accumulates time spent inside automatic garbage collections.
+
+    NEW CONCEPT — gc.callbacks:
+        A list of functions the interpreter calls with phase="start" and
+        phase="stop" around every collection.
+    """
+    def __init__(self):
+        self.total = 0.0
+        self.collections = 0
+        self._started = 0.0
+
+    def __call__(self, phase: str, info: dict):
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.total += time.perf_counter() - self._started
+            self.collections += 1
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def measure(cache_cls, keys: list[str], values: list[int]) -> dict[str, float]:
+    """
+    Fill a fresh cache with every key and measure memory and GC cost.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    with GCPauseTimer() as timer:
+        cache = cache_cls(capacity=len(keys))
+        for key, value in zip(keys, values):
+            cache.put(key, value)
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    gc.collect()
+    full_pause = time.perf_counter() - started
+
+    del cache
+    return {
+        "bytes_per_entry": (after - before) / len(keys),
+        "fill_gc_ms": timer.total * 1000,
+        "fill_gc_runs": timer.collections,
+        "full_gc_ms": full_pause * 1000,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    keys = [f"key-{i}" for i in range(n)]
+    values = list(range(n))
+
+    print(f"Filling {n:,} entries\n")
+    print(f"{'engine':<16}{'bytes/entry':>14}{'fill gc ms':>14}{'gc runs':>10}{'full gc ms':>14}")
+    for cache_cls in (LRUCache, ArrayLRUCache):
+        result = measure(cache_cls, keys, values)
+        print(
+            f"{cache_cls.__name__:<16}"
+            f"{result['bytes_per_entry']:>14.1f}"
+            f"{result['fill_gc_ms']:>14.1f}"
+            f"{result['fill_gc_runs']:>10}"
+            f"{result['full_gc_ms']:>14.1f}"
+        )
@@ -0,0 +1,81 @@
+"""
+Miss-ratio + throughput comparison of eviction policies.
+
+Each trace is replayed read-through: get(key), and on a miss put(key).
+Every policy exposes the LRUCache interface, so adding one to POLICIES is
+all it takes to include it in the comparison.
+
+Run:
+    python3 bench_policies.py
+"""
+
+import time
+from typing import Callable, Iterable
+
+from arc_cache import ARCCache
+from clock_cache import ClockCache
+from lfu_cache import LFUCache
+from lru_cache import LRUCache
+from s3fifo_cache import S3FIFOCache
+from slru_cache import SegmentedLRUCache
+from tinylfu_cache import TinyLFUCache
+from traces import scan_trace, zipf_trace
+
+POLICIES: dict[str, Callable] = {
+    "LRU": LRUCache,
+    "CLOCK": ClockCache,
+    "LFU": LFUCache,
+    "W-TinyLFU": TinyLFUCache,
+    "ARC": ARCCache,
+    "SLRU": SegmentedLRUCache,
+    "S3-FIFO": S3FIFOCache,
+}
+
+TRACE_LENGTH = 500_000
+KEYSPACE = 100_000
+CAPACITIES = (1_000, 5_000, 20_000)
+
+TRACES: dict[str, Callable[[], Iterable[int]]] = {
+    "zipf-0.8": lambda: zipf_trace(TRACE_LENGTH, KEYSPACE, alpha=0.8),
+    "zipf-1.0": lambda: zipf_trace(TRACE_LENGTH, KEYSPACE, alpha=1.0),
+    "scan-heavy": lambda: scan_trace(TRACE_LENGTH, KEYSPACE, alpha=1.0, scan_length=20_000),
+}
+
+
+def replay(cache, trace: Iterable[int]) -> tuple[float, float]:
+    """
+    Replay a trace read-through. Returns (miss ratio, ops/sec).
+    """
+    requests = misses = 0
+    started = time.perf_counter()
+    for key in trace:
+        requests += 1
+        if cache.get(key) is None:
+            misses += 1
+            cache.put(key, key)
+    elapsed = time.perf_counter() - started
+    return misses / requests, requests / elapsed
+
+
+if __name__ == "__main__":
+    # (trace, capacity) → {policy: miss ratio}
+    miss_ratios: dict[tuple[str, int], dict[str, float]] = {}
+    for trace_name, make_trace in TRACES.items():
+        # Materialize once so generation time is not part of ops/sec
+        trace = list(make_trace())
+        print(f"\n=== {trace_name} ({len(trace):,} requests) ===")
+        print(f"{'capacity':>10}" + "".join(f"{name:>29}" for name in POLICIES))
+        for capacity in CAPACITIES:
+            row = f"{capacity:>10}"
+            cell = miss_ratios[trace_name, capacity] = {}
+            for name, policy in POLICIES.items():
+                miss_ratio, ops = replay(policy(capacity), trace)
+                cell[name] = miss_ratio
+                row += f"{miss_ratio:>10.2%} {ops / 1e6:>6.2f}M op/s"
+            print(row)
+
+    # What TinyLFU admission buys over plain LRU on the same traces
+    print("\n=== W-TinyLFU vs LRU: hit ratio ===")
+    for (trace_name, capacity), cell in miss_ratios.items():
+        lru, tinylfu = 1 - cell["LRU"], 1 - cell["W-TinyLFU"]
+        print(f"{trace_name:>12} {capacity:>8}: {lru:>7.2%} → {tinylfu:>7.2%} ({(tinylfu - lru) * 100:+.1f} pts)")
@@ -0,0 +1,106 @@
+"""
+Load generator for cache_server.py: throughput and p50/p99 latency.
+
+Starts a CacheServer on a Unix socket in a child process, then runs
+CLIENTS client processes against it. Each client sends REQUESTS commands
+(90% GET / 10% SET over Zipf-distributed keys), either one per round
+trip or PIPELINE commands per round trip, and records the latency of
+every round trip.
+
+Run:
+    python3 bench_server.py [clients] [requests per client]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from cache_client import CacheClient
+from cache_server import CacheServer
+from lru_cache import LRUCache
+from traces import zipf_trace
+
+CAPACITY = 50_000
+KEYSPACE = 100_000
+PIPELINES = (1, 16)
+VALUE = b"x" * 100
+
+
+def run_server(path: str, ready):
+    async def serve():
+        listener = await CacheServer(LRUCache(CAPACITY)).serve_unix(path)
+        ready.set()
+        async with listener:
+            await listener.serve_forever()
+
+    asyncio.run(serve())
+
+
+def run_client(path: str, client_id: int, requests: int, depth: int, results):
+    """
+    One client process: returns (start, end, round-trip latencies in µs).
+    """
+    client = CacheClient(unix_path=path, pool_size=1)
+    keys = [f"key:{key}" for key in zipf_trace(requests, KEYSPACE, seed=client_id)]
+    commands = [("SET", key, VALUE) if i % 10 == 0 else ("GET", key) for i, key in enumerate(keys)]
+    client.ping()
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(0, len(commands), depth):
+        sent = time.perf_counter()
+        if depth == 1:
+            client.execute(*commands[i])
+        else:
+            client.pipeline(commands[i:i + depth])
+        latencies.append((time.perf_counter() - sent) * 1e6)
+    results.put((started, time.perf_counter(), latencies))
+    client.close()
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def bench(path: str, clients: int, requests: int, depth: int) -> tuple[float, float, float]:
+    """
+    Return (ops/sec, p50 µs, p99 µs) for one pipeline depth.
+    """
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=run_client, args=(path, n, requests, depth, results))
+        for n in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    runs = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    elapsed = max(end for _, end, _ in runs) - min(start for start, _, _ in runs)
+    latencies = sorted(latency for _, _, run in runs for latency in run)
+    return clients * requests / elapsed, percentile(latencies, 50), percentile(latencies, 99)
+
+
+if __name__ == "__main__":
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    path = os.path.join(tempfile.mkdtemp(), "cache.sock")
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_server, args=(path, ready), daemon=True)
+    server.start()
+    ready.wait()
+
+    print(f"{clients} clients × {requests:,} requests (90% GET / 10% SET), unix socket")
+    print(f"{'pipeline':>10}{'ops/sec':>12}{'p50 µs':>10}{'p99 µs':>10}   (latency per round trip)")
+    try:
+        for depth in PIPELINES:
+            ops, p50, p99 = bench(path, clients, requests, depth)
+            print(f"{depth:>10}{ops:>12,.0f}{p50:>10.0f}{p99:>10.0f}")
+    finally:
+        server.terminate()
+        os.remove(path)
@@ -0,0 +1,90 @@
+"""
+Throughput benchmark: one globally locked LRUCache vs ShardedLRUCache.
+
+Each thread runs a 90% get / 10% put mix over a shared keyspace for a
+fixed number of operations. Reported ops/sec is the total across threads.
+
+On the regular (GIL) build, threads never run Python code in parallel, so
+the interesting number is how little the locking costs. On the
+free-threaded build (python3.13t) the sharded cache should scale with
+threads, while the global lock flattens out.
+
+Run:
+    python3 bench_sharded.py
+    python3.13t bench_sharded.py
+"""
+
+import random
+import sys
+import threading
+import time
+
+from lru_cache import LRUCache
+from sharded_lru_cache import ShardedLRUCache
+
+CAPACITY = 100_000
+KEYSPACE = 200_000
+OPS_PER_THREAD = 100_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+
+class GlobalLockCache:
+    """
+    Baseline: one LRUCache behind one lock.
+    """
+    def __init__(self, capacity: int):
+        self._cache = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._cache.get(key)
+
+    def put(self, key, value):
+        with self._lock:
+            self._cache.put(key, value)
+
+
+def worker(cache, keys: list[str], barrier: threading.Barrier):
+    """
+    Wait for every thread to be ready, then hammer the cache.
+    """
+    barrier.wait()
+    for i, key in enumerate(keys):
+        if i % 10 == 0:
+            cache.put(key, i)
+        else:
+            cache.get(key)
+
+
+def run(cache, num_threads: int) -> float:
+    """
+    Return total ops/sec for num_threads concurrent workers.
+    """
+    rng = random.Random(num_threads)
+    workloads = [
+        [f"key-{rng.randrange(KEYSPACE)}" for _ in range(OPS_PER_THREAD)]
+        for _ in range(num_threads)
+    ]
+    barrier = threading.Barrier(num_threads + 1)
+    threads = [threading.Thread(target=worker, args=(cache, keys, barrier)) for keys in workloads]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return num_threads * OPS_PER_THREAD / elapsed
+
+
+if __name__ == "__main__":
+    # sys._is_gil_enabled() only exists on 3.13+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}\n")
+    print(f"{'threads':>8}{'global lock ops/s':>20}{'sharded ops/s':>18}{'speedup':>10}")
+    for n in THREAD_COUNTS:
+        global_ops = run(GlobalLockCache(CAPACITY), n)
+        sharded_ops = run(ShardedLRUCache(CAPACITY, num_shards=64), n)
+        print(f"{n:>8}{global_ops:>20,.0f}{sharded_ops:>18,.0f}{sharded_ops / global_ops:>9.2f}x")
@@ -0,0 +1,56 @@
+"""
+Snapshot speed: LRUCache.dump() and LRUCache.load() in entries/sec.
+
+Fills a cache with N entries of a simple value type, dumps it to a temp
+file, then loads it into a fresh cache and checks recency survived.
+
+Run:
+    python3 bench_snapshot.py [entries]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from lru_cache import LRUCache
+
+VALUE_TYPES = {
+    "int → int": lambda i: (i, i),
+    "str → str": lambda i: (f"user:{i}", f"value-{i}"),
+    "str → bytes": lambda i: (f"user:{i}", b"x" * 32),
+}
+
+
+def run(n: int, make_entry) -> tuple[float, float, int]:
+    """
+    Return (dump entries/sec, load entries/sec, file bytes).
+    """
+    cache = LRUCache(n)
+    cache.put_many(make_entry(i) for i in range(n))
+
+    fd, path = tempfile.mkstemp(suffix=".snap")
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        cache.dump(path)
+        dump_seconds = time.perf_counter() - started
+
+        restored = LRUCache(n)
+        started = time.perf_counter()
+        restored.load(path)
+        load_seconds = time.perf_counter() - started
+
+        assert restored.peek_lru() == cache.peek_lru()
+        return n / dump_seconds, n / load_seconds, os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n:,} entries")
+    print(f"{'values':<14}{'dump/s':>14}{'load/s':>14}{'bytes/entry':>14}")
+    for name, make_entry in VALUE_TYPES.items():
+        dump_rate, load_rate, size = run(n, make_entry)
+        print(f"{name:<14}{dump_rate:>14,.0f}{load_rate:>14,.0f}{size / n:>14.1f}")
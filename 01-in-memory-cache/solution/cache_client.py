@@ -0,0 +1,201 @@
+"""
+Cache Client — blocking client for cache_server.py with a connection pool.
+
+    client = CacheClient(port=6380)          # or CacheClient(unix_path="/tmp/cache.sock")
+    client.set("user:1", b"...", ttl=60)
+    client.get("user:1")                     → b"..."
+    client.pipeline([("GET", "a"), ("GET", "b"), ("SET", "c", "1")])
+                                             → [b"A", None, "OK"]
+
+CONNECTION POOL:
+    Opening a TCP connection costs a round trip (plus a process-wide
+    ephemeral port). The client keeps up to pool_size open connections;
+    each call borrows one, uses it, and returns it:
+
+        thread 1 ──┐            ┌── conn 1 ──┐
+        thread 2 ──┼─ borrow ──►├── conn 2 ──┼──► server
+        thread 3 ──┘  (waits if └── conn 3 ──┘
+                       all busy)
+
+    A connection that hits a socket error is closed, never returned.
+
+PIPELINING:
+    pipeline(commands) writes every command in one sendall() and then
+    reads all the replies — one round trip for the whole batch. Error
+    replies come back as ResponseError objects in the result list.
+
+NEW CONCEPT — queue.LifoQueue as a pool:
+    get() blocks until an item is available, put() returns one. LIFO
+    hands out the most recently used connection first, so idle extras
+    stay idle instead of all going stale together.
+"""
+
+import queue
+import socket
+import threading
+from typing import Any, Iterable, Mapping, Optional
+
+from resp import ResponseError, encode_command, parse_reply
+
+_RECV_SIZE = 1 << 16
+
+
+class _Connection:
+    """
+    One socket plus its receive buffer.
+    """
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._buf = bytearray()
+
+    def request(self, payload: bytes, count: int) -> list[Any]:
+        """
+        Send payload (count encoded commands), return count replies.
+        """
+        self.sock.sendall(payload)
+        replies = []
+        pos = 0
+        while len(replies) < count:
+            parsed = parse_reply(self._buf, pos)
+            if parsed is None:
+                del self._buf[:pos]
+                pos = 0
+                data = self.sock.recv(_RECV_SIZE)
+                if not data:
+                    raise ConnectionError("Server closed the connection")
+                self._buf += data
+                continue
+            reply, pos = parsed
+            replies.append(reply)
+        del self._buf[:pos]
+        return replies
+
+    def close(self):
+        self.sock.close()
+
+
+class CacheClient:
+    """
+    Thread-safe client for CacheServer, pooling up to pool_size connections.
+    """
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6380,
+        unix_path: Optional[str] = None,
+        pool_size: int = 8,
+        timeout: Optional[float] = 5.0,
+    ):
+        if pool_size <= 0:
+            raise ValueError("Pool size must be positive")
+
+        self.address = unix_path or (host, port)
+        self.timeout = timeout
+        self._pool: queue.LifoQueue[Optional[_Connection]] = queue.LifoQueue()
+        # None = a slot we may open a connection for, lazily
+        for _ in range(pool_size):
+            self._pool.put(None)
+        self._lock = threading.Lock()
+        self._open: set[_Connection] = set()
+
+    # ─── Commands ──────────────────────────────────────────────
+
+    def get(self, key: str | bytes) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str | bytes, value: str | bytes, ttl: Optional[float] = None) -> bool:
+        if ttl is None:
+            return self.execute("SET", key, value) == "OK"
+        return self.execute("SET", key, value, "PX", int(ttl * 1000)) == "OK"
+
+    def delete(self, *keys: str | bytes) -> int:
+        return self.execute("DEL", *keys)
+
+    def mget(self, keys: Iterable[str | bytes]) -> list[Optional[bytes]]:
+        return self.execute("MGET", *keys)
+
+    def mset(self, items: Mapping[str | bytes, str | bytes]) -> bool:
+        args = [part for pair in items.items() for part in pair]
+        return self.execute("MSET", *args) == "OK"
+
+    def expire(self, key: str | bytes, seconds: int) -> bool:
+        return self.execute("EXPIRE", key, seconds) == 1
+
+    def info(self) -> dict[str, str]:
+        text = self.execute("INFO").decode()
+        return dict(line.split(":", 1) for line in text.splitlines() if line)
+
+    def ping(self) -> bool:
+        return self.execute("PING") == "PONG"
+
+    def execute(self, *args: Any) -> Any:
+        """
+        Send one command. Raises ResponseError on an error reply.
+        """
+        reply = self._request(encode_command(*args), 1)[0]
+        if isinstance(reply, ResponseError):
+            raise reply
+        return reply
+
+    def pipeline(self, commands: Iterable[tuple]) -> list[Any]:
+        """
+        Send many commands in one round trip. Error replies are returned
+        in place as ResponseError objects, not raised.
+        """
+        payloads = [encode_command(*command) for command in commands]
+        if not payloads:
+            return []
+        return self._request(b"".join(payloads), len(payloads))
+
+    # ─── Pool ──────────────────────────────────────────────────
+
+    def _request(self, payload: bytes, count: int) -> list[Any]:
+        conn = self._pool.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            replies = conn.request(payload, count)
+        except BaseException:
+            # Socket state is unknown (half-read replies) — drop it
+            if conn is not None:
+                self._discard(conn)
+            self._pool.put(None)
+            raise
+        self._pool.put(conn)
+        return replies
+
+    def _connect(self) -> _Connection:
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.address)
+        if family == socket.AF_INET:
+            # Small request/reply messages — don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = _Connection(sock)
+        with self._lock:
+            self._open.add(conn)
+        return conn
+
+    def _discard(self, conn: _Connection):
+        with self._lock:
+            self._open.discard(conn)
+        conn.close()
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        with self._lock:
+            conns, self._open = self._open, set()
+        for conn in conns:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"CacheClient(address={self.address!r}, open={len(self._open)})"
@@ -0,0 +1,221 @@
+"""
+Cache Server — one LRUCache shared by many processes over a socket.
+
+A single asyncio process owns the LRUCache and speaks a subset of the
+Redis protocol (see resp.py), over TCP or a Unix socket:
+
+    GET key                   → bulk value or null
+    SET key value [EX s|PX ms]→ +OK
+    DEL key [key ...]         → :number deleted
+    MGET key [key ...]        → array of values / nulls
+    MSET key value [...]      → +OK
+    EXPIRE key seconds        → :1 if set, :0 if no such key
+    INFO                      → "field:value" lines from cache.stats()
+    PING                      → +PONG
+
+Keys and values are stored as the raw bytes received — no decoding on
+the hot path.
+
+WHY NO LOCKS:
+    Every connection is a coroutine on ONE event loop thread, and a
+    command never awaits in the middle of touching the cache. Commands
+    from different clients interleave, but never overlap.
+
+PIPELINING:
+    Each read() pulls whatever the client has sent so far; the server
+    parses and executes EVERY complete command in it, then answers all of
+    them with ONE write():
+
+        client:  GET a | GET b | SET c 1 | GET d    (one write)
+        server:  $1 A  | $-1   | +OK     | $1 D    (one write)
+
+    One round trip and one syscall per batch instead of per command.
+
+Run:
+    python3 cache_server.py --port 6380 --capacity 100000
+    python3 cache_server.py --unix /tmp/cache.sock
+    redis-cli -p 6380 SET greeting hello    # any Redis client works
+
+NEW CONCEPT — asyncio.start_server:
+    Calls handler(reader, writer) in a new coroutine for every accepted
+    connection. reader.read() suspends the coroutine until bytes arrive,
+    letting the loop serve other connections meanwhile.
+"""
+
+import argparse
+import asyncio
+from typing import Callable, Optional
+
+from lru_cache import LRUCache
+from resp import (
+    OK, PONG, ProtocolError, encode_array, encode_bulk, encode_error, encode_integer, parse_command,
+)
+
+_READ_SIZE = 1 << 16
+
+
+class CacheServer:
+    """
+    Serves one LRUCache over RESP.
+    """
+    def __init__(self, cache: LRUCache):
+        self.cache = cache
+        self._commands: dict[bytes, Callable[[list[bytes]], bytes]] = {
+            b"GET": self._get,
+            b"SET": self._set,
+            b"DEL": self._del,
+            b"MGET": self._mget,
+            b"MSET": self._mset,
+            b"EXPIRE": self._expire,
+            b"INFO": self._info,
+            b"PING": self._ping,
+        }
+
+        # stats
+        self._connections = 0
+        self._commands_processed = 0
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 6380) -> asyncio.Server:
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def serve_unix(self, path: str) -> asyncio.Server:
+        return await asyncio.start_unix_server(self.handle, path)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        One connection: read, execute every complete command, reply once.
+        """
+        self._connections += 1
+        buf = bytearray()
+        try:
+            while True:
+                data = await reader.read(_READ_SIZE)
+                if not data:
+                    break
+                buf += data
+
+                replies = []
+                pos = 0
+                while True:
+                    parsed = parse_command(buf, pos)
+                    if parsed is None:
+                        break
+                    args, pos = parsed
+                    if args:
+                        replies.append(self.execute(args))
+                del buf[:pos]  # Keep only the incomplete tail
+
+                if replies:
+                    writer.write(b"".join(replies))
+                    await writer.drain()
+        except ProtocolError as exc:
+            writer.write(encode_error(f"Protocol error: {exc}"))
+        except ConnectionError:
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+
+    def execute(self, args: list[bytes]) -> bytes:
+        """
+        Run one command, return its encoded reply.
+        """
+        self._commands_processed += 1
+        handler = self._commands.get(args[0].upper())
+        if handler is None:
+            return encode_error(f"unknown command '{args[0].decode(errors='replace')}'")
+        try:
+            return handler(args)
+        except (ValueError, IndexError):
+            return encode_error(f"invalid arguments for '{args[0].decode().lower()}' command")
+
+    # ─── Commands ──────────────────────────────────────────────
+
+    def _get(self, args: list[bytes]) -> bytes:
+        if len(args) != 2:
+            return _arity_error(args)
+        return encode_bulk(self.cache.get(args[1]))
+
+    def _set(self, args: list[bytes]) -> bytes:
+        if len(args) not in (3, 5):
+            return _arity_error(args)
+        ttl: Optional[float] = None
+        if len(args) == 5:
+            unit = args[3].upper()
+            if unit == b"EX":
+                ttl = int(args[4])
+            elif unit == b"PX":
+                ttl = int(args[4]) / 1000
+            else:
+                return encode_error("syntax error")
+            if ttl <= 0:
+                return encode_error("invalid expire time in 'set' command")
+        self.cache.put(args[1], args[2], ttl=ttl)
+        return OK
+
+    def _del(self, args: list[bytes]) -> bytes:
+        if len(args) < 2:
+            return _arity_error(args)
+        return encode_integer(self.cache.delete_many(args[1:]))
+
+    def _mget(self, args: list[bytes]) -> bytes:
+        if len(args) < 2:
+            return _arity_error(args)
+        found = self.cache.get_many(args[1:])
+        return encode_array([found.get(key) for key in args[1:]])
+
+    def _mset(self, args: list[bytes]) -> bytes:
+        if len(args) < 3 or len(args) % 2 == 0:
+            return _arity_error(args)
+        self.cache.put_many(zip(args[1::2], args[2::2]))
+        return OK
+
+    def _expire(self, args: list[bytes]) -> bytes:
+        if len(args) != 3:
+            return _arity_error(args)
+        seconds = int(args[2])
+        # Redis semantics: a non-positive TTL deletes the key
+        if seconds <= 0:
+            return encode_integer(int(self.cache.delete(args[1])))
+        return encode_integer(int(self.cache.expire(args[1], seconds)))
+
+    def _info(self, args: list[bytes]) -> bytes:
+        info = {
+            **self.cache.stats(),
+            "connected_clients": self._connections,
+            "total_commands_processed": self._commands_processed,
+        }
+        return encode_bulk("".join(f"{key}:{value}\r\n" for key, value in info.items()).encode())
+
+    def _ping(self, args: list[bytes]) -> bytes:
+        return PONG
+
+
+def _arity_error(args: list[bytes]) -> bytes:
+    return encode_error(f"wrong number of arguments for '{args[0].decode().lower()}' command")
+
+
+async def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Serve an LRUCache over the Redis protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6380)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--capacity", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    server = CacheServer(LRUCache(args.capacity))
+    if args.unix:
+        listener = await server.serve_unix(args.unix)
+        print(f"Serving LRUCache(capacity={args.capacity}) on unix:{args.unix}")
+    else:
+        listener = await server.serve_tcp(args.host, args.port)
+        print(f"Serving LRUCache(capacity={args.capacity}) on {args.host}:{args.port}")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,144 @@
+"""
+CLOCK Cache (second chance) — approximate LRU with a mutation-free hit path.
+
+In LRUCache every hit calls move_to_head: four pointer writes plus a list
+reorder. In read-heavy workloads that is most of the work.
+
+CLOCK keeps entries in a circular buffer with one reference bit each:
+
+              hand
+               ↓
+    [a|1] [b|0] [c|1] [d|0] [e|1]     ← (key | ref bit)
+      ↑                         │
+      └──────── wraps ──────────┘
+
+    get(key):  ref[slot] = 1          ← the ONLY write on a hit
+    evict:     sweep the hand forward —
+                 ref == 1 → clear it, move on (second chance)
+                 ref == 0 → victim
+
+A hit never changes the structure (no links, no reorder), so concurrent
+readers need no structural lock: setting a byte that was already 1 is
+harmless. Recently used entries survive one sweep, which makes CLOCK a
+close approximation of LRU.
+
+New entries start with ref = 0: an entry inserted by a one-off lookup is
+the first thing the hand evicts unless it is read again.
+
+NEW CONCEPT — bytearray:
+    A mutable array of raw bytes. One byte per reference bit, no Python
+    objects per entry.
+"""
+
+from typing import Any, Optional
+
+
+class ClockCache:
+    """
+    CLOCK (second-chance) cache with the LRUCache interface.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self._map: dict[str, int] = {}
+        self._keys: list[Any] = [None] * capacity
+        self._values: list[Any] = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._hand = 0
+
+        # Slots never used or freed by delete(); popped from the end
+        self._free: list[int] = list(range(capacity - 1, -1, -1))
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache. A hit only sets the reference bit.
+        """
+        slot = self._map.get(key)
+        if slot is None:
+            self._misses += 1
+            return None
+        self._ref[slot] = 1
+        self._hits += 1
+        return self._values[slot]
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        # Case 1: Key already exists — update value, count as a reference
+        slot = self._map.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            self._ref[slot] = 1
+            return
+
+        # Case 2: Free slot available, otherwise Case 3: sweep for a victim
+        slot = self._free.pop() if self._free else self._evict()
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._ref[slot] = 0
+        self._map[key] = slot
+
+    def _evict(self) -> int:
+        """
+        Advance the hand until it finds a slot with ref == 0.
+
+        Terminates within one full revolution: every bit it passes over is
+        cleared, so at worst it comes back to where it started.
+        """
+        ref = self._ref
+        hand = self._hand
+        while ref[hand]:
+            ref[hand] = 0
+            hand = (hand + 1) % self.capacity
+        self._hand = (hand + 1) % self.capacity
+
+        del self._map[self._keys[hand]]
+        self._evictions += 1
+        return hand
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        slot = self._map.pop(key, None)
+        if slot is None:
+            return False
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._ref[slot] = 0
+        self._free.append(slot)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the stats of the cache.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self._map),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._map
+
+    def __repr__(self) -> str:
+        items = " ".join(
+            f"[{self._keys[slot]}|{self._ref[slot]}]" for slot in sorted(self._map.values())
+        )
+        return f"ClockCache(capacity={self.capacity}, size={len(self._map)}, hand={self._hand}, items={items})"
@@ -0,0 +1,119 @@
+"""
+Count-Min Sketch — approximate access frequencies in fixed memory.
+
+Counting every key exactly needs a dict entry per key ever seen. A
+sketch trades exactness for a fixed-size table:
+
+    depth rows × width counters (one byte each)
+    width = width_factor × capacity, rounded up to a power of two
+
+          col: 0  1  2  3  4  5  6  7
+    row 0:   [0][3][0][1][0][0][2][0]   ← hash_0(key) picks a column
+    row 1:   [1][0][0][0][4][0][0][1]   ← hash_1(key) picks another
+    ...
+
+    increment(key): +1 in the key's column of every row
+    estimate(key):  min over rows → collisions only ever inflate a count,
+                    so the smallest one is the closest to the truth
+
+    With one counter per entry per row, ~15% of a full cache's keys are
+    overcounted (they collide in every row); width_factor=4 brings that
+    under 1% for depth × 4 bytes per entry.
+
+AGING:
+    Counters saturate at 15 (only relative popularity matters). After
+    sample_size increments, every counter is halved, so keys that were
+    hot an hour ago fade and new hot keys can overtake them.
+
+NEW CONCEPT — bytearray.translate:
+    Maps every byte through a 256-entry table in C. With table[i] = i >> 1
+    it halves all counters in one call instead of a Python loop.
+"""
+
+from typing import Hashable
+
+MAX_COUNT = 15
+_MASK64 = (1 << 64) - 1
+_HALVE = bytes(i >> 1 for i in range(256))
+
+# Odd 64-bit constants, one per row, to derive independent hashes
+_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD,
+    0xC4CEB9FE1A85EC53,
+)
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch with saturating byte counters and periodic halving.
+    """
+    def __init__(self, capacity: int, depth: int = 4, width_factor: int = 4, sample_factor: int = 10):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 1 <= depth <= len(_SEEDS):
+            raise ValueError(f"Depth must be between 1 and {len(_SEEDS)}")
+
+        if width_factor <= 0:
+            raise ValueError("Width factor must be positive")
+
+        # Width: next power of two >= width_factor * capacity, so a column
+        # is a bit shift. Several counters per entry keep collisions rare.
+        self._bits = max(1, (capacity * width_factor - 1).bit_length())
+        self.width = 1 << self._bits
+        self.depth = depth
+        self._table = bytearray(self.width * depth)
+        self._rows = tuple((row * self.width, seed >> 1, seed) for row, seed in enumerate(_SEEDS[:depth]))
+
+        self.sample_size = sample_factor * capacity
+        self._additions = 0
+        self.resets = 0
+
+    def _indexes(self, key: Hashable) -> list[int]:
+        """
+        One table index per row for this key.
+        """
+        h = hash(key) & _MASK64
+        shift = 64 - self._bits
+        return [offset + ((((h ^ salt) * seed) & _MASK64) >> shift) for offset, salt, seed in self._rows]
+
+    def increment(self, key: Hashable):
+        """
+        Record one access to key.
+        """
+        table = self._table
+        for i in self._indexes(key):
+            if table[i] < MAX_COUNT:
+                table[i] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key: Hashable) -> int:
+        """
+        Estimated access count of key (never an undercount before aging).
+        """
+        table = self._table
+        return min(table[i] for i in self._indexes(key))
+
+    def reset(self):
+        """
+        Halve every counter — the aging step.
+        """
+        self._table = self._table.translate(_HALVE)
+        self._additions //= 2
+        self.resets += 1
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Size of the counter table.
+        """
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, bytes={self.memory_bytes})"
@@ -0,0 +1,307 @@
+"""
+Disk Tier — an append-only, memory-mapped key-value log.
+
+The second level of TieredCache: entries that no longer fit in RAM.
+
+    put(k, v) ──► append record at the end of the file
+    get(k)    ──► index[k] = (offset, size) ──► decode straight out of the mmap
+
+                  index (RAM)              file (mmap)
+                  ┌──────────┐            ┌──────┬──────┬──────┬──────┬─────┐
+                  │ a → 0    │──────────► │ a=1  │ b=2  │ a=3  │ c=4  │ ... │
+                  │ b → 14   │            │ dead │ live │ live │ live │free │
+                  │ c → 42   │            └──────┴──────┴──────┴──────┴─────┘
+                  └──────────┘                            ↑ a was rewritten:
+                                                            old record is garbage
+Records are never modified in place: an overwrite or delete only moves
+or drops the index entry and leaves the old bytes behind as GARBAGE.
+Records use the snapshot.py layout ("<BBII" header, key, value).
+
+COMPACTION (background thread):
+    Once garbage > compact_ratio of the used file (and at least
+    compact_min_bytes), live records are copied into a fresh file:
+
+    1. Under the lock: copy the index, remember where the file ends
+    2. No lock: copy those records out of a private read-only mapping
+       (writers only append past the cutoff, so these bytes never change)
+    3. Under the lock: append whatever was written past the cutoff, keep
+       the entries whose index slot did not change meanwhile, swap files
+
+    Reads and writes keep flowing during step 2 — the long part.
+
+BOUND:
+    max_bytes caps the LIVE bytes; the oldest demoted entries (dict
+    insertion order) are dropped first. Without it the tier grows with
+    the data.
+
+The file is scratch space: it is recreated empty on open.
+
+NEW CONCEPT — mmap:
+    Maps a file into memory: mm[a:b] reads bytes straight from the OS page
+    cache, with no read() calls and no extra copies for hot pages.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Optional
+
+from snapshot import decode_value, encode_value
+
+_HEADER = struct.Struct("<BBII")  # key tag, value tag, key length, value length
+
+_INITIAL_SIZE = 1 << 20
+
+
+class DiskTier:
+    """
+    Append-only key-value log in a memory-mapped file, with an in-memory index.
+    """
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1 << 20,
+    ):
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("Max bytes must be positive")
+        if not 0 < compact_ratio < 1:
+            raise ValueError("Compact ratio must be in (0, 1)")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()  # one compaction at a time
+        self._index: dict[Any, tuple[int, int]] = {}  # key → (offset, size)
+        self._file = open(path, "w+b")
+        self._file.truncate(_INITIAL_SIZE)
+        self._mm = mmap.mmap(self._file.fileno(), _INITIAL_SIZE)
+        self._end = 0          # first free byte
+        self._live_bytes = 0   # sum of sizes in the index
+        self._compactor: Optional[threading.Thread] = None
+        self._closed = False
+
+        # stats
+        self._compactions = 0
+        self._evictions = 0
+
+    # ─── Public API ────────────────────────────────────────────
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            return self._read(*location)
+
+    def pop(self, key: Any) -> Optional[Any]:
+        """
+        Remove key and return its value (None if absent).
+        """
+        with self._lock:
+            location = self._index.pop(key, None)
+            if location is None:
+                return None
+            value = self._read(*location)
+            self._live_bytes -= location[1]
+        self._maybe_compact()
+        return value
+
+    def put(self, key: Any, value: Any):
+        key_tag, key_bytes = encode_value(key)
+        value_tag, value_bytes = encode_value(value)
+        record = _HEADER.pack(key_tag, value_tag, len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+        size = len(record)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is not None:
+                self._live_bytes -= old[1]
+            if self.max_bytes is not None:
+                while self._live_bytes + size > self.max_bytes:
+                    # Oldest demoted entry first — dicts keep insertion order
+                    oldest = next(iter(self._index))
+                    self._live_bytes -= self._index.pop(oldest)[1]
+                    self._evictions += 1
+
+            offset = self._append(record)
+            self._index[key] = (offset, size)
+            self._live_bytes += size
+        self._maybe_compact()
+
+    def delete(self, key: Any) -> bool:
+        with self._lock:
+            location = self._index.pop(key, None)
+            if location is None:
+                return False
+            self._live_bytes -= location[1]
+        self._maybe_compact()
+        return True
+
+    # ─── File internals (caller holds the lock) ────────────────
+
+    def _read(self, offset: int, size: int) -> Any:
+        mm = self._mm
+        key_tag, value_tag, key_len, value_len = _HEADER.unpack_from(mm, offset)
+        start = offset + _HEADER.size + key_len
+        return decode_value(value_tag, mm[start:start + value_len])
+
+    def _append(self, record: bytes) -> int:
+        """
+        Write record at the end of the file, growing the mapping if needed.
+        """
+        offset = self._end
+        end = offset + len(record)
+        if end > len(self._mm):
+            self._grow(end)
+        self._mm[offset:end] = record
+        self._end = end
+        return offset
+
+    def _grow(self, needed: int):
+        size = len(self._mm)
+        while size < needed:
+            size *= 2
+        self._mm.close()
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+
+    # ─── Compaction ────────────────────────────────────────────
+
+    @property
+    def garbage_bytes(self) -> int:
+        return self._end - self._live_bytes
+
+    def _maybe_compact(self):
+        """
+        Start a background compaction if there is enough garbage.
+        """
+        garbage = self.garbage_bytes
+        if garbage < self.compact_min_bytes or garbage <= self.compact_ratio * self._end:
+            return
+        with self._lock:
+            if self._compactor is not None or self._closed:
+                return
+            self._compactor = threading.Thread(target=self.compact, name="disk-tier-compact", daemon=True)
+            self._compactor.start()
+
+    def compact(self):
+        """
+        Rewrite the file with live records only. Safe to run while the
+        tier is in use; normally started automatically.
+        """
+        with self._compact_lock:
+            self._compact()
+        with self._lock:
+            if self._compactor is threading.current_thread():
+                self._compactor = None
+
+    def _compact(self):
+        """
+        Steps 1–3 from the module docstring. Caller holds _compact_lock.
+        """
+        # 1. Freeze what to copy
+        with self._lock:
+            if self._closed:
+                return
+            live = list(self._index.items())
+            cutoff = self._end
+
+        # 2. Copy live records without holding the lock
+        tmp_path = f"{self.path}.compact"
+        new_index: dict[Any, tuple[int, int]] = {}
+        with open(tmp_path, "w+b") as out:
+            if cutoff:
+                with open(self.path, "rb") as src, mmap.mmap(src.fileno(), cutoff, access=mmap.ACCESS_READ) as old:
+                    position = 0
+                    for key, (offset, size) in live:
+                        out.write(old[offset:offset + size])
+                        new_index[key] = (position, size)
+                        position += size
+
+            # 3. Catch up with writes made meanwhile, then swap
+            with self._lock:
+                if self._closed:
+                    out.close()
+                    os.remove(tmp_path)
+                    return
+                tail_start = out.tell()
+                out.write(self._mm[cutoff:self._end])
+                shift = tail_start - cutoff
+
+                index = {}
+                for key, location in self._index.items():
+                    offset, size = location
+                    if offset >= cutoff:
+                        index[key] = (offset + shift, size)
+                    else:
+                        # Unchanged since step 1 → it was copied
+                        index[key] = new_index[key]
+                end = out.tell()
+                size = max(_INITIAL_SIZE, end * 2)
+                out.truncate(size)
+                out.flush()
+
+                self._mm.close()
+                self._file.close()
+                os.replace(tmp_path, self.path)
+                self._file = open(self.path, "r+b")
+                self._mm = mmap.mmap(self._file.fileno(), size)
+                self._index = index
+                self._end = end
+                self._compactions += 1
+
+    def wait_for_compaction(self):
+        """
+        Block until a running background compaction finishes.
+        """
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    # ─── Lifecycle / stats ─────────────────────────────────────
+
+    def close(self):
+        """
+        Stop compaction, unmap and delete the file.
+        """
+        # Mark closed first: no compaction starts after this, and one
+        # already running gives up at its next _closed check
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.wait_for_compaction()
+        # compact() may also run on a caller's thread, so wait on the lock
+        with self._compact_lock, self._lock:
+            self._mm.close()
+            self._file.close()
+        os.remove(self.path)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "live_bytes": self._live_bytes,
+                "garbage_bytes": self.garbage_bytes,
+                "file_bytes": len(self._mm),
+                "compactions": self._compactions,
+                "evictions": self._evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"DiskTier(path={self.path!r}, entries={len(self)}, used={self._end})"
@@ -10,8 +10,10 @@ class DoublyLinkedList:
 
     Supports O(1):
     - add_to_head(node)   → Mark as most recently used
+    - insert_after(a, n)  → Splice a node in right after an anchor node
     - remove(node)        → Detach a node from anywhere in the list
     - remove_tail()       → Evict least recently used, returns the removed node
+    - remove_tail_many(n) → Evict the n least recently used in one splice
     - move_to_head(node)  → Shortcut: remove + add_to_head
 
     Visual:
@@ -30,10 +32,16 @@ class DoublyLinkedList:
         """
         Add a node to the head of the list.
         """
-        node.prev = self.head
-        node.next = self.head.next
-        self.head.next.prev = node
-        self.head.next = node
+        self.insert_after(self.head, node)
+
+    def insert_after(self, anchor: Node, node: Node):
+        """
+        Insert a node right after anchor (anchor may be the head sentinel).
+        """
+        node.prev = anchor
+        node.next = anchor.next
+        anchor.next.prev = node
+        anchor.next = node
         
         self.size += 1
         
@@ -55,12 +63,37 @@ class DoublyLinkedList:
         self.remove(node)
         return node
     
+    def remove_tail_many(self, count: int) -> list[Node]:
+        """
+        Remove up to count nodes from the tail in one splice.
+        Returns them least recent first.
+        """
+        removed = []
+        node = self.tail.prev
+        while len(removed) < count and node is not self.head:
+            removed.append(node)
+            node = node.prev
+        # node is now the new last element — link it straight to TAIL
+        node.next = self.tail
+        self.tail.prev = node
+        self.size -= len(removed)
+        return removed
+    
     def move_to_head(self, node: Node):
         """
         Move a node to the head of the list.
+
+        Same as remove + add_to_head, inlined: this runs on every cache hit.
         """
-        self.remove(node)
-        self.add_to_head(node)
+        head = self.head
+        if head.next is node:
+            return
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = head
+        node.next = head.next
+        head.next.prev = node
+        head.next = node
         
     def is_empty(self) -> bool:
         """
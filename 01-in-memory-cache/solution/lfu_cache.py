@@ -0,0 +1,160 @@
+"""
+LFU Cache — evict the Least Frequently Used key, all operations O(1).
+
+A heap keyed by frequency would make every hit O(log n). Instead, keep
+a list of frequency buckets, each holding its own LRU-ordered list:
+
+    buckets (ascending freq):
+        HEAD ↔ [freq 1] ↔ [freq 2] ↔ [freq 5] ↔ TAIL
+                  │          │          │
+                 [c]        [a]        [b]  ↔ [d]
+                            (each bucket: most recent ↔ least recent)
+
+    get(key) / update:
+        Move the node from bucket f to bucket f+1. Bucket f+1 is either
+        right next to bucket f or gets created there → O(1).
+        An emptied bucket is unlinked → O(1).
+
+    evict:
+        The minimum frequency is always the first bucket after HEAD.
+        Within it, evict the tail — LRU breaks frequency ties → O(1)
+
+Both levels reuse the same building blocks as LRUCache: the outer list
+is a DoublyLinkedList of bucket Nodes (key=freq, value=inner list), the
+inner lists are DoublyLinkedLists of FreqNodes.
+"""
+
+from typing import Any, Optional
+
+from doubly_linked_list import DoublyLinkedList
+from models import FreqNode, Node
+
+
+class LFUCache:
+    """
+    LFU Cache with LRU tie-breaking.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self._map: dict[str, FreqNode] = {}
+        self._buckets = DoublyLinkedList()
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _bump(self, node: FreqNode):
+        """
+        Move a node from its bucket to the next-frequency bucket.
+        """
+        bucket = node.bucket
+        node.freq += 1
+
+        # Find or create the bucket for freq + 1, right after the current one
+        target = bucket.next
+        if target is self._buckets.tail or target.key != node.freq:
+            target = Node(key=node.freq, value=DoublyLinkedList())
+            self._buckets.insert_after(bucket, target)
+
+        self._detach(node)
+        target.value.add_to_head(node)
+        node.bucket = target
+
+    def _detach(self, node: FreqNode):
+        """
+        Remove a node from its bucket, dropping the bucket if it empties.
+        """
+        bucket = node.bucket
+        bucket.value.remove(node)
+        if bucket.value.is_empty():
+            self._buckets.remove(bucket)
+        node.bucket = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+        """
+        node = self._map.get(key)
+        if node is None:
+            self._misses += 1
+            return None
+        self._bump(node)
+        self._hits += 1
+        return node.value
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        # Case 1: Key already exists — update value, counts as an access
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            self._bump(node)
+            return
+
+        # Case 2: At capacity — evict LRU entry of the lowest-frequency bucket
+        if len(self._map) >= self.capacity:
+            victim = self._buckets.head.next.value.tail.prev
+            self._detach(victim)
+            del self._map[victim.key]
+            self._evictions += 1
+
+        # Case 3: New key — joins the freq-1 bucket (always the first one)
+        first = self._buckets.head.next
+        if first is self._buckets.tail or first.key != 1:
+            first = Node(key=1, value=DoublyLinkedList())
+            self._buckets.add_to_head(first)
+        node = FreqNode(key, value, freq=1, bucket=first)
+        first.value.add_to_head(node)
+        self._map[key] = node
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        node = self._map.pop(key, None)
+        if node is None:
+            return False
+        self._detach(node)
+        return True
+
+    def frequency(self, key: str) -> Optional[int]:
+        """
+        Access count of a key (without counting this call), None if absent.
+        """
+        node = self._map.get(key)
+        return node.freq if node is not None else None
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the stats of the cache.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self._map),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "min_frequency": self._buckets.head.next.key if self._map else 0,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._map
+
+    def __repr__(self) -> str:
+        buckets = []
+        bucket = self._buckets.head.next
+        while bucket is not self._buckets.tail:
+            buckets.append(f"freq={bucket.key}: {bucket.value}")
+            bucket = bucket.next
+        return f"LFUCache(capacity={self.capacity}, size={len(self._map)}, buckets=[{'; '.join(buckets)}])"
@@ -0,0 +1,212 @@
+"""
+Loading Cache with refresh-ahead — popular entries never stall on reload.
+
+With plain TTL expiry, a popular entry disappears at its deadline and
+every caller that arrives before the reload finishes waits for it.
+
+refresh_after fixes that by reloading BEFORE the value is gone:
+
+    age <  refresh_after                 → return value (fresh)
+    age >= refresh_after                 → return CURRENT value immediately,
+                                           schedule a background reload
+    missing (or past expire_after)       → load synchronously (first load)
+
+    get("k") ──stale──► return old value ─┐
+                                          └──► ThreadPoolExecutor: loader("k")
+                                                   └──► put new value
+
+Refreshes are deduplicated per key — 1,000 gets on a stale key schedule
+exactly one reload — and the pool is bounded (max_workers threads, at
+most max_pending queued refreshes; extra refresh requests are skipped and
+retried on a later get).
+
+If a refresh fails, the old value stays until it expires; the failure
+is counted in stats().
+
+A finished refresh only replaces the exact entry it was scheduled for,
+and only while that entry is still live: if the key was deleted, evicted
+or expired, or a put()/synchronous load stored a newer value meanwhile,
+the refreshed value is discarded.
+
+NEW CONCEPT — concurrent.futures.ThreadPoolExecutor:
+    A fixed pool of worker threads. submit(fn, *args) queues a call and
+    returns a Future immediately; one of the workers runs it later.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from lru_cache import LRUCache
+
+# A loader receives a key and returns its value
+Loader = Callable[[str], Any]
+
+
+@dataclass(slots=True)
+class _Loaded:
+    """
+    A cached value and when it was loaded.
+    """
+    value: Any
+    loaded_at: float
+
+
+class LoadingCache:
+    """
+    LRUCache that loads missing keys and refreshes stale ones in the background.
+    """
+    def __init__(
+        self,
+        loader: Loader,
+        capacity: int,
+        refresh_after: float,
+        expire_after: Optional[float] = None,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if refresh_after <= 0:
+            raise ValueError("refresh_after must be positive")
+        if expire_after is not None and expire_after <= refresh_after:
+            raise ValueError("expire_after must be greater than refresh_after")
+
+        self._loader = loader
+        self.refresh_after = refresh_after
+        self._clock = clock
+        self._cache = LRUCache(capacity, default_ttl=expire_after, clock=clock)
+        self._lock = threading.Lock()
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-refresh")
+        self._max_pending = max_pending
+        self._refreshing: set[str] = set()
+        self._closed = False
+
+        # stats
+        self._loads = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._refresh_skipped = 0
+        self._refresh_seconds = 0.0
+        self._refresh_max_seconds = 0.0
+
+    def get(self, key: str) -> Any:
+        """
+        Return the value for key, loading it on a miss.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._clock() - entry.loaded_at >= self.refresh_after:
+                    self._schedule_refresh(key, entry)
+                return entry.value
+
+        # Miss — nothing to serve, so the caller waits for this load
+        value = self._loader(key)
+        with self._lock:
+            self._cache.put(key, _Loaded(value, self._clock()))
+            self._loads += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """
+        Store a value directly (counts as freshly loaded).
+        """
+        with self._lock:
+            self._cache.put(key, _Loaded(value, self._clock()))
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value. A refresh already in flight will not restore it.
+        """
+        with self._lock:
+            return self._cache.delete(key)
+
+    def refresh(self, key: str):
+        """
+        Schedule a background reload of key now, regardless of age.
+        """
+        with self._lock:
+            entry = self._cache.peek(key)
+            if entry is not None:
+                self._schedule_refresh(key, entry)
+
+    def _schedule_refresh(self, key: str, entry: _Loaded):
+        """
+        Queue a reload of entry unless one is already pending. Caller
+        holds the lock.
+        """
+        if key in self._refreshing or self._closed:
+            return
+        if len(self._refreshing) >= self._max_pending:
+            self._refresh_skipped += 1
+            return
+        self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, entry)
+
+    def _refresh(self, key: str, entry: _Loaded):
+        """
+        Worker thread: reload one key and record how long it took.
+        """
+        started = time.perf_counter()
+        try:
+            value = self._loader(key)
+        except Exception:
+            with self._lock:
+                self._refresh_failures += 1
+                self._refreshing.discard(key)
+            return
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            # Only replace the entry this refresh was for, if still live:
+            # never resurrect a deleted/evicted/expired key or overwrite a
+            # newer put or load (each stores a new _Loaded)
+            if self._cache.peek(key) is entry:
+                self._cache.put(key, _Loaded(value, self._clock()))
+            self._refreshes += 1
+            self._refresh_seconds += elapsed
+            self._refresh_max_seconds = max(self._refresh_max_seconds, elapsed)
+            self._refreshing.discard(key)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        LRUCache stats plus load/refresh counts and refresh latencies.
+        """
+        with self._lock:
+            return {
+                **self._cache.stats(),
+                "loads": self._loads,
+                "refreshes": self._refreshes,
+                "refresh_failures": self._refresh_failures,
+                "refresh_skipped": self._refresh_skipped,
+                "refresh_pending": len(self._refreshing),
+                "refresh_avg_ms": self._refresh_seconds / self._refreshes * 1000 if self._refreshes else 0.0,
+                "refresh_max_ms": self._refresh_max_seconds * 1000,
+            }
+
+    def close(self, wait: bool = True):
+        """
+        Stop the refresh pool. Stale values are still served afterwards,
+        just never refreshed.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+    def __repr__(self) -> str:
+        return f"LoadingCache(capacity={self._cache.capacity}, refresh_after={self.refresh_after}, size={len(self)})"
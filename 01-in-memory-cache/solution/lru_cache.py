@@ -20,63 +20,299 @@ OPERATIONS:
         3. Remove from hashmap → O(1)
 
 Everything is O(1). That's the whole point.
+
+TTL (time to live):
+    put(key, value, ttl=30) or LRUCache(capacity, default_ttl=30)
+    - get() checks the node's deadline lazily → an expired entry is a miss
+    - A TimerWheel tracks every deadline, so expired entries are removed
+      in O(1) amortized each, even if nobody reads them again
+
+WEIGHT (bytes / cost) instead of entry count:
+    LRUCache(max_weight=64 * 1024 * 1024, weigher=lambda k, v: len(v))
+    - Every entry gets weight = weigher(key, value)
+    - put() evicts from the tail until total weight fits the budget
+    - Items heavier than max_entry_fraction * max_weight are rejected —
+      one huge blob would otherwise flush the whole cache
+
+BATCH operations:
+    get_many(keys) / put_many(items) / delete_many(keys)
+    - Same results as a loop, but bookkeeping is paid once per batch and
+      put_many evicts in a single pass over the tail
+
+on_evict(key, value):
+    Optional hook, called synchronously whenever the cache drops an entry
+    on its own (eviction or expiry) — not on delete() or overwrite.
+
+REMOVAL LISTENERS (asynchronous):
+    cache.add_removal_listener(listener, max_queue=..., policy=...)
+    - every removal — evicted, expired, replaced or deleted — is queued
+      and the listener receives batches of RemovalEvent(key, value, cause)
+      on a worker thread (removal_listener.py); put() only pays an append
+
+METRICS (off by default):
+    LRUCache(capacity, metrics=True) or cache.enable_metrics()
+    - get/put/delete latencies go into log-linear histograms (metrics.py)
+    - cache.export_prometheus() renders counters, gauges and histograms
+      in the Prometheus text format
+    Enabling shadows get/put/delete with timed wrappers ON THE INSTANCE;
+    disabling deletes them, so calls hit the plain class methods again —
+    the disabled path has no flag check and no extra call.
+
+RESIZE (live):
+    cache.resize(new_capacity)
+    - growing takes effect immediately
+    - shrinking evicts at most `chunk` LRU entries per step: one step
+      right away, then one before each get/put/delete (or call
+      resize_step() from a timer) until the target is reached, so a
+      10M → 1M shrink is spread over thousands of short steps instead
+      of one multi-second pause. Meanwhile capacity tracks the current
+      size, so new keys still evict instead of growing the cache.
+    - the last step rebuilds the hashmap at its new size (dicts never
+      shrink on delete): one O(new_capacity) copy, ~90 ms for 1M keys.
+    Steps run from instance shadows of get/put/delete, installed only
+    while a shrink is pending.
+
+MISS-RATIO CURVE SAMPLING (off by default):
+    LRUCache(capacity, mrc_sampling=True) or cache.enable_mrc_sampling()
+    - a SHARDS monitor (shards.py) follows a fixed-size hash sample of
+      the keys seen by get/put and estimates the LRU hit ratio at OTHER
+      capacities: would doubling this cache help?
+    - cache.estimate_hit_ratio(2 * cache.capacity), or stats()["estimated_hit_ratio"]
+    Installed the same way as metrics — instance shadows of get/put — so
+    it costs nothing while off; while on, every get/put pays a wrapper
+    call and the sampling check, and only sampled keys do more.
+
+SNAPSHOTS (warm restart):
+    cache.dump("cache.snap")   → streams entries to disk, most recent first
+    cache.load("cache.snap")   → restores them in the same recency order
+    See snapshot.py for the file format.
 """
 
-from typing import Any, Optional
+import gc
+import sys
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional
 from doubly_linked_list import DoublyLinkedList
+from metrics import LatencyHistogram, prometheus_text, timed
 from models import Node
+from removal_listener import DELETED, EVICTED, EXPIRED, REPLACED, RemovalDispatcher, RemovalListener
+from shards import ShardsMonitor, sampled, sampled_many
+from snapshot import read_snapshot, write_snapshot
+from timer_wheel import TimerWheel
+
+# A weigher receives (key, value) and returns that entry's cost
+Weigher = Callable[[str, Any], int]
+
+# An evict handler receives the (key, value) the cache dropped by itself
+EvictHandler = Callable[[str, Any], None]
+
+# Operations timed when metrics are enabled
+TIMED_OPERATIONS = ("get", "put", "delete")
+
+# Operations whose keys the SHARDS monitor sees: every lookup it counts
+# (hits + misses) must pass through one of them
+SAMPLED_OPERATIONS = {"get": sampled, "put": sampled, "get_many": sampled_many, "put_many": sampled_many}
+
+# Capacities (as multiples of the current one) reported by stats() while sampling
+MRC_SCALES = (0.5, 1, 2, 4)
+
+# Entries evicted per step while shrinking after resize()
+RESIZE_CHUNK = 1024
+
+
+def default_weigher(key: str, value: Any) -> int:
+    """
+    Shallow size of the value in bytes (containers are not traversed).
+    """
+    return sys.getsizeof(value)
+
 
 class LRUCache:
     """
     LRU Cache.
     """
-    def __init__(self, capacity: int):
-        if capacity <= 0:
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        timer_tick: float = 1.0,
+        max_weight: Optional[int] = None,
+        weigher: Weigher = default_weigher,
+        max_entry_fraction: float = 1.0,
+        on_evict: Optional[EvictHandler] = None,
+        metrics: bool = False,
+        mrc_sampling: bool = False,
+    ):
+        if capacity is None and max_weight is None:
+            raise ValueError("Either capacity or max_weight is required")
+        if capacity is not None and capacity <= 0:
             raise ValueError("Capacity must be positive")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("Max weight must be positive")
+        if not 0 < max_entry_fraction <= 1:
+            raise ValueError("Max entry fraction must be in (0, 1]")
+        if default_ttl is not None and default_ttl <= 0:
+            raise ValueError("TTL must be positive")
         
         self.capacity = capacity
+        self.default_ttl = default_ttl
         self._map: dict[str, Node] = {}
         self._list = DoublyLinkedList()
         
+        # expiry — clock is injectable so tests can control time
+        self._clock = clock
+        self._timers = TimerWheel(tick=timer_tick, start=clock())
+        self._has_ttls = default_ttl is not None  # fast path: skip expiry work
+
+        # weight — only computed when a max_weight budget is set
+        self.max_weight = max_weight
+        self._weigher = weigher
+        self._max_entry_weight = max_weight * max_entry_fraction if max_weight is not None else None
+        self._weight = 0
+
+        # Called synchronously whenever the cache itself drops an entry
+        self._on_evict = on_evict
+        # Asynchronous listeners for every removal, whatever the cause
+        self._removal_listeners: list[RemovalDispatcher] = []
+        
         # stats
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._expirations = 0
+        self._rejections = 0
+        self._created = clock()
+
+        # Per-operation latency histograms and the SHARDS miss-ratio-curve
+        # monitor, None while off
+        self._latency: Optional[dict[str, LatencyHistogram]] = None
+        self._mrc: Optional[ShardsMonitor] = None
+        # Pending shrink: target capacity and entries evicted per step
+        self._resize_target: Optional[int] = None
+        self._resize_chunk = RESIZE_CHUNK
+        if metrics:
+            self.enable_metrics()
+        if mrc_sampling:
+            self.enable_mrc_sampling()
         
     def get(self, key: str) -> Optional[Any]:
         """
         Get a value from the cache.
         """
-        if key not in self._map:
+        if self._has_ttls:
+            self._expire_due()
+        node = self._map.get(key)
+        if node is None:
+            self._misses += 1
+            return None
+        # Lazy check — the wheel may fire up to one tick late
+        if node.expires_at is not None and node.expires_at <= self._clock():
+            self._expire(node)
             self._misses += 1
             return None
-        node = self._map[key]
         self._list.move_to_head(node)
         self._hits += 1
         return node.value
     
-    def put(self, key: str, value: Any):
+    def put(self, key: str, value: Any, ttl: Optional[float] = None):
         """
         Put a value into the cache.
+
+        ttl (seconds) overrides default_ttl for this entry. Updating a key
+        resets its deadline.
         """
+        if ttl is None:
+            ttl = self.default_ttl
+        elif ttl <= 0:
+            raise ValueError("TTL must be positive")
+        if self._has_ttls:
+            self._expire_due()
+
+        weight = 1
+        if self.max_weight is not None:
+            weight = self._weigher(key, value)
+            # Too heavy to cache — drop any stale value rather than keep it
+            if weight > self._max_entry_weight:
+                if key in self._map:
+                    self._remove(self._map[key], REPLACED)
+                self._rejections += 1
+                return
+        
         # Case 1: Key already exists — update value and move to head
-        if key in self._map:
-            node = self._map[key]
+        node = self._map.get(key)
+        if node is not None:
+            if self._removal_listeners:
+                self._notify_removal(key, node.value, REPLACED)
             node.value = value
+            if ttl is not None or node.expires_at is not None:
+                self._set_expiry(node, ttl)
             self._list.move_to_head(node)
+            if self.max_weight is not None:
+                self._weight += weight - node.weight
+                node.weight = weight
+                self._evict_to_fit(0, 0)
             return
         
-        # Case 2: At capacity — evict LRU (tail node) before inserting
-        if len(self._list) >= self.capacity:
-            tail = self._list.remove_tail()
-            if tail:
-                del self._map[tail.key]
-                self._evictions += 1
+        # Case 2: Over budget — evict LRU (tail nodes) before inserting
+        if self.max_weight is not None:
+            self._evict_to_fit(1, weight)
+        elif len(self._list) >= self.capacity:
+            self._evict_lru()
+            self._evictions += 1
         
         # Case 3: New key — create node, add to head + map
-        node = Node(key, value)
+        node = Node(key, value, weight=weight)
+        if ttl is not None:
+            self._set_expiry(node, ttl)
         self._list.add_to_head(node)
         self._map[key] = node
+        self._weight += weight
+
+    def _evict_to_fit(self, entries: int, weight: int):
+        """
+        Evict from the tail until `entries` more entries weighing `weight`
+        in total fit within both the capacity and the weight budget.
+        """
+        if self.max_weight is None:
+            # Count-only: the excess is known up front — one splice
+            excess = len(self._list) + entries - self.capacity
+            if excess > 0:
+                for node in self._list.remove_tail_many(excess):
+                    del self._map[node.key]
+                    if node.expires_at is not None:
+                        self._timers.cancel(node.key)
+                    if self._on_evict is not None:
+                        self._on_evict(node.key, node.value)
+                    if self._removal_listeners:
+                        self._notify_removal(node.key, node.value, EVICTED)
+                self._weight -= excess
+                self._evictions += excess
+            return
+
+        evicted = 0
+        while self._list.size and (
+            (self.capacity is not None and len(self._list) + entries > self.capacity)
+            or (self.max_weight is not None and self._weight + weight > self.max_weight)
+        ):
+            self._evict_lru()
+            evicted += 1
+        self._evictions += evicted
+
+    def _evict_lru(self):
+        """
+        Evict the least recently used entry (the tail node).
+        The caller counts the eviction.
+        """
+        tail = self._list.remove_tail()
+        del self._map[tail.key]
+        self._weight -= tail.weight
+        if tail.expires_at is not None:
+            self._timers.cancel(tail.key)
+        if self._on_evict is not None:
+            self._on_evict(tail.key, tail.value)
+        if self._removal_listeners:
+            self._notify_removal(tail.key, tail.value, EVICTED)
         
     def delete(self, key: str) -> bool:
         """
@@ -84,24 +320,542 @@ class LRUCache:
         """
         if key not in self._map:
             return False
-        node = self._map[key]
+        self._remove(self._map[key], DELETED)
+        return True
+
+    # ─── Batch operations ──────────────────────────────────────
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Get several keys at once. Returns {key: value} for the hits only.
+
+        Same result as calling get() per key, but the expiry check, the
+        method lookups and the hit/miss counters are paid once per batch.
+        """
+        if self._has_ttls:
+            self._expire_due()
+        now = self._clock() if self._has_ttls else None
+
+        cache_map = self._map
+        move_to_head = self._list.move_to_head
+        found: dict[str, Any] = {}
+        hits = misses = 0
+        for key in keys:
+            node = cache_map.get(key)
+            if node is None:
+                misses += 1
+                continue
+            if node.expires_at is not None and node.expires_at <= now:
+                self._expire(node)
+                misses += 1
+                continue
+            move_to_head(node)
+            found[key] = node.value
+            hits += 1
+
+        self._hits += hits
+        self._misses += misses
+        return found
+
+    def put_many(self, items: Mapping[str, Any] | Iterable[tuple[str, Any]], ttl: Optional[float] = None):
+        """
+        Put several (key, value) pairs at once, all with the same ttl.
+
+        Entries are linked in first, then ONE pass over the tail evicts
+        whatever no longer fits. The final contents and recency order are
+        the same as calling put() per pair; the cache is briefly over
+        capacity by at most the batch's new keys.
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        elif ttl <= 0:
+            raise ValueError("TTL must be positive")
+        if self._has_ttls:
+            self._expire_due()
+        if isinstance(items, Mapping):
+            items = items.items()
+
+        cache_map = self._map
+        lst = self._list
+        weighted = self.max_weight is not None
+        added_weight = 0
+        for key, value in items:
+            weight = 1
+            if weighted:
+                weight = self._weigher(key, value)
+                if weight > self._max_entry_weight:
+                    if key in cache_map:
+                        self._remove(cache_map[key], REPLACED)
+                    self._rejections += 1
+                    continue
+
+            node = cache_map.get(key)
+            if node is not None:
+                if self._removal_listeners:
+                    self._notify_removal(key, node.value, REPLACED)
+                node.value = value
+                if ttl is not None or node.expires_at is not None:
+                    self._set_expiry(node, ttl)
+                lst.move_to_head(node)
+                added_weight += weight - node.weight
+                node.weight = weight
+                continue
+
+            node = Node(key, value)
+            node.weight = weight
+            if ttl is not None:
+                self._set_expiry(node, ttl)
+            lst.add_to_head(node)
+            cache_map[key] = node
+            added_weight += weight
+
+        self._weight += added_weight
+        self._evict_to_fit(0, 0)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Delete several keys at once. Returns how many were present.
+        """
+        cache_map = self._map
+        deleted = 0
+        for key in keys:
+            node = cache_map.get(key)
+            if node is not None:
+                self._remove(node, DELETED)
+                deleted += 1
+        return deleted
+
+    def _remove(self, node: Node, cause: Optional[str] = None):
+        """
+        Unlink a node from the list, the map and the timer wheel, and
+        tell the removal listeners why, if a cause is given.
+        """
         self._list.remove(node)
-        del self._map[key]
+        del self._map[node.key]
+        self._weight -= node.weight
+        if node.expires_at is not None:
+            self._timers.cancel(node.key)
+        if cause is not None and self._removal_listeners:
+            self._notify_removal(node.key, node.value, cause)
+
+    def _set_expiry(self, node: Node, ttl: Optional[float]):
+        """
+        (Re)arm or clear a node's deadline.
+        """
+        if ttl is None:
+            if node.expires_at is not None:
+                self._timers.cancel(node.key)
+            node.expires_at = None
+            return
+        self._has_ttls = True
+        node.expires_at = self._clock() + ttl
+        self._timers.schedule(node.key, node.expires_at)
+
+    def _expire_due(self):
+        """
+        Advance the timer wheel and drop every entry whose deadline passed.
+        """
+        now = self._clock()
+        for key in self._timers.advance(now):
+            # Deadlines round up to whole ticks, so anything fired is due
+            node = self._map[key]
+            node.expires_at = None  # Already fired — nothing to cancel
+            self._expire(node)
+
+    def _expire(self, node: Node):
+        """
+        Drop an entry whose deadline passed.
+        """
+        self._remove(node, EXPIRED)
+        self._expirations += 1
+        if self._on_evict is not None:
+            self._on_evict(node.key, node.value)
+
+    def expire(self, key: str, ttl: float) -> bool:
+        """
+        Give an existing key a new TTL (like Redis EXPIRE). Returns False
+        if the key is not cached. Does not touch recency or stats.
+        """
+        if ttl <= 0:
+            raise ValueError("TTL must be positive")
+        if self._has_ttls:
+            self._expire_due()
+        node = self._map.get(key)
+        if node is None:
+            return False
+        if node.expires_at is not None and node.expires_at <= self._clock():
+            self._expire(node)
+            return False
+        self._set_expiry(node, ttl)
         return True
 
-    def stats(self) -> dict[str, int]:
+    def purge_expired(self) -> int:
+        """
+        Eagerly remove expired entries. Returns how many were removed.
+        """
+        before = self._expirations
+        self._expire_due()
+        return self._expirations - before
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        Return key's value if it is cached and not expired, without
+        touching recency or stats. None otherwise.
+        """
+        node = self._map.get(key)
+        if node is None or (node.expires_at is not None and node.expires_at <= self._clock()):
+            return None
+        return node.value
+
+    def peek_lru(self) -> Optional[tuple[str, Any]]:
+        """
+        Return the (key, value) that would be evicted next, without
+        touching recency or stats. None if the cache is empty.
+        """
+        if self._list.is_empty():
+            return None
+        node = self._list.tail.prev
+        return node.key, node.value
+
+    # ─── Snapshots ─────────────────────────────────────────────
+
+    def dump(self, path: str) -> int:
+        """
+        Write every live entry to path, most recent first. Returns how
+        many entries were written. Does not touch recency or stats.
+
+        Entries are streamed straight from the linked list — no copy of
+        the cache is built in memory. TTLs are saved as time remaining.
+        """
+        if self._has_ttls:
+            self._expire_due()
+        now = self._clock()
+
+        def entries():
+            node = self._list.head.next
+            tail = self._list.tail
+            while node is not tail:
+                if node.expires_at is None:
+                    yield node.key, node.value, None
+                elif node.expires_at > now:
+                    yield node.key, node.value, node.expires_at - now
+                node = node.next
+
+        return write_snapshot(path, entries())
+
+    def load(self, path: str) -> int:
+        """
+        Restore entries from a dump() file. Returns how many were loaded.
+
+        Restored entries keep their snapshot recency order and are linked
+        in BELOW anything already cached (live data is newer). Keys that
+        are already cached are skipped, and loading stops once the cache
+        is full — the snapshot is most recent first, so what fits is the
+        hottest part of it. Nothing is evicted and on_evict is not called.
+        """
+        if self._has_ttls:
+            self._expire_due()
+
+        cache_map = self._map
+        lst = self._list
+        capacity = self.capacity
+        weighted = self.max_weight is not None
+        size = before = len(lst)
+
+        # Millions of new Nodes would trigger the cyclic GC over and over,
+        # each pass scanning every node allocated so far — and finding
+        # nothing to free, since every node is live in the cache. Pause it
+        # for the bulk load.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+
+        # Nodes are chained onto the tail by hand and the list is closed
+        # once at the end — no per-entry method calls
+        last = lst.tail.prev
+        try:
+            for key, value, ttl in read_snapshot(path):
+                if capacity is not None and size >= capacity:
+                    break
+                if key in cache_map:
+                    continue
+                node = Node(key, value)
+                if weighted:
+                    weight = self._weigher(key, value)
+                    if weight > self._max_entry_weight or self._weight + weight > self.max_weight:
+                        continue
+                    node.weight = weight
+                if ttl is not None:
+                    self._set_expiry(node, ttl)
+                node.prev = last
+                last.next = node
+                last = node
+                cache_map[key] = node
+                self._weight += node.weight
+                size += 1
+        finally:
+            last.next = lst.tail
+            lst.tail.prev = last
+            lst.size = size
+            if gc_was_enabled:
+                gc.enable()
+        return size - before
+
+    # ─── Metrics ───────────────────────────────────────────────
+
+    def enable_metrics(self):
+        """
+        Start timing get/put/delete (no-op if already enabled).
+        """
+        if self._latency is not None:
+            return
+        self._latency = {op: LatencyHistogram() for op in TIMED_OPERATIONS}
+        self._install_wrappers()
+
+    def disable_metrics(self):
+        """
+        Stop timing and drop the histograms; calls go straight to the
+        class methods again.
+        """
+        self._latency = None
+        self._install_wrappers()
+
+    def _install_wrappers(self):
+        """
+        Rebuild the instance shadows of get/put/delete (and the batch
+        operations, for sampling) for whatever is enabled: sampling
+        innermost, then resize steps, timing outermost (so it includes
+        both). With nothing enabled, no shadows remain.
+        """
+        for op in (*TIMED_OPERATIONS, "get_many", "put_many"):
+            self.__dict__.pop(op, None)
+            method = plain = getattr(self, op)
+            if self._mrc is not None and op in SAMPLED_OPERATIONS:
+                method = SAMPLED_OPERATIONS[op](method, self._mrc, counted=op.startswith("get"))
+            if self._resize_target is not None and op in TIMED_OPERATIONS:
+                method = self._stepping(method)
+            if self._latency is not None and op in TIMED_OPERATIONS:
+                method = timed(method, self._latency[op])
+            if method is not plain:
+                # Instance attribute shadows the class method for this cache only
+                setattr(self, op, method)
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self._latency is not None
+
+    # ─── Removal listeners ─────────────────────────────────────
+
+    def add_removal_listener(self, listener: RemovalListener, **options: Any) -> RemovalDispatcher:
+        """
+        Deliver every removal to listener, in batches on a worker thread.
+        options go to RemovalDispatcher (max_queue, batch_size, policy,
+        block_timeout, executor). Returns the dispatcher, for flush() and
+        stats().
+        """
+        dispatcher = RemovalDispatcher(listener, **options)
+        self._removal_listeners.append(dispatcher)
+        return dispatcher
+
+    def remove_removal_listener(self, dispatcher: RemovalDispatcher, timeout: Optional[float] = None):
+        """
+        Detach a listener, delivering what it still has queued.
+        """
+        self._removal_listeners.remove(dispatcher)
+        dispatcher.close(timeout)
+
+    def _notify_removal(self, key: str, value: Any, cause: str):
+        for dispatcher in self._removal_listeners:
+            dispatcher.publish(key, value, cause)
+
+    # ─── Resize ────────────────────────────────────────────────
+
+    def resize(self, new_capacity: int, chunk: int = RESIZE_CHUNK) -> int:
+        """
+        Change the capacity. Growing is immediate; shrinking evicts up
+        to `chunk` entries now and the rest incrementally (see module
+        docstring). Returns how many entries are still over the target.
+        """
+        if new_capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if chunk <= 0:
+            raise ValueError("Chunk must be positive")
+        self._resize_chunk = chunk
+        if len(self._list) <= new_capacity:
+            self.capacity = new_capacity
+            if self._resize_target is not None:
+                self._resize_target = None
+                self._install_wrappers()
+            return 0
+        pending = self._resize_target is not None
+        self._resize_target = new_capacity
+        remaining = self.resize_step()
+        if remaining and not pending:
+            self._install_wrappers()
+        return remaining
+
+    def resize_step(self) -> int:
+        """
+        Evict up to one chunk towards a pending resize target. Returns how
+        many entries are still over it (0 once the resize is complete).
+        """
+        target = self._resize_target
+        if target is None:
+            return 0
+        lst = self._list
+        count = min(len(lst) - target, self._resize_chunk)
+        if count > 0:
+            cache_map = self._map
+            timers = self._timers
+            on_evict = self._on_evict
+            for node in lst.remove_tail_many(count):
+                del cache_map[node.key]
+                self._weight -= node.weight
+                if node.expires_at is not None:
+                    timers.cancel(node.key)
+                if on_evict is not None:
+                    on_evict(node.key, node.value)
+                if self._removal_listeners:
+                    self._notify_removal(node.key, node.value, EVICTED)
+            self._evictions += count
+        remaining = len(lst) - target
+        if remaining > 0:
+            # Puts between steps evict instead of growing the cache
+            self.capacity = len(lst)
+            return remaining
+        self.capacity = target
+        self._resize_target = None
+        # dicts never shrink on delete — rebuild the table at its new size
+        self._map = dict(self._map)
+        self._install_wrappers()
+        return 0
+
+    @property
+    def resize_pending(self) -> bool:
+        return self._resize_target is not None
+
+    def _stepping(self, method: Callable) -> Callable:
+        """
+        Wrap a bound method so every call first takes one resize step.
+        """
+        step = self.resize_step
+
+        def wrapper(*args, **kwargs):
+            step()
+            return method(*args, **kwargs)
+
+        wrapper.__wrapped__ = method
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    # ─── Miss-ratio curve sampling ─────────────────────────────
+
+    def enable_mrc_sampling(self, sample_size: int = 8192, rate: float = 0.01):
+        """
+        Start a SHARDS monitor over get/put (no-op if already enabled).
+        At most sample_size keys are tracked; rate is the initial fraction
+        of keys sampled, lowered automatically once the sample is full.
+        """
+        if self._mrc is not None:
+            return
+        self._mrc = ShardsMonitor(sample_size, rate, requests=lambda: self._hits + self._misses)
+        self._install_wrappers()
+
+    def disable_mrc_sampling(self):
+        """
+        Stop sampling and drop the monitor.
+        """
+        self._mrc = None
+        self._install_wrappers()
+
+    @property
+    def mrc_sampling_enabled(self) -> bool:
+        return self._mrc is not None
+
+    def estimate_hit_ratio(self, capacity: int) -> float:
+        """
+        Estimated hit ratio this workload would get from an LRU cache of
+        `capacity` entries, based on lookups since sampling was enabled.
+        Deletes and expiry are not modelled.
+        """
+        if self._mrc is None:
+            raise RuntimeError("MRC sampling is not enabled")
+        return self._mrc.hit_ratio(capacity)
+
+    def hit_ratio(self) -> float:
+        """
+        hits / (hits + misses), 0.0 before the first lookup.
+        """
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def eviction_rate(self) -> float:
+        """
+        Average evictions per second since the cache was created.
+        """
+        elapsed = self._clock() - self._created
+        return self._evictions / elapsed if elapsed > 0 else 0.0
+
+    def export_prometheus(self, prefix: str = "cache", labels: Optional[dict[str, str]] = None) -> str:
+        """
+        Metrics in the Prometheus text exposition format, e.g. to serve
+        from a /metrics endpoint. Latency histograms are included while
+        metrics are enabled.
+        """
+        counters = {
+            "hits_total": ("Lookups that found a live entry.", self._hits),
+            "misses_total": ("Lookups that found nothing or an expired entry.", self._misses),
+            "evictions_total": ("Entries evicted to make room.", self._evictions),
+            "expirations_total": ("Entries removed because their TTL passed.", self._expirations),
+            "rejections_total": ("Entries rejected as too heavy to cache.", self._rejections),
+        }
+        gauges = {
+            "size": ("Entries currently cached.", len(self._list)),
+            "capacity": ("Maximum number of entries.", self.capacity),
+            "weight": ("Total weight of cached entries.", self._weight if self.max_weight is not None else None),
+            "max_weight": ("Weight budget.", self.max_weight),
+            "hit_ratio": ("hits / (hits + misses) since creation.", self.hit_ratio()),
+        }
+        return prometheus_text(prefix, counters, gauges, self._latency, labels)
+
+    def stats(self) -> dict[str, Any]:
         """
         Return the stats of the cache.
         """
-        total = self._hits + self._misses + self._evictions
-        return {
+        total = self._hits + self._misses
+        stats = {
             "size": len(self._list),
             "capacity": self.capacity,
             "hits": self._hits,
             "misses": self._misses,
             "evictions": self._evictions,
+            "expirations": self._expirations,
+            "rejections": self._rejections,
+            "hit_ratio": self.hit_ratio(),
+            "eviction_rate": self.eviction_rate(),
             "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
         }
+        # Count-only caches have no weight (every entry counts 1), as in export_prometheus
+        if self.max_weight is not None:
+            stats["weight"] = self._weight
+            stats["max_weight"] = self.max_weight
+        if self._latency is not None:
+            for op, histogram in self._latency.items():
+                stats[f"{op}_p50_us"] = histogram.percentile(50) / 1000
+                stats[f"{op}_p99_us"] = histogram.percentile(99) / 1000
+        if self._resize_target is not None:
+            stats["resize_target"] = self._resize_target
+        if self._removal_listeners:
+            listener_stats = [dispatcher.stats() for dispatcher in self._removal_listeners]
+            for counter in ("queued", "pending", "dropped", "failed"):
+                stats[f"removals_{counter}"] = sum(entry[counter] for entry in listener_stats)
+        if self._mrc is not None:
+            base = self._resize_target or self.capacity or max(len(self._list), 1)
+            stats["estimated_hit_ratio"] = {
+                capacity: self._mrc.hit_ratio(capacity)
+                for capacity in sorted({max(1, int(base * scale)) for scale in MRC_SCALES})
+            }
+            stats["mrc_sampling"] = self._mrc.summary()
+        return stats
     
     def __len__(self) -> int:
         """
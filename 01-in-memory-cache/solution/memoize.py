@@ -0,0 +1,204 @@
+"""
+@cached — memoize a function with an LRUCache, with single-flight loading.
+
+functools.lru_cache is great, but it has no stats, no TTL, and the cache
+cannot be shared or inspected. @cached puts the results in an LRUCache
+you own:
+
+    users = LRUCache(capacity=10_000, default_ttl=60)
+
+    @cached(cache=users)
+    def load_user(user_id: int) -> dict:
+        return db.fetch_user(user_id)
+
+SINGLE FLIGHT (thundering herd protection):
+    If 50 threads miss the same key at once, a naive memoizer runs the
+    expensive function 50 times. Here the first thread becomes the
+    "leader" and computes; the others find its in-flight call and wait
+    for the result:
+
+        thread 1 ──miss──► compute ─────────► put + wake waiters
+        thread 2 ──miss──► wait on call 1 ──► same result
+        thread 3 ──miss──► wait on call 1 ──► same result
+
+    Exceptions are shared with the waiters too, and are never cached.
+
+LOCKING:
+    LRUCache is not thread-safe, so every access goes through a lock —
+    ONE lock per cache, not per function: functions sharing a cache via
+    namespace= also share its lock. Pass lock= to use your own (e.g. one
+    your other code already holds around that cache).
+
+NEW CONCEPT — threading.Event:
+    A flag threads can wait on. event.wait() blocks until another thread
+    calls event.set().
+
+NEW CONCEPT — functools.wraps:
+    Copies __name__, __doc__, etc. from the wrapped function onto the
+    wrapper, so the decorated function still looks like the original.
+"""
+
+import functools
+import threading
+import weakref
+from typing import Any, Callable, Hashable, Optional
+
+from lru_cache import LRUCache
+
+# A key function receives (args, kwargs) and returns a hashable key
+KeyFunc = Callable[[tuple, dict], Hashable]
+
+# Separates positional from keyword arguments inside a key tuple
+_KWD_MARK = object()
+
+# Stands in for a cached None (LRUCache.get returns None on a miss)
+_NONE = object()
+
+# One lock per cache, shared by every function memoized into it
+_cache_locks: "weakref.WeakKeyDictionary[LRUCache, threading.Lock]" = weakref.WeakKeyDictionary()
+_cache_locks_guard = threading.Lock()
+
+
+def lock_for(cache: LRUCache) -> threading.Lock:
+    """
+    The lock @cached uses for this cache (created on first use).
+    """
+    with _cache_locks_guard:
+        lock = _cache_locks.get(cache)
+        if lock is None:
+            lock = _cache_locks[cache] = threading.Lock()
+        return lock
+
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Build a cheap hashable key from call arguments.
+
+    A single int/str argument is used as-is (no tuple allocation), which
+    covers the common "load by id" case.
+    """
+    if not kwargs and len(args) == 1 and type(args[0]) in (int, str):
+        return args[0]
+    if kwargs:
+        return args + (_KWD_MARK,) + tuple(kwargs.items())
+    return args
+
+
+class _Call:
+    """
+    One in-flight computation that other threads can wait on.
+    """
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def cached(
+    cache: Optional[LRUCache] = None,
+    key: KeyFunc = make_key,
+    namespace: Optional[str] = None,
+    ttl: Optional[float] = None,
+    lock: Optional[threading.Lock] = None,
+):
+    """
+    Decorator factory. Memoizes results in cache (a fresh
+    LRUCache(capacity=128) if omitted).
+
+    namespace prefixes every key — set it when several functions share
+    one cache so their keys cannot collide. ttl overrides the cache's
+    default_ttl for this function's results. lock guards the cache
+    (default: lock_for(cache), shared by all functions using it).
+    """
+    if cache is None:
+        cache = LRUCache(capacity=128)
+    if lock is None:
+        lock = lock_for(cache)
+
+    def decorator(func: Callable) -> Callable:
+        # lock guards the (not thread-safe) cache and the in-flight table
+        inflight: dict[Hashable, _Call] = {}
+        counters = {"loads": 0, "coalesced": 0, "errors": 0}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(args, kwargs)
+            if namespace is not None:
+                k = (namespace, k)
+
+            with lock:
+                value = cache.get(k)
+                if value is not None:
+                    return None if value is _NONE else value
+                call = inflight.get(k)
+                leader = call is None
+                if leader:
+                    call = inflight[k] = _Call()
+                    counters["loads"] += 1
+                else:
+                    counters["coalesced"] += 1
+
+            # Followers: wait for the leader's result
+            if not leader:
+                call.event.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            # Leader: compute outside the lock, then publish
+            try:
+                call.result = func(*args, **kwargs)
+            except BaseException as error:
+                call.error = error
+                with lock:
+                    counters["errors"] += 1
+                    del inflight[k]
+                call.event.set()
+                raise
+
+            with lock:
+                cache.put(k, _NONE if call.result is None else call.result, ttl=ttl)
+                del inflight[k]
+            call.event.set()
+            return call.result
+
+        def invalidate(*args, **kwargs) -> bool:
+            """
+            Drop the cached result for these arguments.
+            """
+            k = key(args, kwargs)
+            if namespace is not None:
+                k = (namespace, k)
+            with lock:
+                return cache.delete(k)
+
+        def stats() -> dict[str, Any]:
+            """
+            Cache stats plus loads (leader calls), coalesced (waiters
+            that reused a leader's call) and errors.
+            """
+            with lock:
+                return {**cache.stats(), **counters}
+
+        wrapper.cache = cache
+        wrapper.invalidate = invalidate
+        wrapper.stats = stats
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    @cached(cache=LRUCache(capacity=100))
+    def slow_square(n: int) -> int:
+        time.sleep(0.2)
+        return n * n
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(slow_square, [7] * 20))
+    print(f"20 concurrent calls → {set(results)} in {time.perf_counter() - started:.2f}s")
+    print(slow_square.stats())
@@ -0,0 +1,191 @@
+"""
+Metrics — latency histograms and Prometheus text exposition.
+
+LOG-LINEAR HISTOGRAM (the HdrHistogram idea, simplified):
+    Latencies span nanoseconds to seconds, so fixed-width buckets are
+    either too coarse at the bottom or millions of buckets wide. Instead
+    every power of two is split into SUB_BUCKETS linear sub-buckets:
+
+        [0..15] exact │ 16 18 20 .. 30 │ 32 36 40 .. 60 │ 64 72 80 .. 120 │ ...
+                      └─ width 2 ──────┘└─ width 4 ─────┘└─ width 8 ───────┘
+
+    Relative error stays under 1/SUB_BUCKETS (12.5%) at every scale, the
+    whole 64-bit range fits in ~500 counters, and record() is a
+    bit_length(), a shift and a list increment — no search, no floats.
+
+PROMETHEUS TEXT FORMAT:
+    What a Prometheus server scrapes from GET /metrics:
+
+        # HELP cache_hits_total Cache hits.
+        # TYPE cache_hits_total counter
+        cache_hits_total 1027
+        cache_op_duration_seconds_bucket{op="get",le="1.023e-06"} 998
+        cache_op_duration_seconds_bucket{op="get",le="+Inf"} 1027
+        cache_op_duration_seconds_sum{op="get"} 0.00041
+        cache_op_duration_seconds_count{op="get"} 1027
+
+    Histogram buckets are CUMULATIVE (le = "less than or equal"). The
+    exported bounds are 2^k - 1 ns: a log-linear bucket starts at 2^k, so
+    "≤ 2^k - 1" is an exact bucket edge, while "≤ 2^k" would need part of
+    the bucket that starts there.
+"""
+
+import functools
+import time
+from typing import Callable, Optional
+
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Exported "le" bounds: 2^8 - 1 ns (255 ns) .. 2^30 - 1 ns (~1.07 s)
+_EXPORT_BOUNDS_NS = [(1 << power) - 1 for power in range(8, 31)]
+
+
+def bucket_index(value: int) -> int:
+    """
+    Log-linear bucket for a non-negative integer value.
+    """
+    if value < 2 * SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_upper_bound(index: int) -> int:
+    """
+    Smallest value that falls in a LATER bucket than index.
+    """
+    if index < 2 * SUB_BUCKETS:
+        return index + 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    sub = (index & (SUB_BUCKETS - 1)) + SUB_BUCKETS
+    return (sub + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations in nanoseconds.
+    """
+    def __init__(self):
+        self._counts = [0] * (bucket_index((1 << 64) - 1) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int):
+        self._counts[bucket_index(duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile(self, pct: float) -> int:
+        """
+        Upper bound (ns) of the bucket holding the pct-th percentile.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, round(self.count * pct / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper_bound(index) - 1, self.max_ns)
+        return self.max_ns
+
+    def cumulative(self, bounds_ns: list[int]) -> list[int]:
+        """
+        Count of values ≤ each bound (Prometheus "le"). Exact when bound + 1
+        is a bucket edge (e.g. bound = 2^k - 1); otherwise the bucket that
+        straddles the bound is left out, so the count is a lower bound.
+        """
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds_ns:
+            while index < len(self._counts) and bucket_upper_bound(index) <= bound + 1:
+                seen += self._counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def summary(self) -> dict[str, float]:
+        """
+        count, mean and p50/p99/max in microseconds.
+        """
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "p50_us": self.percentile(50) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+
+def timed(method: Callable, histogram: LatencyHistogram) -> Callable:
+    """
+    Wrap a bound method so every call records its duration.
+    """
+    clock = time.perf_counter_ns
+    record = histogram.record
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = clock()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record(clock() - started)
+
+    return wrapper
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def prometheus_text(
+    prefix: str,
+    counters: dict[str, tuple[str, float]],
+    gauges: dict[str, tuple[str, Optional[float]]],
+    histograms: Optional[dict[str, LatencyHistogram]] = None,
+    labels: Optional[dict[str, str]] = None,
+) -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    counters / gauges: {name: (help text, value)} — gauges whose value is
+    None are skipped. histograms: {op: histogram}, exported as one
+    <prefix>_op_duration_seconds metric with an op label.
+    """
+    labels = labels or {}
+    lines = []
+    for kind, metrics in (("counter", counters), ("gauge", gauges)):
+        for name, (help_text, value) in metrics.items():
+            if value is None:
+                continue
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.append(f"{metric}{_format_labels(labels)} {value}")
+
+    if histograms:
+        metric = f"{prefix}_op_duration_seconds"
+        lines.append(f"# HELP {metric} Cache operation latency.")
+        lines.append(f"# TYPE {metric} histogram")
+        for op, histogram in histograms.items():
+            op_labels = {**labels, "op": op}
+            for bound, count in zip(_EXPORT_BOUNDS_NS, histogram.cumulative(_EXPORT_BOUNDS_NS)):
+                bucket_labels = _format_labels({**op_labels, "le": repr(bound / 1e9)})
+                lines.append(f"{metric}_bucket{bucket_labels} {count}")
+            lines.append(f"{metric}_bucket{_format_labels({**op_labels, 'le': '+Inf'})} {histogram.count}")
+            lines.append(f"{metric}_sum{_format_labels(op_labels)} {histogram.total_ns / 1e9}")
+            lines.append(f"{metric}_count{_format_labels(op_labels)} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
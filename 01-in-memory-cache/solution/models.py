@@ -15,4 +15,18 @@ class Node:
     key: str
     value: Any
     prev: Optional[Node] = field(default=None, repr=False)
-    next: Optional[Node] = field(default=None, repr=False)
\ No newline at end of file
+    next: Optional[Node] = field(default=None, repr=False)
+    expires_at: Optional[float] = field(default=None, repr=False)
+    weight: int = field(default=1, repr=False)
+
+
+@dataclass
+class FreqNode(Node):
+    """
+    A node that also counts how often it was accessed.
+
+    bucket points at the frequency-bucket node (in LFUCache) whose list
+    currently holds this node.
+    """
+    freq: int = 0
+    bucket: Optional[Node] = field(default=None, repr=False)
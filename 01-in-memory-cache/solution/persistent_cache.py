@@ -0,0 +1,296 @@
+"""
+Persistent Cache — LRUCache in front of a BackingStore.
+
+Reads are read-through in both modes: a miss loads from the store and
+caches the result. Writes go one of two ways:
+
+WRITE-THROUGH (mode="write-through"):
+    put → store.store_many([(k, v)]) → cache.put
+    Simple and durable: once put() returns, the store has the value.
+    Every write pays a store round trip.
+
+WRITE-BEHIND (mode="write-behind"):
+    put → cache.put + mark dirty → return immediately
+
+        dirty = {"a": 3, "b": 7, "c": DELETED}   ← a dict, so 100 writes
+                         │                          to "a" coalesce into 1
+                         ▼  every flush_interval s (or max_batch dirty keys)
+        background worker: ONE transaction for all upserts + deletes
+
+    An evicted (or expired) dirty entry is written to the store
+    synchronously, and only leaves dirty once the store has it, so
+    eviction never loses a write: if the store call fails, the entry
+    stays dirty (reads still find it) and the next flush retries. If a
+    flush of an OLDER value of that key is in flight, the entry stays
+    dirty too — writing it now could be overwritten by the in-flight
+    batch — and the next flush stores it.
+
+    A failed flush puts its batch back into dirty (newer writes win) and
+    is retried on the next interval; the worker keeps running.
+
+    A miss first checks dirty and in-flight flush data, so a read never
+    sees an older value from the store than what was written.
+
+A read-through load runs outside the lock, so a put/delete can finish
+while it is in flight. Each put/delete bumps the key's version while a
+load of it is running; the loaded value is only cached if the version
+is unchanged.
+
+close() stops the worker and flushes everything still dirty.
+"""
+
+import threading
+from typing import Any, Optional
+
+from backing_store import BackingStore
+from lru_cache import LRUCache
+
+WRITE_THROUGH = "write-through"
+WRITE_BEHIND = "write-behind"
+
+# Marks a pending delete in the dirty table
+_DELETED = object()
+
+# "No pending write" — None is a valid value to write
+_MISSING = object()
+
+
+class PersistentCache:
+    """
+    LRU cache with read-through loads and write-through or write-behind writes.
+    """
+    def __init__(
+        self,
+        store: BackingStore,
+        capacity: int,
+        mode: str = WRITE_THROUGH,
+        flush_interval: float = 1.0,
+        max_batch: int = 500,
+    ):
+        if mode not in (WRITE_THROUGH, WRITE_BEHIND):
+            raise ValueError(f"Unknown mode: '{mode}'. Available: {[WRITE_THROUGH, WRITE_BEHIND]}")
+        if flush_interval <= 0:
+            raise ValueError("Flush interval must be positive")
+
+        self.mode = mode
+        self._store = store
+        self._cache = LRUCache(capacity, on_evict=self._on_evict)
+        self._lock = threading.RLock()
+
+        # write-behind state
+        self._dirty: dict[str, Any] = {}
+        self._flushing: dict[str, Any] = {}
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()  # one flush at a time
+        self._stopped = False
+
+        # Keys with loads in flight → [running loads, version]
+        self._loading: dict[str, list[int]] = {}
+
+        # stats
+        self._loads = 0
+        self._writes = 0
+        self._flushes = 0
+        self._flushed_entries = 0
+        self._eviction_flushes = 0
+        self._flush_failures = 0
+        self.last_flush_error: Optional[BaseException] = None
+
+        self._worker: Optional[threading.Thread] = None
+        if mode == WRITE_BEHIND:
+            self._worker = threading.Thread(target=self._run, name="cache-write-behind", daemon=True)
+            self._worker.start()
+
+    # ─── Public API ────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value, loading it from the store on a miss.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                return value
+            # Written but not yet in the store — the newest value is here
+            for pending in (self._dirty, self._flushing):
+                if key in pending:
+                    value = pending[key]
+                    return None if value is _DELETED else value
+            loading = self._loading.setdefault(key, [0, 0])
+            loading[0] += 1
+            version = loading[1]
+
+        value = None
+        try:
+            value = self._store.load(key)
+        finally:
+            with self._lock:
+                self._loads += 1
+                loading[0] -= 1
+                if not loading[0]:
+                    del self._loading[key]
+                # A put/delete raced the load — its value (or absence) wins
+                if value is not None and loading[1] == version and key not in self._cache:
+                    self._cache.put(key, value)
+        return value
+
+    def put(self, key: str, value: Any):
+        """
+        Write a value through to the store, or mark it dirty (write-behind).
+        """
+        with self._lock:
+            self._writes += 1
+            self._bump_version(key)
+            if self.mode == WRITE_THROUGH:
+                self._store.store_many([(key, value)])
+                self._cache.put(key, value)
+                return
+            self._cache.put(key, value)
+            self._mark_dirty(key, value)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete from cache and store. Returns True if the key was cached.
+        """
+        with self._lock:
+            self._writes += 1
+            self._bump_version(key)
+            if self.mode == WRITE_THROUGH:
+                self._store.delete_many([key])
+            else:
+                self._mark_dirty(key, _DELETED)
+            return self._cache.delete(key)
+
+    def flush(self):
+        """
+        Write every dirty entry to the store now, in one batch.
+
+        If the store raises, the batch goes back into dirty (without
+        overwriting newer writes) and the exception propagates.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                batch, self._dirty = self._dirty, {}
+                self._flushing = batch
+
+            # Store I/O happens outside the cache lock — reads keep flowing
+            upserts = [(key, value) for key, value in batch.items() if value is not _DELETED]
+            deletes = [key for key, value in batch.items() if value is _DELETED]
+            try:
+                self._store.store_many(upserts)
+                self._store.delete_many(deletes)
+            except BaseException:
+                with self._lock:
+                    for key, value in batch.items():
+                        self._dirty.setdefault(key, value)
+                    self._flushing = {}
+                    self._flush_failures += 1
+                raise
+
+            with self._lock:
+                self._flushing = {}
+                self._flushes += 1
+                self._flushed_entries += len(batch)
+
+    def close(self):
+        """
+        Stop the write-behind worker and flush what is still dirty.
+        """
+        self._stopped = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join()
+        self.flush()
+
+    # ─── Write-behind internals ────────────────────────────────
+
+    def _bump_version(self, key: str):
+        """
+        Invalidate any load of key that is in flight. Caller holds the lock.
+        """
+        loading = self._loading.get(key)
+        if loading is not None:
+            loading[1] += 1
+
+    def _mark_dirty(self, key: str, value: Any):
+        """
+        Record a pending write; wake the worker early if the batch is full.
+        """
+        self._dirty[key] = value
+        if len(self._dirty) >= self._max_batch:
+            self._wakeup.set()
+
+    def _on_evict(self, key: str, value: Any):
+        """
+        LRUCache eviction hook: flush a dirty entry before it is dropped.
+        Runs while put() holds the lock.
+        """
+        if key in self._flushing:
+            # An older value is being written — storing this one now could
+            # be overwritten by it. Leave it dirty; the next flush writes it.
+            return
+        pending = self._dirty.get(key, _MISSING)
+        if pending is _MISSING or pending is _DELETED:
+            return
+        try:
+            self._store.store_many([(key, pending)])
+        except Exception as error:
+            # Keep it dirty (reads still see it) for the next flush. Not
+            # re-raised: LRUCache may be midway through a batch eviction.
+            self._flush_failures += 1
+            self.last_flush_error = error
+            return
+        # Only now that the store has it
+        del self._dirty[key]
+        self._eviction_flushes += 1
+
+    def _run(self):
+        """
+        Worker loop: flush every flush_interval seconds or when woken.
+        """
+        while not self._stopped:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as error:
+                # Batch is back in dirty — keep running and retry next time
+                self.last_flush_error = error
+
+    # ─── Stats / dunder ────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """
+        LRUCache stats plus store loads, writes and flush counters.
+        """
+        with self._lock:
+            return {
+                **self._cache.stats(),
+                "mode": self.mode,
+                "loads": self._loads,
+                "writes": self._writes,
+                "dirty": len(self._dirty),
+                "flushes": self._flushes,
+                "flushed_entries": self._flushed_entries,
+                "eviction_flushes": self._eviction_flushes,
+                "flush_failures": self._flush_failures,
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+    def __repr__(self) -> str:
+        return f"PersistentCache(mode={self.mode!r}, size={len(self)}, dirty={len(self._dirty)})"
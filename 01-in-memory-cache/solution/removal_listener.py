@@ -0,0 +1,252 @@
+"""
+Removal listeners — learn about every entry leaving an LRUCache, off the
+hot path.
+
+on_evict(key, value) runs synchronously inside put(), so a slow handler
+(closing a file, freeing a buffer, a network call) becomes put latency.
+A RemovalDispatcher instead QUEUES each removal and delivers them in
+batches from a worker thread:
+
+    put() ──► publish(key, value, cause) ──► deque ──► worker ──► listener([events])
+              O(1): lock, append, maybe notify     (batch_size at a time,
+                                                     or submitted to an executor)
+
+CAUSES:
+    EVICTED   dropped to make room (capacity, weight budget or resize)
+    EXPIRED   its TTL passed
+    REPLACED  put() overwrote it — the event carries the OLD value
+    DELETED   delete() / delete_many()
+
+BOUNDED QUEUE — what publish() does when max_queue events are waiting:
+    DROP_NEWEST  discard the new event          (never blocks the cache)
+    DROP_OLDEST  discard the oldest queued one  (never blocks; freshest kept)
+    BLOCK        wait for room — BACKPRESSURE: a listener that cannot keep
+                 up slows the cache down instead of losing events.
+                 block_timeout bounds the wait; after it the event drops.
+
+Batches form naturally: the worker takes whatever is waiting (up to
+batch_size) each time it comes back, so a busy cache gets big batches
+and an idle one gets its events right away.
+
+Every published event ends up counted exactly once as delivered,
+dropped or failed (the listener raised or its executor task was
+cancelled — the batch is lost, the worker keeps going).
+
+queued counts events accepted into the queue; pending counts the ones
+waiting right now.
+
+With BLOCK, the listener must not write to the cache it listens to: a
+removal published from the worker thread would wait for itself.
+
+NEW CONCEPT — threading.Condition:
+    A lock plus wait()/notify(). The worker waits on it while the queue is
+    empty; publish() notifies when it appends the first event of a batch;
+    a blocked publish() waits on it until the worker frees room.
+"""
+
+import collections
+import threading
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+EVICTED = "evicted"
+EXPIRED = "expired"
+REPLACED = "replaced"
+DELETED = "deleted"
+CAUSES = (EVICTED, EXPIRED, REPLACED, DELETED)
+
+DROP_NEWEST = "drop-newest"
+DROP_OLDEST = "drop-oldest"
+BLOCK = "block"
+POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
+
+@dataclass(slots=True)
+class RemovalEvent:
+    """
+    One entry that left the cache, and why.
+    """
+    key: Any
+    value: Any
+    cause: str
+
+
+# A removal listener receives a batch of events, oldest first
+RemovalListener = Callable[[list[RemovalEvent]], None]
+
+
+class RemovalDispatcher:
+    """
+    Bounded queue of removal events, delivered in batches on a worker thread.
+
+    With an executor, the worker hands each batch to executor.submit()
+    instead of calling the listener itself (batches may then run
+    concurrently and out of order).
+    """
+    def __init__(
+        self,
+        listener: RemovalListener,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        policy: str = DROP_NEWEST,
+        block_timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ):
+        if max_queue <= 0:
+            raise ValueError("Max queue must be positive")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: '{policy}'. Available: {list(POLICIES)}")
+
+        self.listener = listener
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._executor = executor
+
+        self._queue: collections.deque[RemovalEvent] = collections.deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0           # events taken by the worker, not yet done
+        self._closed = False
+
+        # stats
+        self._queued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+        self._worker = threading.Thread(target=self._run, name="cache-removal-listener", daemon=True)
+        self._worker.start()
+
+    # ─── Producer side (called by the cache) ───────────────────
+
+    def publish(self, key: Any, value: Any, cause: str) -> bool:
+        """
+        Queue one removal. Returns False if it was dropped (queue full,
+        or the dispatcher is closed).
+        """
+        event = RemovalEvent(key, value, cause)
+        with self._condition:
+            if self._closed:
+                self._dropped += 1
+                return False
+            queue = self._queue
+            if len(queue) >= self.max_queue:
+                if self.policy == DROP_NEWEST:
+                    self._dropped += 1
+                    return False
+                if self.policy == DROP_OLDEST:
+                    queue.popleft()
+                    self._dropped += 1
+                elif not self._condition.wait_for(
+                    lambda: len(queue) < self.max_queue or self._closed, self.block_timeout,
+                ) or self._closed:
+                    self._dropped += 1
+                    return False
+            queue.append(event)
+            self._queued += 1
+            # The worker only sleeps on an empty queue — wake it once per batch
+            if len(queue) == 1:
+                self._condition.notify_all()
+            return True
+
+    # ─── Worker ────────────────────────────────────────────────
+
+    def _run(self):
+        """
+        Worker loop: take up to batch_size events, deliver, repeat.
+        """
+        queue = self._queue
+        while True:
+            with self._condition:
+                # In-flight is bounded too, so an executor cannot pile up work
+                self._condition.wait_for(
+                    lambda: (queue or self._closed) and self._in_flight < self.max_queue
+                )
+                if not queue:
+                    return  # closed and drained
+                batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+                self._in_flight += len(batch)
+                # Room freed — wake blocked publishers
+                self._condition.notify_all()
+            if self._executor is not None:
+                try:
+                    future = self._executor.submit(self.listener, batch)
+                except RuntimeError:  # executor shut down
+                    self._done(batch, False)
+                else:
+                    future.add_done_callback(lambda done, batch=batch: self._finished(batch, done))
+            else:
+                try:
+                    self.listener(batch)
+                except Exception:
+                    self._done(batch, False)
+                else:
+                    self._done(batch, True)
+
+    def _finished(self, batch: list[RemovalEvent], future: Future):
+        """
+        Executor done-callback. A cancelled batch (e.g. shutdown with
+        cancel_futures=True) counts as failed — _done must always run, or
+        flush() would wait on it forever.
+        """
+        self._done(batch, not future.cancelled() and future.exception() is None)
+
+    def _done(self, batch: list[RemovalEvent], ok: bool):
+        with self._condition:
+            self._in_flight -= len(batch)
+            self._batches += 1
+            if ok:
+                self._delivered += len(batch)
+            else:
+                self._failed += len(batch)
+            self._condition.notify_all()
+
+    # ─── Lifecycle ─────────────────────────────────────────────
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been delivered (or failed).
+        Returns False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout,
+            )
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Deliver what is queued, then stop the worker. Later publishes drop.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+        self.flush(timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "queued": self._queued,
+                "pending": len(self._queue),
+                "in_flight": self._in_flight,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches,
+                "policy": self.policy,
+            }
+
+    def __enter__(self) -> "RemovalDispatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
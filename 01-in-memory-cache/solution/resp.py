@@ -0,0 +1,161 @@
+"""
+RESP — the Redis wire protocol, the subset cache_server.py speaks.
+
+Every value on the wire starts with a one-byte type and ends in CRLF:
+
+    +OK\\r\\n                     simple string
+    -ERR message\\r\\n            error
+    :42\\r\\n                     integer
+    $5\\r\\nhello\\r\\n             bulk string (length-prefixed, binary safe)
+    $-1\\r\\n                     null bulk string (a miss)
+    *2\\r\\n$3\\r\\nGET\\r\\n$1\\r\\nk\\r\\n  array — a command is an array of bulk strings
+
+Length prefixes mean a parser never scans the payload itself, and the
+server can find where one command ends and the next begins without
+waiting — that is what makes pipelining work: a client writes 100
+commands back to back, the server parses all of them out of one read.
+
+Both parsers are incremental: given a buffer and an offset they return
+(result, new_offset), or None if the buffer does not yet hold a
+complete message — the caller reads more and tries again.
+"""
+
+from typing import Any, Optional
+
+CRLF = b"\r\n"
+OK = b"+OK\r\n"
+PONG = b"+PONG\r\n"
+NULL = b"$-1\r\n"
+
+
+class ProtocolError(Exception):
+    """
+    The peer sent bytes that are not valid RESP.
+    """
+
+
+class ResponseError(Exception):
+    """
+    The server answered with an error reply (-ERR ...).
+    """
+
+
+# ─── Encoding ──────────────────────────────────────────────────
+
+
+def _to_bytes(arg: Any) -> bytes:
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, str):
+        return arg.encode()
+    if isinstance(arg, (int, float)):
+        return str(arg).encode()
+    raise TypeError(f"Cannot send {type(arg).__name__} over RESP")
+
+
+def encode_command(*args: Any) -> bytes:
+    """
+    Encode one command as an array of bulk strings.
+    """
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = _to_bytes(arg)
+        parts.append(b"$%d\r\n%b\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def encode_bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return NULL
+    return b"$%d\r\n%b\r\n" % (len(value), value)
+
+
+def encode_integer(value: int) -> bytes:
+    return b":%d\r\n" % value
+
+
+def encode_error(message: str) -> bytes:
+    return b"-ERR %b\r\n" % message.encode()
+
+
+def encode_array(values: list[Optional[bytes]]) -> bytes:
+    return b"*%d\r\n" % len(values) + b"".join(encode_bulk(value) for value in values)
+
+
+# ─── Decoding ──────────────────────────────────────────────────
+
+
+def parse_command(buf: bytes | bytearray, pos: int = 0) -> Optional[tuple[list[bytes], int]]:
+    """
+    Parse one command starting at pos. Returns (args, next_pos) or None
+    if incomplete. Inline commands ("PING\\r\\n", as typed into telnet)
+    are accepted too.
+    """
+    end = buf.find(CRLF, pos)
+    if end < 0:
+        return None
+    if buf[pos] != 0x2A:  # '*'
+        return bytes(buf[pos:end]).split(), end + 2
+
+    try:
+        count = int(buf[pos + 1:end])
+    except ValueError:
+        raise ProtocolError("Invalid multibulk length") from None
+    pos = end + 2
+    args = []
+    for _ in range(count):
+        end = buf.find(CRLF, pos)
+        if end < 0:
+            return None
+        if buf[pos] != 0x24:  # '$'
+            raise ProtocolError(f"Expected '$', got {chr(buf[pos])!r}")
+        try:
+            length = int(buf[pos + 1:end])
+        except ValueError:
+            raise ProtocolError("Invalid bulk length") from None
+        start = end + 2
+        stop = start + length
+        if stop + 2 > len(buf):
+            return None
+        args.append(bytes(buf[start:stop]))
+        pos = stop + 2
+    return args, pos
+
+
+def parse_reply(buf: bytes | bytearray, pos: int = 0) -> Optional[tuple[Any, int]]:
+    """
+    Parse one reply starting at pos. Returns (value, next_pos) or None
+    if incomplete. Error replies are returned as ResponseError instances
+    (not raised) so one failed command does not hide the rest of a
+    pipeline.
+    """
+    end = buf.find(CRLF, pos)
+    if end < 0:
+        return None
+    kind = buf[pos]
+    line = bytes(buf[pos + 1:end])
+    pos = end + 2
+
+    if kind == 0x2B:  # '+'
+        return line.decode(), pos
+    if kind == 0x2D:  # '-'
+        return ResponseError(line.decode()), pos
+    if kind == 0x3A:  # ':'
+        return int(line), pos
+    if kind == 0x24:  # '$'
+        length = int(line)
+        if length < 0:
+            return None, pos
+        if pos + length + 2 > len(buf):
+            return None
+        return bytes(buf[pos:pos + length]), pos + length + 2
+    if kind == 0x2A:  # '*'
+        items = []
+        for _ in range(int(line)):
+            parsed = parse_reply(buf, pos)
+            if parsed is None:
+                return None
+            item, pos = parsed
+            items.append(item)
+        return items, pos
+    raise ProtocolError(f"Unknown reply type {chr(kind)!r}")
@@ -0,0 +1,202 @@
+"""
+S3-FIFO Cache — three FIFO queues, no reordering on hits.
+
+S3-FIFO (Yang et al., SOSP '23) observes that most keys in real traces
+are "one-hit wonders": requested once and never again. Filter them out
+quickly and plain FIFO queues do as well as LRU or better — and a hit
+only has to bump a tiny counter instead of relinking a list.
+
+    new key ──► S (small, 10%) ──freq > 1──► M (main, 90%) ◄─┐
+                  │                           │  freq > 0:   │
+                  │ freq <= 1                 │  reinsert,   │
+                  ▼                           │  freq -= 1 ──┘
+                G (ghost: keys only) ──miss on a ghost key──► straight to M
+
+    get(key):  freq = min(freq + 1, 3)      ← the ONLY work on a hit
+
+    evict():
+        S over its share → pop S's oldest:
+            freq > 1  → move to M            (proved it is not one-hit)
+            otherwise → drop, remember key in G
+        else         → pop M's oldest:
+            freq > 0  → reinsert at M's head with freq - 1 (like CLOCK)
+            otherwise → drop
+
+Queues are DoublyLinkedLists used strictly FIFO (insert at head, pop at
+tail), so delete() can still unlink from the middle in O(1).
+"""
+
+from typing import Any, Optional
+
+from doubly_linked_list import DoublyLinkedList
+from models import FreqNode
+
+MAX_FREQ = 3
+
+
+class S3FIFOCache:
+    """
+    S3-FIFO cache with the LRUCache interface.
+    """
+    def __init__(self, capacity: int, small_ratio: float = 0.1):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < small_ratio < 1:
+            raise ValueError("Small ratio must be in (0, 1)")
+
+        self.capacity = capacity
+        self.small_capacity = max(1, int(capacity * small_ratio))
+        self.ghost_capacity = max(1, capacity - self.small_capacity)
+
+        self._small = DoublyLinkedList()
+        self._main = DoublyLinkedList()
+        # key → (node, queue that holds it)
+        self._map: dict[str, tuple[FreqNode, DoublyLinkedList]] = {}
+
+        # Ghost queue: keys only, FIFO
+        self._ghost = DoublyLinkedList()
+        self._ghost_map: dict[str, FreqNode] = {}
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._promotions = 0
+        self._ghost_hits = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value. A hit only bumps the entry's saturating counter.
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        node = entry[0]
+        if node.freq < MAX_FREQ:
+            node.freq += 1
+        self._hits += 1
+        return node.value
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        # Case 1: Key already cached — update value, counts as an access
+        entry = self._map.get(key)
+        if entry is not None:
+            node = entry[0]
+            node.value = value
+            if node.freq < MAX_FREQ:
+                node.freq += 1
+            return
+
+        # Look up the ghost first, so eviction below cannot forget it
+        ghost = self._ghost_map.pop(key, None)
+        if ghost is not None:
+            self._ghost.remove(ghost)
+            self._ghost_hits += 1
+
+        # Case 2: Full — run the S3-FIFO eviction
+        while len(self._map) >= self.capacity:
+            self._evict()
+
+        # Case 3: New key — ghosts go straight to M, everything else to S
+        node = FreqNode(key, value)
+        queue = self._main if ghost is not None else self._small
+        queue.add_to_head(node)
+        self._map[key] = (node, queue)
+
+    def _evict(self):
+        """
+        Evict exactly one entry from S or M.
+        """
+        if len(self._small) >= self.small_capacity or self._main.is_empty():
+            self._evict_small()
+        else:
+            self._evict_main()
+
+    def _evict_small(self):
+        """
+        Pop S's oldest entries until one is dropped (others move to M).
+        """
+        while not self._small.is_empty():
+            node = self._small.remove_tail()
+            if node.freq > 1:
+                node.freq = 0
+                self._main.add_to_head(node)
+                self._map[node.key] = (node, self._main)
+                self._promotions += 1
+                continue
+
+            del self._map[node.key]
+            self._remember(node.key)
+            self._evictions += 1
+            return
+
+        # Everything in S was promoted — now M is over its share
+        self._evict_main()
+
+    def _evict_main(self):
+        """
+        Pop M's oldest entries, reinserting the ones with freq left.
+        """
+        while True:
+            node = self._main.remove_tail()
+            if node.freq > 0:
+                node.freq -= 1
+                self._main.add_to_head(node)
+                continue
+            del self._map[node.key]
+            self._evictions += 1
+            return
+
+    def _remember(self, key: str):
+        """
+        Add a key to the ghost queue, dropping the oldest ghost if full.
+        """
+        if len(self._ghost) >= self.ghost_capacity:
+            oldest = self._ghost.remove_tail()
+            del self._ghost_map[oldest.key]
+        ghost = FreqNode(key, None)
+        self._ghost.add_to_head(ghost)
+        self._ghost_map[key] = ghost
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return False
+        node, queue = entry
+        queue.remove(node)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the stats of the cache.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self._map),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "small_size": len(self._small),
+            "main_size": len(self._main),
+            "ghost_size": len(self._ghost),
+            "promotions": self._promotions,
+            "ghost_hits": self._ghost_hits,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._map
+
+    def __repr__(self) -> str:
+        return f"S3FIFOCache(capacity={self.capacity}, small={self._small}, main={self._main})"
@@ -0,0 +1,125 @@
+"""
+Sharded LRU Cache — lock striping for multi-threaded servers.
+
+LRUCache is not thread-safe: even get() mutates the recency list via
+move_to_head. Wrapping one cache in one global lock works, but then every
+worker thread queues on that single lock.
+
+Instead, split the keyspace into N independent shards:
+
+    key ──hash──► shard i = hash(key) % N
+                      │
+        ┌─────────────┼─────────────┐
+    [Lock|LRUCache] [Lock|LRUCache] [Lock|LRUCache]  ...
+
+Two threads only contend when their keys land on the same shard, so with
+N shards contention drops roughly N-fold. On the free-threaded build
+(python3.13t) shards also run truly in parallel.
+
+Trade-off: LRU order is exact per shard, approximate globally — the
+evicted key is the LRU of its shard, not of the whole cache.
+
+NEW CONCEPT — with lock:
+    threading.Lock is a context manager. "with lock:" acquires it and
+    always releases it, even if the body raises.
+"""
+
+import threading
+from typing import Any, Optional
+
+from lru_cache import LRUCache
+
+
+class ShardedLRUCache:
+    """
+    Thread-safe LRU cache made of independently locked LRUCache shards.
+    """
+    def __init__(self, capacity: int, num_shards: int = 16):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if num_shards <= 0:
+            raise ValueError("Number of shards must be positive")
+
+        # Never create more shards than entries — each shard needs capacity >= 1
+        num_shards = min(num_shards, capacity)
+        self.capacity = capacity
+        self.num_shards = num_shards
+
+        # Spread capacity so shard sizes differ by at most one
+        base, extra = divmod(capacity, num_shards)
+        self._shards = [LRUCache(base + (1 if i < extra else 0)) for i in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+
+    def _index(self, key: str) -> int:
+        """
+        Pick the shard that owns a key.
+        """
+        return hash(key) % self.num_shards
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the owning shard.
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].get(key)
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the owning shard.
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i].put(key, value)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the owning shard.
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].delete(key)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Aggregate stats across shards.
+
+        Each shard is locked only while its own stats are read, so the
+        totals are a near-instant snapshot, not a global atomic one.
+        """
+        size = hits = misses = evictions = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard_stats = shard.stats()
+            size += shard_stats["size"]
+            hits += shard_stats["hits"]
+            misses += shard_stats["misses"]
+            evictions += shard_stats["evictions"]
+
+        total = hits + misses
+        return {
+            "size": size,
+            "capacity": self.capacity,
+            "shards": self.num_shards,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": f"{(hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        """
+        Return the number of items across all shards.
+        """
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Support 'in' operator: if "key" in cache
+        """
+        i = self._index(key)
+        with self._locks[i]:
+            return key in self._shards[i]
+
+    def __repr__(self) -> str:
+        return f"ShardedLRUCache(capacity={self.capacity}, shards={self.num_shards}, size={len(self)})"
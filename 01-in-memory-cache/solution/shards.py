@@ -0,0 +1,251 @@
+"""
+SHARDS — online miss-ratio-curve estimation from a sample of keys.
+
+An exact LRU miss-ratio curve needs a stack distance for every request
+(see simulator/mrc.py) — too much memory and time for a live cache.
+SHARDS (Spatially Hashed Approximate Reuse Distance Sampling) tracks a
+small, FIXED subset of keys instead and scales the results up.
+
+NEW CONCEPT — spatial sampling:
+    A key is sampled iff hash(key) < threshold, with the hash spread
+    uniformly over [0, 2^64). Sampling by KEY (not by request) keeps every
+    access to a sampled key, so its reuse pattern is intact, and a rate
+    of R = threshold / 2^64 keeps ~R of the distinct keys:
+
+        stack distance among sampled keys   d_s
+        estimated full stack distance       d ≈ d_s / R
+
+    The check is a hash, a multiply and a compare, so unsampled requests
+    — almost all of them — never touch the monitor's data structures.
+
+NEW CONCEPT — fixed-size SHARDS (constant memory):
+    With a fixed rate, memory grows with the number of distinct keys. So
+    keep at most sample_size keys: when one too many is sampled, drop the
+    key with the LARGEST hash and lower the threshold to that hash. The
+    rate only ever falls, and every remaining key still satisfies
+    hash < threshold, so the sample stays a uniform one.
+
+    Distances are recorded in a log-linear histogram (metrics.py buckets,
+    ≤ 12.5% bucket width), so the curve itself is constant-size too.
+
+NEW CONCEPT — SHARDS_adj:
+    Sampling R of the keys samples ~R of the requests only on average; a
+    few hot keys landing in (or out of) the sample skew the total. The
+    difference between the expected sampled requests (requests × R) and
+    the actual ones is credited to the smallest distance — the bias
+    correction from the SHARDS paper, which mostly fixes small caches.
+
+Stack distances come from a sorted list of each sampled key's last
+access time: d_s = 1 + number of sampled keys touched since, found with
+bisect. The list holds at most sample_size entries, so its O(n) inserts
+and deletes are a few-KB memmove.
+"""
+
+import bisect
+import heapq
+from typing import Any, Callable, Mapping, Optional
+
+from metrics import bucket_index, bucket_upper_bound
+
+_HASH_SPACE = 1 << 64
+_MASK = _HASH_SPACE - 1
+# Fibonacci hashing: spreads hash(int) == int (sequential keys) over 2^64.
+# The salt keeps key 0 (often the hottest) from always hashing to 0.
+_GOLDEN = 0x9E3779B97F4A7C15
+_SALT = 0x5BD1E9955BD1E995
+
+
+def spread(key: Any) -> int:
+    """
+    Uniform 64-bit hash of a key, stable within one process.
+    """
+    return ((hash(key) ^ _SALT) * _GOLDEN) & _MASK
+
+
+class ShardsMonitor:
+    """
+    Fixed-size SHARDS estimate of the LRU hit ratio at any capacity.
+
+    reference(key) — a lookup (counts towards the hit ratio)
+    touch(key)     — a write (updates recency, not counted)
+
+    requests, if given, returns the total lookups seen by the cache, so
+    the estimate can be bias-corrected (SHARDS_adj).
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 8192,
+        rate: float = 0.01,
+        requests: Optional[Callable[[], int]] = None,
+    ):
+        if sample_size <= 0:
+            raise ValueError("Sample size must be positive")
+        if not 0 < rate <= 1:
+            raise ValueError("Sampling rate must be in (0, 1]")
+        self.sample_size = sample_size
+        self.threshold = min(int(rate * _HASH_SPACE), _HASH_SPACE)
+
+        self._last: dict[Any, int] = {}        # sampled key → last access time
+        self._times: list[int] = []            # the same times, sorted
+        self._by_hash: list[tuple[int, Any]] = []  # max-heap of (-hash, key)
+        self._clock = 0                        # sampled accesses so far
+
+        self._histogram = [0] * (bucket_index(_MASK) + 1)
+        self._sampled = 0                      # sampled lookups
+        self._cold = 0                         # ... that were first accesses
+
+        # SHARDS_adj: expected sampled lookups, accumulated per rate epoch
+        self._requests = requests
+        self._expected = 0.0
+        self._mark = requests() if requests is not None else 0
+
+    @property
+    def rate(self) -> float:
+        return self.threshold / _HASH_SPACE
+
+    # ─── Recording ─────────────────────────────────────────────
+
+    def reference(self, key: Any):
+        hashed = spread(key)
+        if hashed < self.threshold:
+            self._access(key, hashed, True)
+
+    def touch(self, key: Any):
+        hashed = spread(key)
+        if hashed < self.threshold:
+            self._access(key, hashed, False)
+
+    def _access(self, key: Any, hashed: int, counted: bool):
+        """
+        Move a sampled key to the top of the sampled LRU stack, recording
+        its scaled stack distance if this access is a lookup.
+        """
+        times = self._times
+        last = self._last.get(key)
+        if last is None:
+            if counted:
+                self._sampled += 1
+                self._cold += 1
+            self._last[key] = self._clock
+            times.append(self._clock)
+            heapq.heappush(self._by_hash, (-hashed, key))
+            if len(self._last) > self.sample_size:
+                self._shrink()
+        else:
+            index = bisect.bisect_left(times, last)
+            if counted:
+                self._sampled += 1
+                distance = (len(times) - index) * _HASH_SPACE // self.threshold
+                self._histogram[bucket_index(distance)] += 1
+            del times[index]
+            times.append(self._clock)
+            self._last[key] = self._clock
+        self._clock += 1
+
+    def _shrink(self):
+        """
+        Drop the largest-hash key(s) and lower the threshold to that hash.
+        """
+        if self._requests is not None:
+            now = self._requests()
+            self._expected += (now - self._mark) * self.rate
+            self._mark = now
+        neg_hash, key = heapq.heappop(self._by_hash)
+        self._forget(key)
+        self.threshold = -neg_hash
+        # Equal hashes must go too — the threshold excludes them
+        while self._by_hash and -self._by_hash[0][0] >= self.threshold:
+            self._forget(heapq.heappop(self._by_hash)[1])
+
+    def _forget(self, key: Any):
+        last = self._last.pop(key)
+        del self._times[bisect.bisect_left(self._times, last)]
+
+    # ─── Estimates ─────────────────────────────────────────────
+
+    def expected_samples(self) -> float:
+        """
+        Lookups the sample should have seen at the current rate history.
+        """
+        if self._requests is None:
+            return float(self._sampled)
+        return self._expected + (self._requests() - self._mark) * self.rate
+
+    def hit_ratio(self, capacity: int) -> float:
+        """
+        Estimated LRU hit ratio at `capacity` entries.
+        """
+        expected = self.expected_samples()
+        if capacity <= 0 or expected <= 0:
+            return 0.0
+        hits = 0.0
+        lower = 0
+        for index, count in enumerate(self._histogram):
+            upper = bucket_upper_bound(index)   # bucket holds [lower, upper)
+            if upper <= capacity + 1:
+                hits += count
+            else:
+                if count and lower <= capacity:
+                    hits += count * (capacity + 1 - lower) / (upper - lower)
+                break
+            lower = upper
+        hits += expected - self._sampled          # SHARDS_adj
+        return min(max(hits / expected, 0.0), 1.0)
+
+    def miss_ratio(self, capacity: int) -> float:
+        return 1.0 - self.hit_ratio(capacity)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "sampled_keys": len(self._last),
+            "sampled_lookups": self._sampled,
+            "expected_lookups": self.expected_samples(),
+        }
+
+
+def sampled(method: Callable, monitor: ShardsMonitor, counted: bool) -> Callable:
+    """
+    Wrap a bound get (counted=True) or put (counted=False) so its key is
+    offered to the monitor. The sampling check is inlined (see spread()):
+    unsampled keys pay one hash, xor, multiply and compare.
+    """
+    access = monitor._access
+
+    def wrapper(key, *args, **kwargs):
+        result = method(key, *args, **kwargs)
+        hashed = ((hash(key) ^ _SALT) * _GOLDEN) & _MASK
+        if hashed < monitor.threshold:
+            access(key, hashed, counted)
+        return result
+
+    wrapper.__wrapped__ = method
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def sampled_many(method: Callable, monitor: ShardsMonitor, counted: bool) -> Callable:
+    """
+    Like sampled(), for get_many (counted=True, takes keys) or put_many
+    (counted=False, takes a mapping or (key, value) pairs). Every key in
+    the batch is offered, so batch lookups are sampled exactly like get().
+    """
+    access = monitor._access
+
+    def wrapper(batch, *args, **kwargs):
+        if counted:
+            batch = keys = list(batch)
+        else:
+            batch = list(batch.items() if isinstance(batch, Mapping) else batch)
+            keys = [key for key, _ in batch]
+        result = method(batch, *args, **kwargs)
+        for key in keys:
+            hashed = ((hash(key) ^ _SALT) * _GOLDEN) & _MASK
+            if hashed < monitor.threshold:
+                access(key, hashed, counted)
+        return result
+
+    wrapper.__wrapped__ = method
+    wrapper.__doc__ = method.__doc__
+    return wrapper
@@ -0,0 +1,370 @@
+"""
+Shared-Memory Cache — one cache for every worker process on a host.
+
+N pre-forked workers each holding their own LRUCache means N copies of
+the same hot set and N cold caches after a restart. SharedMemoryCache
+keeps ONE table in a multiprocessing.shared_memory block that every
+worker maps; a put() in one worker is a hit in all of them.
+
+Shared memory holds raw bytes, not Python objects, so the table is a
+fixed layout of fixed-size slots:
+
+    ┌──────────── header ────────────┐
+    │ magic, buckets, ways, sizes    │
+    ├──────── bucket meta ───────────┤
+    │ [hand|count] [hand|count] ...  │  2 bytes per bucket
+    ├──────────── slots ─────────────┤
+    │ bucket 0: [slot][slot]...[slot]│  `ways` slots per bucket
+    │ bucket 1: [slot][slot]...[slot]│
+    │ ...                            │
+    └────────────────────────────────┘
+
+    slot = state u8 | ref u8 | key_len u16 | value_len u32 | hash u64
+           | key (max_key_size bytes) | value (max_value_size bytes)
+
+SET-ASSOCIATIVE: a key hashes to ONE bucket and may live in any of that
+bucket's `ways` slots. Lookups scan at most `ways` slots; nothing ever
+moves between buckets, so a bucket is the unit of locking.
+
+EVICTION — CLOCK per bucket (see clock_cache.py):
+    A full bucket sweeps its own hand over its slots: ref 1 → clear it,
+    ref 0 → victim. Approximate LRU within each bucket, and an eviction
+    only ever touches the bucket it is evicting from.
+
+LOCKING — per bucket, across processes:
+    Bucket b uses locks[b % num_locks] (lock striping, as in
+    sharded_lru_cache.py). The locks are multiprocessing.Lock objects
+    (OS semaphores) — create the cache BEFORE forking/spawning workers
+    and hand it to them; it pickles as (segment name, locks). Pass
+    context=multiprocessing.get_context("spawn") if the workers are
+    spawned rather than forked.
+
+HASHING — stable across processes:
+    hash() of a str is randomized per process (PYTHONHASHSEED), so two
+    workers would disagree on a key's bucket. Keys are hashed with
+    hashlib.blake2b instead, which is the same everywhere.
+
+Values are bytes (serialize objects yourself); keys are str or bytes.
+Stats (hits, misses, ...) are per process.
+
+NEW CONCEPT — multiprocessing.shared_memory.SharedMemory:
+    A named block of memory the OS maps into several processes. .buf is
+    a memoryview over it: writes from one process are visible to every
+    other process that attached the same name.
+"""
+
+import hashlib
+import multiprocessing
+import struct
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional
+
+MAGIC = b"SHMCACHE"
+
+_HEADER = struct.Struct("<8sIIII")  # magic, buckets, ways, max key, max value
+_SLOT = struct.Struct("<BBHIQ")     # state, ref, key_len, value_len, hash
+_META_BASE = 64                     # bucket meta starts after the padded header
+
+_EMPTY, _USED = 0, 1
+
+
+def stable_hash(key: bytes) -> int:
+    """
+    64-bit hash of key, identical in every process.
+    """
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class SharedMemoryCache:
+    """
+    Bytes cache in shared memory: fixed slots, per-bucket CLOCK eviction.
+    """
+    def __init__(
+        self,
+        capacity: int,
+        max_key_size: int = 64,
+        max_value_size: int = 1024,
+        ways: int = 8,
+        num_locks: int = 64,
+        context: Optional[BaseContext] = None,
+    ):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < ways <= 255:
+            raise ValueError("Ways must be in [1, 255]")
+        if not 0 < max_key_size <= 0xFFFF:
+            raise ValueError("Max key size must be in [1, 65535]")
+        if max_value_size <= 0:
+            raise ValueError("Max value size must be positive")
+        if num_locks <= 0:
+            raise ValueError("Number of locks must be positive")
+
+        num_buckets = -(-capacity // ways)
+        slot_size = _SLOT.size + max_key_size + max_value_size
+        size = _META_BASE + 2 * num_buckets + num_buckets * ways * slot_size
+
+        shm = SharedMemory(create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, num_buckets, ways, max_key_size, max_value_size)
+        # Locks must come from the same start method (fork/spawn) as the workers
+        context = context or multiprocessing.get_context()
+        locks = [context.Lock() for _ in range(min(num_locks, num_buckets))]
+        self._attach(shm, locks, owner=True)
+
+    def _attach(self, shm: SharedMemory, locks: list, owner: bool):
+        """
+        Read the geometry from the segment header and set up this process.
+        """
+        magic, num_buckets, ways, max_key_size, max_value_size = _HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a SharedMemoryCache segment: '{shm.name}'")
+
+        self._shm = shm
+        self._buf = shm.buf
+        self._locks = locks
+        self._owner = owner
+
+        self._num_buckets = num_buckets
+        self._ways = ways
+        self.capacity = num_buckets * ways
+        self.max_key_size = max_key_size
+        self.max_value_size = max_value_size
+        self._slot_size = _SLOT.size + max_key_size + max_value_size
+        self._slots_base = _META_BASE + 2 * num_buckets
+
+        # stats — this process only
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejections = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    # ─── Public API ────────────────────────────────────────────
+
+    def get(self, key: str | bytes) -> Optional[bytes]:
+        """
+        Get a value from the cache.
+        """
+        key_bytes, hashed, bucket = self._locate(key)
+        with self._locks[bucket % len(self._locks)]:
+            slot = self._find(bucket, hashed, key_bytes)
+            if slot < 0:
+                self._misses += 1
+                return None
+            buf = self._buf
+            buf[slot + 1] = 1  # ref bit — the only write on a hit
+            value_len = _SLOT.unpack_from(buf, slot)[3]
+            start = slot + _SLOT.size + self.max_key_size
+            value = bytes(buf[start:start + value_len])
+        self._hits += 1
+        return value
+
+    def put(self, key: str | bytes, value: bytes):
+        """
+        Put a value into the cache.
+
+        Values longer than max_value_size are rejected (and any older
+        value for the key is dropped), like LRUCache's weight limit.
+        """
+        key_bytes, hashed, bucket = self._locate(key)
+        with self._locks[bucket % len(self._locks)]:
+            slot = self._find(bucket, hashed, key_bytes)
+            if len(value) > self.max_value_size:
+                if slot >= 0:
+                    self._free(bucket, slot)
+                self._rejections += 1
+                return
+
+            ref = 1  # Overwrite counts as a use
+            if slot < 0:
+                slot = self._claim(bucket)
+                ref = 0  # New entries must be read again to earn a second chance
+
+            buf = self._buf
+            _SLOT.pack_into(buf, slot, _USED, ref, len(key_bytes), len(value), hashed)
+            key_start = slot + _SLOT.size
+            buf[key_start:key_start + len(key_bytes)] = key_bytes
+            value_start = key_start + self.max_key_size
+            buf[value_start:value_start + len(value)] = value
+
+    def delete(self, key: str | bytes) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        key_bytes, hashed, bucket = self._locate(key)
+        with self._locks[bucket % len(self._locks)]:
+            slot = self._find(bucket, hashed, key_bytes)
+            if slot < 0:
+                return False
+            self._free(bucket, slot)
+            return True
+
+    # ─── Slot internals (caller holds the bucket's lock) ───────
+
+    def _locate(self, key: str | bytes) -> tuple[bytes, int, int]:
+        """
+        Return (key bytes, stable hash, bucket index).
+        """
+        key_bytes = key.encode() if isinstance(key, str) else bytes(key)
+        if len(key_bytes) > self.max_key_size:
+            raise ValueError(f"Key longer than max_key_size ({self.max_key_size} bytes)")
+        hashed = stable_hash(key_bytes)
+        return key_bytes, hashed, hashed % self._num_buckets
+
+    def _find(self, bucket: int, hashed: int, key_bytes: bytes) -> int:
+        """
+        Offset of the slot holding key in bucket, or -1.
+        """
+        buf = self._buf
+        unpack = _SLOT.unpack_from
+        key_offset = _SLOT.size
+        slot = self._slots_base + bucket * self._ways * self._slot_size
+        for _ in range(self._ways):
+            state, _, key_len, _, slot_hash = unpack(buf, slot)
+            # Compare the 8-byte hash first — key bytes only on a real match
+            if (
+                state == _USED
+                and slot_hash == hashed
+                and buf[slot + key_offset:slot + key_offset + key_len] == key_bytes
+            ):
+                return slot
+            slot += self._slot_size
+        return -1
+
+    def _claim(self, bucket: int) -> int:
+        """
+        Offset of a slot for a new key: a free one, else the CLOCK victim.
+        """
+        buf = self._buf
+        meta = _META_BASE + 2 * bucket
+        first = self._slots_base + bucket * self._ways * self._slot_size
+
+        if buf[meta + 1] < self._ways:
+            buf[meta + 1] += 1
+            slot = first
+            while buf[slot] == _USED:
+                slot += self._slot_size
+            return slot
+
+        # Bucket full — sweep this bucket's hand
+        hand = buf[meta]
+        while True:
+            slot = first + hand * self._slot_size
+            hand = (hand + 1) % self._ways
+            if buf[slot + 1]:
+                buf[slot + 1] = 0  # Second chance
+                continue
+            buf[meta] = hand
+            self._evictions += 1
+            return slot
+
+    def _free(self, bucket: int, slot: int):
+        """
+        Mark a slot empty.
+        """
+        self._buf[slot] = _EMPTY
+        self._buf[_META_BASE + 2 * bucket + 1] -= 1
+
+    # ─── Lifecycle ─────────────────────────────────────────────
+
+    def close(self):
+        """
+        Detach this process from the segment.
+        """
+        self._buf.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroy the segment. Call once, from the creating process, after
+        every worker is done with it.
+        """
+        self._shm.unlink()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickled for a child process: segment name + the shared locks.
+        """
+        return {"name": self._shm.name, "locks": self._locks}
+
+    def __setstate__(self, state: dict[str, Any]):
+        # The creator owns the segment — children must not register it
+        # with their resource tracker, or it is unlinked when they exit
+        shm = SharedMemory(name=state["name"], track=False)
+        self._attach(shm, state["locks"], owner=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    # ─── Stats / dunder ────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the stats of the cache. Counters are for this process only.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "rejections": self._rejections,
+            "segment_bytes": self._shm.size,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        """
+        Entries across all processes (sum of bucket counts, read without locks).
+        """
+        counts = self._buf[_META_BASE + 1:_META_BASE + 2 * self._num_buckets:2]
+        return sum(counts)
+
+    def __contains__(self, key: str | bytes) -> bool:
+        """
+        Membership check that does not set the ref bit.
+        """
+        key_bytes, hashed, bucket = self._locate(key)
+        with self._locks[bucket % len(self._locks)]:
+            return self._find(bucket, hashed, key_bytes) >= 0
+
+    def __repr__(self) -> str:
+        return f"SharedMemoryCache(name={self.name!r}, capacity={self.capacity}, size={len(self)})"
+
+
+def _worker(cache: SharedMemoryCache, worker_id: int, keys: int, rounds: int):
+    """
+    Demo worker: read every key, fill in the misses.
+    """
+    for _ in range(rounds):
+        for i in range(keys):
+            key = f"user:{i}"
+            if cache.get(key) is None:
+                cache.put(key, f"profile-{i}".encode())
+    stats = cache.stats()
+    print(f"  worker {worker_id}: hits={stats['hits']:,} misses={stats['misses']:,}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    workers, keys, rounds = 4, 10_000, 3
+    with SharedMemoryCache(capacity=20_000, max_value_size=64) as cache:
+        print(f"{cache}, {cache.stats()['segment_bytes']:,} bytes")
+        print(f"{workers} workers × {rounds} rounds over {keys:,} keys — misses are paid once, not per worker:")
+        processes = [
+            multiprocessing.Process(target=_worker, args=(cache, n, keys, rounds)) for n in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        print(f"shared size after run: {len(cache):,}")
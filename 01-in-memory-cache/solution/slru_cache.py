@@ -0,0 +1,164 @@
+"""
+Segmented LRU Cache (SLRU) — cheap scan resistance with two LRU lists.
+
+Plain LRU puts every new key at the head, so a scan of one-off keys
+pushes out everything. SLRU makes a key earn its place:
+
+    new key ──► PROBATION (LRU) ──second hit──► PROTECTED (LRU)
+                    │    ▲                          │
+              evict │    └────── demote LRU ────────┘
+                    ▼        (when protected overflows)
+
+    - New keys enter the probationary segment
+    - A hit in probation promotes the key to the protected segment
+    - If protected exceeds its share, its LRU entry is demoted back to
+      the head of probation (it gets one more chance, not evicted)
+    - Eviction always takes probation's tail first
+
+A scan only churns the probationary segment; keys that were hit twice
+stay protected. protected_ratio sets the split (0.8 = 80% protected).
+
+Both segments are DoublyLinkedLists; every step is O(1).
+"""
+
+from typing import Any, Optional
+
+from doubly_linked_list import DoublyLinkedList
+from models import Node
+
+
+class SegmentedLRUCache:
+    """
+    Segmented LRU with probationary and protected segments.
+    """
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 <= protected_ratio < 1:
+            raise ValueError("Protected ratio must be in [0, 1)")
+
+        self.capacity = capacity
+        self.protected_capacity = int(capacity * protected_ratio)
+
+        self._probation = DoublyLinkedList()
+        self._protected = DoublyLinkedList()
+        # key → (node, segment that holds it)
+        self._map: dict[str, tuple[Node, DoublyLinkedList]] = {}
+
+        # stats
+        self._probation_hits = 0
+        self._protected_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._promotions = 0
+        self._demotions = 0
+
+    def _touch(self, node: Node, segment: DoublyLinkedList):
+        """
+        Record a hit: promote from probation, or refresh within protected.
+        """
+        if segment is self._protected:
+            self._protected.move_to_head(node)
+            return
+
+        self._probation.remove(node)
+        if self.protected_capacity == 0:
+            # Degenerate split — behave like plain LRU
+            self._probation.add_to_head(node)
+            return
+
+        self._protected.add_to_head(node)
+        self._map[node.key] = (node, self._protected)
+        self._promotions += 1
+
+        # Protected overflow — demote its LRU back to probation's head
+        if len(self._protected) > self.protected_capacity:
+            demoted = self._protected.remove_tail()
+            self._probation.add_to_head(demoted)
+            self._map[demoted.key] = (demoted, self._probation)
+            self._demotions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        node, segment = entry
+        if segment is self._protected:
+            self._protected_hits += 1
+        else:
+            self._probation_hits += 1
+        self._touch(node, segment)
+        return node.value
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache.
+        """
+        # Case 1: Key already exists — update value, counts as a hit
+        entry = self._map.get(key)
+        if entry is not None:
+            node, segment = entry
+            node.value = value
+            self._touch(node, segment)
+            return
+
+        # Case 2: Full — evict probation's LRU (protected's if probation is empty)
+        if len(self._map) >= self.capacity:
+            segment = self._probation if not self._probation.is_empty() else self._protected
+            victim = segment.remove_tail()
+            del self._map[victim.key]
+            self._evictions += 1
+
+        # Case 3: New key — starts on probation
+        node = Node(key, value)
+        self._probation.add_to_head(node)
+        self._map[key] = (node, self._probation)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from the cache.
+        """
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return False
+        node, segment = entry
+        segment.remove(node)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the stats of the cache, with per-segment occupancy and hits.
+        """
+        hits = self._probation_hits + self._protected_hits
+        total = hits + self._misses
+        return {
+            "size": len(self._map),
+            "capacity": self.capacity,
+            "hits": hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "probation_size": len(self._probation),
+            "protected_size": len(self._protected),
+            "protected_capacity": self.protected_capacity,
+            "probation_hits": self._probation_hits,
+            "protected_hits": self._protected_hits,
+            "promotions": self._promotions,
+            "demotions": self._demotions,
+            "hit_rate": f"{(hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._map
+
+    def __repr__(self) -> str:
+        return (
+            f"SegmentedLRUCache(capacity={self.capacity}, "
+            f"probation={self._probation}, protected={self._protected})"
+        )
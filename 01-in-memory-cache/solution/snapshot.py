@@ -0,0 +1,207 @@
+"""
+Cache snapshots — a compact binary file for warm restarts.
+
+LRUCache.dump(path) / LRUCache.load(path) use these two functions. A
+restarted process loads the previous process's hot set instead of
+sending every first request to the backend.
+
+FILE FORMAT (all integers little-endian):
+
+    b"LRUSNAP\\x01"                              ← 8-byte magic + version
+    record, record, record, ...                 ← most recent FIRST, until EOF
+
+    record:
+        key_tag    u8   ┐
+        value_tag  u8   │ 10-byte header (struct "<BBII")
+        key_len    u32  │
+        value_len  u32  ┘
+        [ttl       f64] ← only if value_tag has the TTL flag (0x80):
+                          seconds the entry had LEFT when it was dumped
+        key bytes
+        value bytes
+
+    tags: str → UTF-8, bytes → raw, int → signed two's complement,
+          float → f64, None/True/False → empty, anything else → pickle
+
+Most-recent-first means a loader that runs out of room simply stops —
+what it keeps is exactly the hottest part of the snapshot.
+
+TTLs are stored as time REMAINING, not as deadlines: LRUCache deadlines
+come from time.monotonic(), which means nothing in another process.
+
+NEW CONCEPT — struct:
+    Packs Python numbers into fixed-layout bytes and back.
+    struct.Struct("<BBII") compiles the layout once; unpack_from(buf, pos)
+    reads it straight out of a buffer at an offset, no slicing needed.
+"""
+
+import os
+import pickle
+import struct
+from typing import Any, Iterable, Iterator, Optional
+
+MAGIC = b"LRUSNAP\x01"
+
+_HEADER = struct.Struct("<BBII")
+_TTL = struct.Struct("<d")
+_FLOAT = struct.Struct("<d")
+
+_STR, _BYTES, _INT, _FLOAT_TAG, _NONE, _TRUE, _FALSE, _PICKLE = range(8)
+_TTL_FLAG = 0x80
+
+# Writes are buffered and flushed in chunks this big
+_WRITE_CHUNK = 1 << 16
+_READ_CHUNK = 1 << 20
+
+
+def encode_value(obj: Any) -> tuple[int, bytes]:
+    """
+    Return (tag, payload) for one key or value. Also used by disk_tier.py.
+    """
+    kind = type(obj)
+    if kind is str:
+        return _STR, obj.encode()
+    if kind is bytes:
+        return _BYTES, obj
+    if kind is int:
+        return _INT, obj.to_bytes(obj.bit_length() // 8 + 1, "little", signed=True)
+    if kind is float:
+        return _FLOAT_TAG, _FLOAT.pack(obj)
+    if obj is None:
+        return _NONE, b""
+    if obj is True:
+        return _TRUE, b""
+    if obj is False:
+        return _FALSE, b""
+    return _PICKLE, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_value(tag: int, payload: bytes) -> Any:
+    """
+    Inverse of encode_value.
+    """
+    if tag == _STR:
+        return payload.decode()
+    if tag == _BYTES:
+        return payload
+    if tag == _INT:
+        return int.from_bytes(payload, "little", signed=True)
+    if tag == _FLOAT_TAG:
+        return _FLOAT.unpack(payload)[0]
+    if tag == _NONE:
+        return None
+    if tag == _TRUE:
+        return True
+    if tag == _FALSE:
+        return False
+    if tag == _PICKLE:
+        return pickle.loads(payload)
+    raise ValueError(f"Unknown value tag: {tag}")
+
+
+def write_snapshot(path: str, entries: Iterable[tuple[Any, Any, Optional[float]]]) -> int:
+    """
+    Write (key, value, remaining_ttl) entries, most recent first.
+    Returns how many were written.
+
+    entries is consumed lazily and written in chunks, so a cache of
+    millions of entries never exists twice in memory. The file is
+    written next to path and renamed into place, so a crash mid-dump
+    never leaves a half-written snapshot behind; if writing fails, the
+    temporary file is removed and the error re-raised.
+    """
+    pack_header = _HEADER.pack
+    pack_ttl = _TTL.pack
+    tmp_path = f"{path}.tmp"
+    count = 0
+    try:
+        with open(tmp_path, "wb") as file:
+            buf = bytearray(MAGIC)
+            for key, value, ttl in entries:
+                key_tag, key_bytes = encode_value(key)
+                value_tag, value_bytes = encode_value(value)
+                if ttl is None:
+                    buf += pack_header(key_tag, value_tag, len(key_bytes), len(value_bytes))
+                else:
+                    buf += pack_header(key_tag, value_tag | _TTL_FLAG, len(key_bytes), len(value_bytes))
+                    buf += pack_ttl(ttl)
+                buf += key_bytes
+                buf += value_bytes
+                count += 1
+                if len(buf) >= _WRITE_CHUNK:
+                    file.write(buf)
+                    buf.clear()
+            file.write(buf)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Unpicklable value, full disk, ... — don't leave the partial file
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return count
+
+
+def read_snapshot(path: str) -> Iterator[tuple[Any, Any, Optional[float]]]:
+    """
+    Yield (key, value, remaining_ttl) entries, most recent first.
+
+    The file is read in 1 MiB chunks; records are decoded straight out
+    of each chunk with unpack_from.
+    """
+    unpack_header = _HEADER.unpack_from
+    unpack_ttl = _TTL.unpack_from
+    header_size = _HEADER.size
+    ttl_size = _TTL.size
+    from_bytes = int.from_bytes
+
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not an LRU snapshot: '{path}'")
+
+        buf = b""
+        while True:
+            chunk = file.read(_READ_CHUNK)
+            buf += chunk
+            end = len(buf)
+            pos = 0
+            while end - pos >= header_size:
+                key_tag, value_tag, key_len, value_len = unpack_header(buf, pos)
+                start = pos + header_size
+                ttl = None
+                if value_tag & _TTL_FLAG:
+                    if start + ttl_size > end:
+                        break
+                    ttl = unpack_ttl(buf, start)[0]
+                    start += ttl_size
+                    value_tag &= ~_TTL_FLAG
+                key_end = start + key_len
+                value_end = key_end + value_len
+                if value_end > end:
+                    break  # Record continues in the next chunk
+
+                # The common tags are inlined — this loop bounds load speed
+                if key_tag == _STR:
+                    key = buf[start:key_end].decode()
+                elif key_tag == _INT:
+                    key = from_bytes(buf[start:key_end], "little", signed=True)
+                else:
+                    key = decode_value(key_tag, buf[start:key_end])
+                if value_tag == _STR:
+                    value = buf[key_end:value_end].decode()
+                elif value_tag == _INT:
+                    value = from_bytes(buf[key_end:value_end], "little", signed=True)
+                elif value_tag == _BYTES:
+                    value = buf[key_end:value_end]
+                else:
+                    value = decode_value(value_tag, buf[key_end:value_end])
+
+                yield key, value, ttl
+                pos = value_end
+
+            buf = buf[pos:]
+            if not chunk:
+                if buf:
+                    raise ValueError(f"Truncated snapshot: '{path}'")
+                return
@@ -0,0 +1,586 @@
+import multiprocessing
+
+from arc_cache import ARCCache
+from array_lru_cache import ArrayLRUCache
+from clock_cache import ClockCache
+from count_min_sketch import CountMinSketch
+from lfu_cache import LFUCache
+from s3fifo_cache import S3FIFOCache
+from sharded_lru_cache import ShardedLRUCache
+from shared_memory_cache import SharedMemoryCache
+from slru_cache import SegmentedLRUCache
+from tinylfu_cache import TinyLFUCache
+
+
+class TestArrayLRUCache:
+    """ArrayLRUCache must behave exactly like LRUCache."""
+
+    def test_put_get_update(self):
+        cache = ArrayLRUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = ArrayLRUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)  # Should evict 'b'
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_delete_reuses_free_slot(self):
+        cache = ArrayLRUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        cache.put("c", 3)  # Fills the freed slot, no eviction
+
+        assert cache.stats()["evictions"] == 0
+        assert "b" in cache and "c" in cache
+        assert "a" not in cache
+
+    def test_capacity_one(self):
+        cache = ArrayLRUCache(capacity=1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_matches_lru_cache_on_random_ops(self):
+        import random
+        from lru_cache import LRUCache
+
+        rng = random.Random(7)
+        expected, actual = LRUCache(capacity=8), ArrayLRUCache(capacity=8)
+        for _ in range(2000):
+            key = str(rng.randrange(20))
+            op = rng.random()
+            if op < 0.5:
+                assert actual.get(key) == expected.get(key)
+            elif op < 0.9:
+                expected.put(key, op)
+                actual.put(key, op)
+            else:
+                assert actual.delete(key) == expected.delete(key)
+        assert len(actual) == len(expected)
+
+    def test_capacity_validation(self):
+        try:
+            ArrayLRUCache(capacity=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+class TestShardedLRUCache:
+    """ShardedLRUCache spreads keys over locked LRUCache shards."""
+
+    def test_put_get_delete(self):
+        cache = ShardedLRUCache(capacity=16, num_shards=4)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert cache.delete("a") is True
+        assert "a" not in cache
+
+    def test_capacity_is_split_across_shards(self):
+        cache = ShardedLRUCache(capacity=10, num_shards=4)
+        assert sum(shard.capacity for shard in cache._shards) == 10
+        for i in range(100):
+            cache.put(f"k{i}", i)
+        assert len(cache) == 10
+
+    def test_never_more_shards_than_capacity(self):
+        cache = ShardedLRUCache(capacity=2, num_shards=8)
+        assert cache.num_shards == 2
+
+    def test_aggregated_stats(self):
+        cache = ShardedLRUCache(capacity=100, num_shards=8)
+        for i in range(10):
+            cache.put(f"k{i}", i)
+        for i in range(20):
+            cache.get(f"k{i}")
+
+        stats = cache.stats()
+        assert stats["size"] == 10
+        assert stats["hits"] == 10
+        assert stats["misses"] == 10
+        assert stats["hit_rate"] == "50.0%"
+
+    def test_concurrent_access(self):
+        import threading
+
+        cache = ShardedLRUCache(capacity=1000, num_shards=8)
+
+        def work(offset):
+            for i in range(2000):
+                cache.put(f"k{(i + offset) % 500}", i)
+                cache.get(f"k{i % 500}")
+
+        threads = [threading.Thread(target=work, args=(t * 37,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 500
+        assert cache.stats()["hits"] + cache.stats()["misses"] == 8 * 2000
+
+
+class TestClockCache:
+    """ClockCache gives referenced entries a second chance."""
+
+    def test_put_get_delete(self):
+        cache = ClockCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert len(cache) == 0
+
+    def test_unreferenced_entry_evicted_first(self):
+        cache = ClockCache(capacity=3)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.get("a")
+        cache.get("c")
+        cache.put("d", 4)  # 'b' is the only entry without a reference bit
+
+        assert "b" not in cache
+        assert all(key in cache for key in ("a", "c", "d"))
+        assert cache.stats()["evictions"] == 1
+
+    def test_second_chance_clears_bits(self):
+        cache = ClockCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)  # Both referenced — sweep clears both, evicts 'a'
+
+        assert "a" not in cache
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_delete_frees_slot(self):
+        cache = ClockCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.delete("a")
+        cache.put("c", 3)
+        assert cache.stats()["evictions"] == 0
+        assert len(cache) == 2
+
+    def test_size_never_exceeds_capacity(self):
+        cache = ClockCache(capacity=10)
+        for i in range(1000):
+            cache.put(i % 37, i)
+            cache.get(i % 11)
+        assert len(cache) == 10
+
+
+class TestLFUCache:
+    """LFUCache evicts the least frequently used key, LRU among ties."""
+
+    def test_evicts_least_frequent(self):
+        cache = LFUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)  # 'b' (freq 2) loses to 'a' (freq 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_lru_tie_breaking(self):
+        cache = LFUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)  # Both freq 1 — 'a' is least recent
+
+        assert "a" not in cache
+        assert "b" in cache and "c" in cache
+
+    def test_update_counts_as_access(self):
+        cache = LFUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("a", 10)
+        cache.put("b", 2)
+        cache.put("c", 3)  # 'b' has freq 1, 'a' has freq 2
+
+        assert cache.frequency("a") == 2
+        assert cache.get("a") == 10
+        assert "b" not in cache
+
+    def test_delete_keeps_min_frequency_consistent(self):
+        cache = LFUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("b")
+        cache.delete("a")  # freq-1 bucket disappears
+        cache.put("c", 3)
+        cache.put("d", 4)  # Evicts 'c' (freq 1), not 'b' (freq 2)
+
+        assert "b" in cache and "d" in cache
+        assert cache.stats()["min_frequency"] == 1
+
+    def test_empty_buckets_are_dropped(self):
+        cache = LFUCache(capacity=3)
+        cache.put("a", 1)
+        for _ in range(5):
+            cache.get("a")
+        assert len(cache._buckets) == 1
+
+
+class TestCountMinSketch:
+    """CountMinSketch estimates frequencies and ages them."""
+
+    def test_estimates_never_undercount(self):
+        sketch = CountMinSketch(capacity=64)
+        for i in range(10):
+            for _ in range(i):
+                sketch.increment(f"k{i}")
+        for i in range(10):
+            assert sketch.estimate(f"k{i}") >= i
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(capacity=16)
+        for _ in range(100):
+            sketch.increment("hot")
+        assert sketch.estimate("hot") == 15
+
+    def test_reset_halves_counters(self):
+        sketch = CountMinSketch(capacity=16, sample_factor=1000)
+        for _ in range(8):
+            sketch.increment("a")
+        sketch.reset()
+        assert sketch.estimate("a") == 4
+
+    def test_fixed_memory(self):
+        assert CountMinSketch(capacity=1000, depth=4).memory_bytes == 4096 * 4
+        assert CountMinSketch(capacity=1000, depth=4, width_factor=1).memory_bytes == 1024 * 4
+
+    def test_several_counters_per_entry_keep_collisions_rare(self):
+        sketch = CountMinSketch(capacity=1000, sample_factor=1000)
+        for i in range(1000):
+            sketch.increment(f"k{i}")
+        overcounted = sum(sketch.estimate(f"k{i}") > 1 for i in range(1000))
+        assert overcounted < 20  # ~150 with one counter per entry
+
+
+class TestTinyLFUCache:
+    """TinyLFUCache only admits candidates more popular than the victim."""
+
+    def test_put_get_delete(self):
+        cache = TinyLFUCache(capacity=10)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert cache.delete("a") is True
+        assert "a" not in cache
+
+    def test_regions_add_up_to_capacity(self):
+        for capacity, ratio in ((2, 0.01), (3, 0.5), (100, 0.01), (10, 0.99)):
+            cache = TinyLFUCache(capacity=capacity, window_ratio=ratio)
+            assert cache._window.capacity + cache._main.capacity == capacity
+            for i in range(capacity * 5):
+                cache.put(i, i)
+                cache.get(i)
+            assert len(cache) <= capacity
+        for bad in (0, 1):
+            try:
+                TinyLFUCache(capacity=bad)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+    def test_scan_resistance_beats_lru(self):
+        from lru_cache import LRUCache
+
+        hot = [f"hot{i}" for i in range(20)]
+        trace = []
+        for i in range(5000):  # One-off scan keys, a hot key every 5th request
+            trace.append(f"scan{i}")
+            if i % 5 == 0:
+                trace.append(hot[(i // 5) % 20])
+
+        hits = {}
+        for cache in (LRUCache(capacity=100), TinyLFUCache(capacity=100, window_ratio=0.1)):
+            for key in trace:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+            hits[type(cache).__name__] = cache.stats()["hits"]
+            assert len(cache) == 100
+
+        assert hits["LRUCache"] == 0  # Reuse distance 120 > capacity
+        assert hits["TinyLFUCache"] > 900
+
+    def test_size_never_exceeds_capacity(self):
+        cache = TinyLFUCache(capacity=20)
+        for i in range(500):
+            cache.put(i % 53, i)
+            cache.get(i % 7)
+        assert len(cache) <= 20
+
+
+class TestARCCache:
+    """ARCCache balances recency (T1) and frequency (T2) adaptively."""
+
+    def test_put_get_delete(self):
+        cache = ARCCache(capacity=2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert len(cache) == 0
+
+    def test_second_access_promotes_to_t2(self):
+        cache = ARCCache(capacity=4)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        stats = cache.stats()
+        assert stats["t1"] == 1 and stats["t2"] == 1
+
+    def test_evicted_keys_become_ghosts(self):
+        cache = ARCCache(capacity=2)
+        cache.put("a", 1)
+        cache.get("a")     # 'a' in T2
+        cache.put("b", 2)
+        cache.put("c", 3)  # |T1| > p — 'b' demoted to B1
+
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.stats()["b1"] == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_b1_ghost_hit_grows_p(self):
+        cache = ARCCache(capacity=2)
+        cache.put("a", 1)
+        cache.get("a")       # 'a' in T2
+        cache.put("b", 2)
+        cache.put("c", 3)    # 'b' → B1
+        assert cache.stats()["p"] == 0
+        cache.put("b", 20)   # Ghost hit in B1
+
+        assert cache.stats()["p"] == 1
+        assert cache.stats()["ghost_hits"] == 1
+        assert cache.get("b") == 20
+
+    def test_scan_keeps_frequent_keys(self):
+        cache = ARCCache(capacity=10)
+        for _ in range(3):
+            for i in range(5):
+                if cache.get(f"hot{i}") is None:
+                    cache.put(f"hot{i}", i)
+        for i in range(1000):
+            cache.put(f"scan{i}", i)
+
+        assert all(f"hot{i}" in cache for i in range(5))
+
+    def test_invariants_under_random_ops(self):
+        import random
+
+        rng = random.Random(3)
+        cache = ARCCache(capacity=16)
+        for _ in range(5000):
+            key = rng.randrange(64)
+            op = rng.random()
+            if op < 0.5:
+                cache.get(key)
+            elif op < 0.9:
+                cache.put(key, key)
+            else:
+                cache.delete(key)
+            stats = cache.stats()
+            assert stats["t1"] + stats["t2"] <= 16
+            assert stats["t1"] + stats["t2"] + stats["b1"] + stats["b2"] <= 32
+            assert 0 <= stats["p"] <= 16
+
+
+class TestSegmentedLRUCache:
+    """SegmentedLRUCache promotes on second hit and evicts from probation."""
+
+    def test_put_get_delete(self):
+        cache = SegmentedLRUCache(capacity=4)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert len(cache) == 0
+
+    def test_second_hit_promotes(self):
+        cache = SegmentedLRUCache(capacity=4, protected_ratio=0.5)
+        cache.put("a", 1)
+        assert cache.stats()["probation_size"] == 1
+        cache.get("a")
+        stats = cache.stats()
+        assert stats["protected_size"] == 1
+        assert stats["probation_hits"] == 1
+        cache.get("a")
+        assert cache.stats()["protected_hits"] == 1
+
+    def test_protected_overflow_demotes(self):
+        cache = SegmentedLRUCache(capacity=4, protected_ratio=0.5)
+        for key in "abc":
+            cache.put(key, key)
+            cache.get(key)  # Each promoted; 'a' demoted when 'c' arrives
+
+        stats = cache.stats()
+        assert stats["protected_size"] == 2
+        assert stats["demotions"] == 1
+        assert "a" in cache  # Demoted, not evicted
+
+    def test_scan_only_churns_probation(self):
+        cache = SegmentedLRUCache(capacity=10, protected_ratio=0.5)
+        for key in range(5):
+            cache.put(key, key)
+            cache.get(key)
+        for key in range(100, 1000):
+            cache.put(key, key)
+
+        assert all(key in cache for key in range(5))
+        assert len(cache) == 10
+
+    def test_zero_protected_ratio_is_plain_lru(self):
+        cache = SegmentedLRUCache(capacity=2, protected_ratio=0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert "a" in cache
+
+
+class TestS3FIFOCache:
+    """S3FIFOCache filters one-hit wonders through a small FIFO queue."""
+
+    def test_put_get_delete(self):
+        cache = S3FIFOCache(capacity=10)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+
+    def test_one_hit_wonders_go_to_ghost(self):
+        cache = S3FIFOCache(capacity=10)
+        for i in range(20):
+            cache.put(i, i)
+
+        stats = cache.stats()
+        assert stats["size"] == 10
+        assert stats["ghost_size"] > 0
+        assert stats["promotions"] == 0
+
+    def test_ghost_hit_enters_main(self):
+        cache = S3FIFOCache(capacity=10)
+        for i in range(20):
+            cache.put(i, i)
+        cache.put(9, 9)  # 9 is a ghost — goes straight to M
+
+        assert 9 in cache
+        assert cache.stats()["ghost_hits"] == 1
+        assert cache.stats()["main_size"] >= 1
+
+    def test_frequent_keys_survive_scan(self):
+        cache = S3FIFOCache(capacity=20)
+        for _ in range(3):
+            for key in range(5):
+                if cache.get(f"hot{key}") is None:
+                    cache.put(f"hot{key}", key)
+        for i in range(2000):
+            cache.put(f"scan{i}", i)
+            if i % 10 == 0:
+                cache.get(f"hot{i % 5}")
+
+        assert all(f"hot{key}" in cache for key in range(5))
+
+    def test_size_never_exceeds_capacity(self):
+        import random
+
+        rng = random.Random(5)
+        cache = S3FIFOCache(capacity=16)
+        for _ in range(5000):
+            key = rng.randrange(64)
+            if cache.get(key) is None:
+                cache.put(key, key)
+            if rng.random() < 0.05:
+                cache.delete(rng.randrange(64))
+            assert len(cache) <= 16
+
+
+def _fill_from_child(cache, keys):
+    for key in keys:
+        cache.put(key, key.encode() * 2)
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    """SharedMemoryCache keeps bytes in a shared segment with per-bucket CLOCK."""
+
+    def test_put_get_update_delete(self):
+        with SharedMemoryCache(capacity=16, max_value_size=16) as cache:
+            cache.put("a", b"1")
+            cache.put(b"b", b"2")
+            cache.put("a", b"one")
+            assert cache.get("a") == b"one"
+            assert cache.get("b") == b"2"
+            assert cache.get("missing") is None
+            assert len(cache) == 2
+            assert cache.delete("a") is True
+            assert cache.delete("a") is False
+            assert "a" not in cache and "b" in cache
+
+    def test_oversized_value_is_rejected(self):
+        with SharedMemoryCache(capacity=8, max_value_size=4) as cache:
+            cache.put("k", b"tiny")
+            cache.put("k", b"too large")
+            assert cache.get("k") is None
+            assert cache.stats()["rejections"] == 1
+            try:
+                cache.put("x" * 100, b"v")
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+    def test_clock_eviction_within_bucket(self):
+        # One bucket of 4 ways — every key competes for the same slots
+        with SharedMemoryCache(capacity=4, ways=4) as cache:
+            for key in "abcd":
+                cache.put(key, key.encode())
+            cache.get("a")
+            cache.get("c")
+            cache.put("e", b"e")  # Sweep: a, c keep their second chance; b evicted
+
+            assert cache.get("b") is None
+            assert cache.get("a") == b"a" and cache.get("c") == b"c"
+            assert len(cache) == 4
+            assert cache.stats()["evictions"] == 1
+
+    def test_visible_across_processes(self):
+        keys = [f"k{i}" for i in range(50)]
+        # spawn pickles the cache: the child attaches by segment name
+        ctx = multiprocessing.get_context("spawn")
+        with SharedMemoryCache(capacity=256, max_value_size=16, context=ctx) as cache:
+            child = ctx.Process(target=_fill_from_child, args=(cache, keys))
+            child.start()
+            child.join(timeout=60)
+            assert child.exitcode == 0
+            assert all(cache.get(key) == key.encode() * 2 for key in keys)
@@ -0,0 +1,912 @@
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from async_lru_cache import AsyncLRUCache
+from backing_store import SQLiteStore
+from cache_client import CacheClient
+from cache_server import CacheServer
+from disk_tier import DiskTier
+from loading_cache import LoadingCache
+from lru_cache import LRUCache
+from memoize import cached, lock_for
+from persistent_cache import PersistentCache
+from removal_listener import BLOCK, DELETED, DROP_OLDEST, EVICTED, EXPIRED, REPLACED, RemovalDispatcher
+from resp import ResponseError, encode_command, parse_command, parse_reply
+from tiered_cache import TieredCache
+
+
+class TestCachedDecorator:
+    """@cached memoizes through an LRUCache with single-flight loading."""
+
+    def test_memoizes_results(self):
+        calls = []
+
+        @cached(cache=LRUCache(capacity=10))
+        def square(n):
+            calls.append(n)
+            return n * n
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        assert square.stats()["hits"] == 1
+
+    def test_kwargs_and_none_results(self):
+        calls = []
+
+        @cached()
+        def lookup(a, b=0):
+            calls.append((a, b))
+            return None
+
+        assert lookup(1, b=2) is None
+        assert lookup(1, b=2) is None
+        assert lookup(1, b=3) is None
+        assert calls == [(1, 2), (1, 3)]
+
+    def test_concurrent_calls_are_coalesced(self):
+        calls = []
+        started = threading.Barrier(8)
+
+        @cached(cache=LRUCache(capacity=10))
+        def slow(n):
+            calls.append(n)
+            time.sleep(0.1)
+            return n
+
+        def call():
+            started.wait()
+            assert slow(5) == 5
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [5]
+        assert slow.stats()["coalesced"] + slow.stats()["hits"] == 7
+
+    def test_errors_are_not_cached(self):
+        attempts = []
+
+        @cached()
+        def flaky(n):
+            attempts.append(n)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return n
+
+        try:
+            flaky(1)
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError:
+            pass
+        assert flaky(1) == 1
+        assert flaky.stats()["errors"] == 1
+
+    def test_shared_cache_with_namespaces(self):
+        shared = LRUCache(capacity=10)
+
+        @cached(cache=shared, namespace="double")
+        def double(n):
+            return n * 2
+
+        @cached(cache=shared, namespace="triple")
+        def triple(n):
+            return n * 3
+
+        assert double(2) == 4
+        assert triple(2) == 6
+        assert len(shared) == 2
+
+    def test_invalidate(self):
+        calls = []
+
+        @cached()
+        def ident(n):
+            calls.append(n)
+            return n
+
+        ident(1)
+        assert ident.invalidate(1) is True
+        ident(1)
+        assert calls == [1, 1]
+
+    def test_shared_cache_is_thread_safe(self):
+        shared = LRUCache(capacity=50)
+
+        @cached(cache=shared, namespace="f")
+        def f(n):
+            return n
+
+        @cached(cache=shared, namespace="g")
+        def g(n):
+            return -n
+
+        def hammer(seed):
+            for i in range(3000):
+                n = (i * 7 + seed) % 200
+                assert f(n) == n and g(n) == -n
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads often to expose races
+        try:
+            threads = [threading.Thread(target=hammer, args=(seed,)) for seed in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert len(shared._map) == len(shared._list) == 50
+        assert lock_for(shared) is lock_for(shared)
+
+
+class TestAsyncLRUCache:
+    """AsyncLRUCache coalesces concurrent async loads per key."""
+
+    def test_concurrent_loads_are_coalesced(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            results = await asyncio.gather(*(cache.get_or_load("k", fetch) for _ in range(10)))
+            assert results == ["value"] * 10
+            assert cache.get("k") == "value"  # Synchronous hit path
+            return cache.stats()
+
+        stats = asyncio.run(main())
+        assert calls == [1]
+        assert stats["loads"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["inflight"] == 0
+
+    def test_failed_load_is_not_cached(self):
+        async def boom():
+            raise RuntimeError("backend down")
+
+        async def ok():
+            return 42
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            results = await asyncio.gather(
+                cache.get_or_load("k", boom), cache.get_or_load("k", boom), return_exceptions=True
+            )
+            assert all(isinstance(r, RuntimeError) for r in results)
+            assert "k" not in cache
+            assert await cache.get_or_load("k", ok) == 42
+            return cache.stats()
+
+        assert asyncio.run(main())["load_failures"] == 1
+
+    def test_cancelling_one_waiter_keeps_shared_load(self):
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            first = asyncio.create_task(cache.get_or_load("k", slow))
+            second = asyncio.create_task(cache.get_or_load("k", slow))
+            await asyncio.sleep(0)
+            first.cancel()
+            assert await second == "done"
+            assert first.cancelled()
+            assert cache.get("k") == "done"
+
+        asyncio.run(main())
+
+    def test_cancelling_last_waiter_cancels_load(self):
+        started, finished = [], []
+
+        async def slow():
+            started.append(1)
+            await asyncio.sleep(10)
+            finished.append(1)
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            waiter = asyncio.create_task(cache.get_or_load("k", slow))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0.01)
+            assert cache.stats()["inflight"] == 0
+
+        asyncio.run(main())
+        assert started == [1] and finished == []
+
+    def test_caller_after_cancel_starts_fresh_load(self):
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "fresh"
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            waiter = asyncio.create_task(cache.get_or_load("k", slow))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)  # Waiter cancels the load; the load task has not run yet
+            assert await cache.get_or_load("k", fast) == "fresh"
+            assert cache.stats()["loads"] == 2
+
+        asyncio.run(main())
+
+    def test_delete_during_load_discards_result(self):
+        async def slow():
+            await asyncio.sleep(0.01)
+            return "stale"
+
+        async def main():
+            cache = AsyncLRUCache(capacity=10)
+            task = asyncio.create_task(cache.get_or_load("k", slow))
+            await asyncio.sleep(0)
+            cache.delete("k")
+            assert await task == "stale"
+            assert "k" not in cache
+
+        asyncio.run(main())
+
+
+class TestLoadingCache:
+    """LoadingCache serves stale values while refreshing in the background."""
+
+    def test_miss_loads_synchronously(self):
+        with LoadingCache(lambda key: key.upper(), capacity=10, refresh_after=60) as cache:
+            assert cache.get("a") == "A"
+            assert cache.get("a") == "A"
+            assert cache.stats()["loads"] == 1
+
+    def test_stale_get_returns_old_value_and_refreshes(self):
+        now = [0.0]
+        version = [1]
+        release = threading.Event()
+
+        def loader(key):
+            if version[0] > 1:
+                release.wait(5)
+            return f"{key}-v{version[0]}"
+
+        cache = LoadingCache(loader, capacity=10, refresh_after=10, clock=lambda: now[0])
+        assert cache.get("k") == "k-v1"
+
+        now[0] = 11
+        version[0] = 2
+        for _ in range(20):  # Many stale reads — one refresh
+            assert cache.get("k") == "k-v1"
+        assert cache.stats()["refresh_pending"] == 1
+
+        release.set()
+        cache.close()
+        assert cache.get("k") == "k-v2"
+        stats = cache.stats()
+        assert stats["refreshes"] == 1
+        assert stats["refresh_max_ms"] >= 0
+
+    def test_failed_refresh_keeps_old_value(self):
+        now = [0.0]
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            if len(calls) > 1:
+                raise RuntimeError("backend down")
+            return "v1"
+
+        cache = LoadingCache(loader, capacity=10, refresh_after=10, clock=lambda: now[0])
+        cache.get("k")
+        now[0] = 20
+        assert cache.get("k") == "v1"
+        cache.close()
+        assert cache.get("k") == "v1"
+        assert cache.stats()["refresh_failures"] == 1
+
+    def test_refresh_does_not_overwrite_newer_put(self):
+        now = [0.0]
+        calls = []
+        release = threading.Event()
+
+        def loader(key):
+            calls.append(key)
+            if len(calls) > 1:
+                release.wait(5)
+            return f"load{len(calls)}"
+
+        cache = LoadingCache(loader, capacity=10, refresh_after=10, clock=lambda: now[0])
+        cache.get("k")
+        now[0] = 20
+        assert cache.get("k") == "load1"  # schedules the refresh
+        cache.put("k", "newer")
+        release.set()
+        cache.close()
+        assert cache.get("k") == "newer"
+        assert cache.stats()["refreshes"] == 1
+
+    def test_refresh_does_not_resurrect_expired_entry(self):
+        now = [0.0]
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def loader(key):
+            calls.append(key)
+            if len(calls) > 1:
+                started.set()
+                release.wait(5)
+            return f"load{len(calls)}"
+
+        cache = LoadingCache(loader, capacity=10, refresh_after=10, expire_after=30, clock=lambda: now[0])
+        cache.get("k")
+        now[0] = 20
+        cache.get("k")
+        assert started.wait(5)
+        now[0] = 40  # past expire_after while the refresh is running
+        release.set()
+        cache.close()
+        assert cache._cache.peek("k") is None
+        assert cache.get("k") == "load3"
+
+    def test_expire_after_must_exceed_refresh_after(self):
+        try:
+            LoadingCache(lambda key: key, capacity=1, refresh_after=10, expire_after=5)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+class _GatedStore(SQLiteStore):
+    """
+    SQLiteStore whose first store_many (or load, after reading) blocks
+    until released.
+    """
+    def __init__(self, gate_loads: bool = False):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self._gate_loads = gate_loads
+
+    def _gate(self):
+        if not self.entered.is_set():
+            self.entered.set()
+            self.release.wait(5)
+
+    def load(self, key):
+        value = super().load(key)
+        if self._gate_loads:
+            self._gate()
+        return value
+
+    def store_many(self, items):
+        items = list(items)
+        if not self._gate_loads and items:
+            self._gate()
+        super().store_many(items)
+
+
+class _FlakyStore(SQLiteStore):
+    """
+    SQLiteStore whose first `failures` store_many calls raise.
+    """
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def store_many(self, items):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("store unavailable")
+        super().store_many(items)
+
+
+class TestPersistentCache:
+    """PersistentCache writes through or behind to a SQLiteStore."""
+
+    def test_write_through_reaches_store_immediately(self):
+        store = SQLiteStore()
+        cache = PersistentCache(store, capacity=10)
+        cache.put("a", {"n": 1})
+        assert store.load("a") == {"n": 1}
+        cache.delete("a")
+        assert store.load("a") is None
+
+    def test_read_through_loads_misses(self):
+        store = SQLiteStore()
+        store.store_many([("a", 1)])
+        cache = PersistentCache(store, capacity=10)
+        assert cache.get("a") == 1
+        assert cache.get("a") == 1
+        assert cache.stats()["loads"] == 1
+
+    def test_write_behind_coalesces_into_one_flush(self):
+        store = SQLiteStore()
+        cache = PersistentCache(store, capacity=10, mode="write-behind", flush_interval=60)
+        for i in range(100):
+            cache.put("a", i)
+        cache.put("b", "x")
+        assert store.load("a") is None  # Not flushed yet
+        assert cache.stats()["dirty"] == 2
+
+        cache.flush()
+        assert store.load("a") == 99
+        assert cache.stats()["flushed_entries"] == 2
+        cache.close()
+
+    def test_evicted_dirty_entry_is_flushed_first(self):
+        store = SQLiteStore()
+        cache = PersistentCache(store, capacity=2, mode="write-behind", flush_interval=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)  # Evicts dirty 'a'
+
+        assert store.load("a") == 1
+        assert cache.stats()["eviction_flushes"] == 1
+        assert cache.get("a") == 1  # Read back through the store
+        cache.close()
+
+    def test_failed_eviction_flush_keeps_entry_dirty(self):
+        store = _FlakyStore(failures=1)
+        cache = PersistentCache(store, capacity=1, mode="write-behind", flush_interval=60)
+        cache.put("a", 1)
+        cache.put("b", 2)  # Evicting 'a' fails to store it
+
+        assert store.load("a") is None
+        assert cache.get("a") == 1  # Still served from dirty
+        assert isinstance(cache.last_flush_error, OSError)
+        assert cache.stats()["flush_failures"] == 1
+        cache.close()
+        assert store.load("a") == 1
+
+    def test_evicted_dirty_none_value_is_flushed(self):
+        store = SQLiteStore()
+        cache = PersistentCache(store, capacity=1, mode="write-behind", flush_interval=60)
+        cache.put("a", None)
+        cache.put("b", 2)  # Evicts dirty 'a'
+        assert cache.stats()["eviction_flushes"] == 1
+        assert cache.stats()["dirty"] == 1  # Only 'b'
+        cache.close()
+
+    def test_write_behind_delete_and_close(self):
+        store = SQLiteStore()
+        store.store_many([("a", 1)])
+        with PersistentCache(store, capacity=10, mode="write-behind", flush_interval=60) as cache:
+            cache.delete("a")
+            assert cache.get("a") is None  # Pending delete wins over the store
+            cache.put("b", 2)
+        assert store.load("a") is None
+        assert store.load("b") == 2
+
+    def test_background_worker_flushes(self):
+        store = SQLiteStore()
+        cache = PersistentCache(store, capacity=10, mode="write-behind", flush_interval=0.01)
+        cache.put("a", 1)
+        for _ in range(200):
+            if store.load("a") == 1:
+                break
+            time.sleep(0.01)
+        assert store.load("a") == 1
+        cache.close()
+
+    def test_eviction_during_flush_keeps_newest_value(self):
+        store = _GatedStore()
+        cache = PersistentCache(store, capacity=1, mode="write-behind", flush_interval=60)
+        cache.put("a", 1)
+        flusher = threading.Thread(target=cache.flush)
+        flusher.start()
+        assert store.entered.wait(5)   # Flush of a=1 is in flight
+        cache.put("a", 2)
+        cache.put("b", 3)              # Evicts dirty a=2 mid-flush
+        assert cache.get("a") == 2     # Still served from dirty
+        store.release.set()
+        flusher.join(5)
+        cache.flush()
+        assert store.load("a") == 2
+        cache.close()
+
+    def test_failed_flush_is_retried(self):
+        store = _FlakyStore(failures=1)
+        cache = PersistentCache(store, capacity=10, mode="write-behind", flush_interval=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        try:
+            cache.flush()
+            assert False, "Should have raised OSError"
+        except OSError:
+            pass
+        cache.put("a", 10)             # Newer than the failed batch
+        assert cache.stats()["dirty"] == 2
+        assert cache.stats()["flush_failures"] == 1
+        cache.flush()
+        assert (store.load("a"), store.load("b")) == (10, 2)
+        cache.close()
+
+    def test_worker_survives_failed_flush(self):
+        store = _FlakyStore(failures=1)
+        cache = PersistentCache(store, capacity=10, mode="write-behind", flush_interval=0.01)
+        cache.put("a", 1)
+        for _ in range(200):
+            if store.load("a") == 1:
+                break
+            time.sleep(0.01)
+        assert store.load("a") == 1
+        assert isinstance(cache.last_flush_error, OSError)
+        cache.close()
+
+    def test_delete_during_load_is_not_undone(self):
+        store = _GatedStore(gate_loads=True)
+        store.store_many([("a", 1)])
+        cache = PersistentCache(store, capacity=10)
+        results = []
+        reader = threading.Thread(target=lambda: results.append(cache.get("a")))
+        reader.start()
+        assert store.entered.wait(5)   # Load of a=1 is in flight
+        cache.delete("a")
+        store.release.set()
+        reader.join(5)
+        assert results == [1]
+        assert "a" not in cache        # The stale load was not cached
+        assert cache.get("a") is None
+
+
+class TestRESP:
+    """RESP parsers are incremental: partial input returns None."""
+
+    def test_command_round_trip_and_partial_input(self):
+        payload = encode_command("SET", "k", b"a\r\nb") + encode_command("GET", "k")
+        args, pos = parse_command(payload)
+        assert args == [b"SET", b"k", b"a\r\nb"]
+        assert parse_command(payload, pos) == ([b"GET", b"k"], len(payload))
+        assert parse_command(payload[:pos - 1]) is None
+
+    def test_inline_command(self):
+        assert parse_command(b"PING\r\n") == ([b"PING"], 6)
+
+    def test_replies(self):
+        buf = b"+OK\r\n:3\r\n$-1\r\n*2\r\n$1\r\na\r\n$-1\r\n-ERR boom\r\n"
+        replies, pos = [], 0
+        while pos < len(buf):
+            reply, pos = parse_reply(buf, pos)
+            replies.append(reply)
+        assert replies[:4] == ["OK", 3, None, [b"a", None]]
+        assert isinstance(replies[4], ResponseError)
+        assert parse_reply(b"$5\r\nab") is None
+
+
+class TestCacheServer:
+    """CacheServer + CacheClient over a real TCP socket."""
+
+    def setup_method(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = CacheServer(LRUCache(capacity=100))
+        self.listener = self.loop.run_until_complete(self.server.serve_tcp("127.0.0.1", 0))
+        port = self.listener.sockets[0].getsockname()[1]
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.client = CacheClient(port=port, pool_size=2)
+
+    def teardown_method(self):
+        self.client.close()
+
+        async def shutdown():
+            self.listener.close()
+            await self.listener.wait_closed()  # Waits for handlers to see EOF
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def test_get_set_del(self):
+        assert self.client.ping()
+        assert self.client.get("a") is None
+        assert self.client.set("a", "1")
+        assert self.client.get("a") == b"1"
+        assert self.client.delete("a", "b") == 1
+
+    def test_mget_mset_info(self):
+        self.client.mset({"a": "1", "b": "2"})
+        assert self.client.mget(["a", "missing", "b"]) == [b"1", None, b"2"]
+        info = self.client.info()
+        assert info["size"] == "2"
+        assert int(info["total_commands_processed"]) >= 2
+
+    def test_expire(self):
+        self.client.set("a", "1")
+        assert self.client.expire("a", 100) is True
+        assert self.client.expire("missing", 100) is False
+        assert self.server.cache._map[b"a"].expires_at is not None
+        self.client.set("b", "1", ttl=0.01)
+        time.sleep(0.02)
+        assert self.client.get("b") is None
+
+    def test_pipeline_and_errors(self):
+        replies = self.client.pipeline([("SET", "a", "1"), ("NOPE",), ("GET", "a"), ("GET", "a", "extra")])
+        assert replies[0] == "OK"
+        assert isinstance(replies[1], ResponseError)
+        assert replies[2] == b"1"
+        assert isinstance(replies[3], ResponseError)
+        try:
+            self.client.execute("NOPE")
+            assert False, "Should have raised ResponseError"
+        except ResponseError:
+            pass
+
+    def test_concurrent_clients_share_pool(self):
+        def worker(n):
+            for i in range(50):
+                self.client.set(f"{n}:{i}", str(i))
+                assert self.client.get(f"{n}:{i}") == str(i).encode()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(self.client._open) <= 2
+
+
+class TestDiskTier:
+    """DiskTier appends records to a memory-mapped log and compacts it."""
+
+    def test_put_get_pop_overwrite(self, tmp_path):
+        disk = DiskTier(str(tmp_path / "tier.log"))
+        disk.put("a", b"1")
+        disk.put("b", {"x": [1, 2]})
+        disk.put("a", "two")
+        assert disk.get("a") == "two"
+        assert disk.pop("b") == {"x": [1, 2]}
+        assert disk.pop("b") is None
+        assert len(disk) == 1
+        assert disk.stats()["garbage_bytes"] > 0
+        disk.close()
+
+    def test_grows_past_initial_mapping(self, tmp_path):
+        disk = DiskTier(str(tmp_path / "tier.log"))
+        for i in range(3000):
+            disk.put(i, b"x" * 1000)
+        assert disk.get(0) == b"x" * 1000
+        assert disk.get(2999) == b"x" * 1000
+        assert disk.stats()["file_bytes"] >= 3_000_000
+        disk.close()
+
+    def test_max_bytes_drops_oldest(self, tmp_path):
+        disk = DiskTier(str(tmp_path / "tier.log"), max_bytes=1000)
+        for i in range(20):
+            disk.put(i, b"x" * 90)  # ~100 bytes per record
+        assert 0 not in disk and 19 in disk
+        assert disk.stats()["live_bytes"] <= 1000
+        assert disk.stats()["evictions"] > 0
+        disk.close()
+
+    def test_compaction_keeps_live_entries(self, tmp_path):
+        disk = DiskTier(str(tmp_path / "tier.log"), compact_min_bytes=1)
+        for round_ in range(5):
+            for i in range(200):
+                disk.put(i, f"{round_}:{i}")
+        disk.wait_for_compaction()
+        disk.compact()
+
+        stats = disk.stats()
+        assert stats["compactions"] >= 1
+        assert stats["garbage_bytes"] == 0
+        assert all(disk.get(i) == f"4:{i}" for i in range(200))
+        disk.close()
+
+    def test_writes_during_compaction_survive(self, tmp_path):
+        disk = DiskTier(str(tmp_path / "tier.log"), compact_ratio=0.9, compact_min_bytes=1 << 30)
+        for i in range(2000):
+            disk.put(i, b"old" * 50)
+        compactor = threading.Thread(target=disk.compact)
+        compactor.start()
+        for i in range(0, 2000, 2):
+            disk.put(i, b"new")
+        for i in range(1, 2000, 4):
+            disk.delete(i)
+        compactor.join()
+
+        assert disk.get(0) == b"new"
+        assert disk.get(1) is None
+        assert disk.get(3) == b"old" * 50
+        assert len(disk) == 1500
+        disk.close()
+
+    def test_close_during_compaction(self, tmp_path):
+        path = tmp_path / "tier.log"
+        disk = DiskTier(str(path), compact_min_bytes=1 << 30)
+        for i in range(20000):
+            disk.put(i, b"x" * 200)
+        errors = []
+
+        def compact():
+            try:
+                disk.compact()
+            except Exception as exc:
+                errors.append(exc)
+
+        compactors = [threading.Thread(target=compact) for _ in range(3)]
+        for compactor in compactors:
+            compactor.start()
+        disk.close()
+        disk.close()  # Second close is a no-op
+        for compactor in compactors:
+            compactor.join()
+
+        assert errors == []
+        assert not path.exists()
+        assert not (tmp_path / "tier.log.compact").exists()
+
+
+class TestTieredCache:
+    """TieredCache demotes LRU evictions to disk and promotes disk hits."""
+
+    def test_demote_and_promote(self, tmp_path):
+        with TieredCache(capacity=2, path=str(tmp_path / "tier.log")) as cache:
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.put("c", 3)  # Demotes 'a'
+            assert "a" in cache._disk and "a" not in cache._memory
+
+            assert cache.get("a") == 1  # Promoted, demotes 'b'
+            assert "a" in cache._memory and "b" in cache._disk
+            stats = cache.stats()
+            assert stats["disk_hits"] == 1
+            assert stats["promotions"] == 1
+            assert stats["demotions"] == 2
+            assert len(cache) == 3
+
+    def test_put_replaces_disk_copy_and_delete(self, tmp_path):
+        with TieredCache(capacity=1, path=str(tmp_path / "tier.log")) as cache:
+            cache.put("a", 1)
+            cache.put("b", 2)      # 'a' on disk
+            cache.put("a", 10)     # New value in memory, stale disk copy dropped
+            assert cache.get("a") == 10
+            assert cache.get("b") == 2
+            assert cache.delete("a") is True
+            assert cache.get("a") is None
+            assert cache.delete("a") is False
+
+    def test_working_set_larger_than_memory(self, tmp_path):
+        with TieredCache(capacity=10, path=str(tmp_path / "tier.log"), compact_min_bytes=1) as cache:
+            for i in range(500):
+                cache.put(i, i * i)
+            for _ in range(3):
+                for i in range(500):
+                    assert cache.get(i) == i * i
+            assert cache.stats()["misses"] == 0
+
+
+class TestRemovalListeners:
+    """Queued, batched removal events with causes and a bounded queue."""
+
+    def test_causes_delivered_in_batches(self):
+        now = [0.0]
+        batches = []
+        cache = LRUCache(capacity=2, clock=lambda: now[0])
+        dispatcher = cache.add_removal_listener(batches.append)
+
+        cache.put("a", 1)
+        cache.put("a", 2)             # replaced (old value 1)
+        cache.put("b", 1)
+        cache.put("c", 1)             # evicts a
+        cache.delete("b")             # deleted
+        cache.put("d", 1, ttl=1)
+        now[0] = 5
+        assert cache.get("d") is None  # expired
+        assert dispatcher.flush(timeout=5)
+
+        events = [(event.key, event.value, event.cause) for batch in batches for event in batch]
+        assert events == [
+            ("a", 1, REPLACED), ("a", 2, EVICTED), ("b", 1, DELETED), ("d", 1, EXPIRED),
+        ]
+        stats = cache.stats()
+        assert stats["removals_queued"] == 4 and stats["removals_dropped"] == 0
+        cache.remove_removal_listener(dispatcher)
+        assert dispatcher.closed and "removals_queued" not in cache.stats()
+
+    def test_batching_and_slow_listener_drop_newest(self):
+        release = threading.Event()
+        batches = []
+
+        def listener(batch):
+            release.wait(5)
+            batches.append(len(batch))
+
+        cache = LRUCache(capacity=1)
+        dispatcher = cache.add_removal_listener(listener, max_queue=10, batch_size=4)
+        started = time.perf_counter()
+        for i in range(100):
+            cache.put(i, i)           # 99 evictions, listener stuck
+        assert time.perf_counter() - started < 1  # put never waits for the listener
+        release.set()
+        dispatcher.flush(timeout=5)
+
+        stats = dispatcher.stats()
+        assert stats["delivered"] + stats["dropped"] == 99
+        assert stats["dropped"] >= 99 - 10 - 4
+        assert max(batches) <= 4 and stats["batches"] == len(batches)
+        dispatcher.close()
+
+    def test_drop_oldest_keeps_freshest(self):
+        release = threading.Event()
+        keys = []
+
+        def listener(batch):
+            release.wait(5)
+            keys.extend(event.key for event in batch)
+
+        dispatcher = RemovalDispatcher(listener, max_queue=3, batch_size=1, policy=DROP_OLDEST)
+        dispatcher.publish("first", None, EVICTED)
+        while not dispatcher.stats()["in_flight"]:
+            time.sleep(0.001)         # Worker holds "first"
+        for i in range(10):
+            dispatcher.publish(i, None, EVICTED)
+        release.set()
+        dispatcher.close(timeout=5)
+        assert keys == ["first", 7, 8, 9]
+        assert dispatcher.stats()["dropped"] == 7
+
+    def test_block_applies_backpressure(self):
+        delivered = []
+
+        def listener(batch):
+            time.sleep(0.01)
+            delivered.extend(batch)
+
+        with RemovalDispatcher(listener, max_queue=2, batch_size=1, policy=BLOCK) as dispatcher:
+            for i in range(20):
+                assert dispatcher.publish(i, None, DELETED)
+            dispatcher.flush(timeout=5)
+            assert [event.key for event in delivered] == list(range(20))
+            assert dispatcher.stats()["dropped"] == 0
+        assert not dispatcher.publish("late", None, DELETED)  # Closed
+
+    def test_executor_and_failures(self):
+        calls = []
+
+        def listener(batch):
+            calls.append(threading.current_thread().name)
+            if batch[0].key == "bad":
+                raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="removal-pool") as pool:
+            dispatcher = RemovalDispatcher(listener, batch_size=1, executor=pool)
+            dispatcher.publish("bad", None, DELETED)
+            dispatcher.flush(timeout=5)
+            dispatcher.publish("good", None, DELETED)
+            dispatcher.close(timeout=5)
+        stats = dispatcher.stats()
+        assert (stats["delivered"], stats["failed"]) == (1, 1)
+        assert all(name.startswith("removal-pool") for name in calls)
+
+    def test_cancelled_batches_count_as_failed(self):
+        release = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.submit(release.wait, 5)  # Occupy the only worker
+        dispatcher = RemovalDispatcher(lambda batch: None, batch_size=1, executor=pool)
+        for i in range(3):
+            dispatcher.publish(i, None, DELETED)
+        while dispatcher.stats()["in_flight"] < 3:
+            time.sleep(0.001)         # All three batches queued in the pool
+        pool.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        assert dispatcher.flush(timeout=5)
+        assert dispatcher.stats()["failed"] == 3
+        dispatcher.close(timeout=5)
+
+    def test_invalid_options(self):
+        for bad in ({"max_queue": 0}, {"batch_size": 0}, {"policy": "nope"}):
+            try:
+                RemovalDispatcher(lambda batch: None, **bad)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
@@ -1,4 +1,7 @@
 from lru_cache import LRUCache
+from metrics import LatencyHistogram, bucket_index, bucket_upper_bound, prometheus_text
+from timer_wheel import TimerWheel
+from traces import zipf_trace
 
 class TestLRUCache:
     """
@@ -119,4 +122,594 @@ class TestLRUStats:
         cache.put("b", 2)  # 1 eviction
         cache.put("c", 3)  # 2 evictions
 
-        assert cache.stats()["evictions"] == 2
\ No newline at end of file
+        assert cache.stats()["evictions"] == 2
+
+class FakeClock:
+    """Manually advanced clock for deterministic TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTL:
+    """Test per-entry expiration."""
+
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=3, clock=clock)
+        cache.put("a", 1, ttl=5)
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_default_ttl_and_override(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=3, default_ttl=10, clock=clock)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=100)
+        clock.now = 50
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_expired_entries_reclaimed_without_reads(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=100, clock=clock)
+        for i in range(50):
+            cache.put(f"k{i}", i, ttl=1 + i % 3)
+        clock.now = 10
+        cache.put("fresh", 1)  # Any write advances the wheel
+
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 50
+
+    def test_purge_expired_across_levels(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=10, clock=clock)
+        cache.put("short", 1, ttl=3)
+        cache.put("long", 2, ttl=5000)   # Lands on a higher wheel level
+        clock.now = 4999
+        assert cache.purge_expired() == 1
+        assert "long" in cache
+        clock.now = 5001
+        assert cache.purge_expired() == 1
+        assert len(cache) == 0
+
+    def test_timer_wheel_skips_idle_ticks(self):
+        wheel = TimerWheel()
+        wheel.schedule("far", 5_000_000)
+        wheel.schedule("near", 10)
+        cascades = []
+        cascade = wheel._cascade
+        wheel._cascade = lambda level, slot: (cascades.append(level), cascade(level, slot))
+
+        assert wheel.advance(4_999_999) == ["near"]
+        assert len(cascades) < 10  # Not one per 64 ticks (~78,000)
+        assert wheel.advance(5_000_000) == ["far"]
+        assert len(wheel) == 0
+
+    def test_timer_wheel_needs_two_levels(self):
+        try:
+            TimerWheel(levels=1)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+        wheel = TimerWheel(levels=2)  # Range 4,096 ticks; 10,000 is parked
+        wheel.schedule("far", 10_000)
+        assert wheel.advance(9_999) == []
+        assert wheel.advance(10_000) == ["far"]
+
+    def test_update_resets_deadline(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=3, clock=clock)
+        cache.put("a", 1, ttl=5)
+        clock.now = 4
+        cache.put("a", 2, ttl=5)
+        clock.now = 8
+        assert cache.get("a") == 2
+        cache.put("a", 3)  # No TTL — never expires
+        clock.now = 1000
+        assert cache.get("a") == 3
+
+    def test_delete_and_eviction_cancel_timers(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=1, clock=clock)
+        cache.put("a", 1, ttl=5)
+        cache.put("b", 2, ttl=5)   # Evicts 'a'
+        cache.delete("b")
+        clock.now = 10
+        assert cache.purge_expired() == 0
+        assert cache.stats()["expirations"] == 0
+
+    def test_expire_sets_new_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=10, clock=clock)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=100)
+        assert cache.expire("a", 5) is True
+        assert cache.expire("b", 5) is True   # Replaces the old deadline
+        assert cache.expire("missing", 5) is False
+        clock.now = 6
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.expire("a", 5) is False
+
+    def test_ttl_validation(self):
+        cache = LRUCache(capacity=1)
+        try:
+            cache.put("a", 1, ttl=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+class TestLRUWeight:
+    """Test weight-bounded capacity."""
+
+    def test_evicts_until_weight_fits(self):
+        cache = LRUCache(max_weight=10, weigher=lambda k, v: len(v))
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.put("c", "xxxx")  # 12 > 10 — evicts 'a'
+
+        assert "a" not in cache
+        assert cache.stats()["weight"] == 8
+        assert cache.stats()["evictions"] == 1
+
+    def test_count_only_stats_have_no_weight(self):
+        cache = LRUCache(capacity=10)
+        cache.put("a", "xxxx")
+        assert "weight" not in cache.stats()
+        assert "max_weight" not in cache.stats()
+        assert "cache_weight" not in cache.export_prometheus()
+
+    def test_one_heavy_entry_evicts_several(self):
+        cache = LRUCache(max_weight=10, weigher=lambda k, v: len(v))
+        for key in "abcde":
+            cache.put(key, "xx")
+        cache.put("big", "x" * 9)
+
+        assert list(cache._map) == ["big"]
+        assert cache.stats()["evictions"] == 5
+
+    def test_update_changes_weight(self):
+        cache = LRUCache(max_weight=10, weigher=lambda k, v: len(v))
+        cache.put("a", "xxx")
+        cache.put("b", "xxx")
+        cache.put("b", "x" * 8)  # Grows to 8 — 'a' must go
+
+        assert "a" not in cache
+        assert cache.get("b") == "x" * 8
+        assert cache.stats()["weight"] == 8
+
+    def test_rejects_oversized_entries(self):
+        cache = LRUCache(max_weight=100, weigher=lambda k, v: len(v), max_entry_fraction=0.5)
+        cache.put("a", "x" * 10)
+        cache.put("a", "x" * 60)  # Over half the budget — rejected, stale 'a' dropped
+
+        assert "a" not in cache
+        assert cache.stats()["rejections"] == 1
+        assert cache.stats()["weight"] == 0
+
+    def test_capacity_and_weight_together(self):
+        cache = LRUCache(capacity=2, max_weight=100, weigher=lambda k, v: len(v))
+        cache.put("a", "x")
+        cache.put("b", "x")
+        cache.put("c", "x")
+        assert len(cache) == 2
+        assert "a" not in cache
+
+    def test_requires_a_bound(self):
+        try:
+            LRUCache()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    def test_peek_lru_does_not_touch_recency(self):
+        cache = LRUCache(capacity=2)
+        assert cache.peek_lru() is None
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.peek_lru() == ("a", 1)
+        cache.put("c", 3)  # 'a' is still the one evicted
+        assert "a" not in cache
+
+
+class TestLRUBatch:
+    """Test get_many / put_many / delete_many."""
+
+    def test_get_many_returns_hits_only(self):
+        cache = LRUCache(capacity=5)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+        assert cache.get_many(["a", "c", "x"]) == {"a": 1, "c": 3}
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_put_many_matches_sequential_puts(self):
+        batch, loop = LRUCache(capacity=3), LRUCache(capacity=3)
+        items = [("a", 1), ("b", 2), ("c", 3), ("a", 10), ("d", 4), ("e", 5)]
+        batch.put_many(items)
+        for key, value in items:
+            loop.put(key, value)
+
+        assert str(batch._list) == str(loop._list)
+        assert batch.stats()["evictions"] == loop.stats()["evictions"] == 2
+
+    def test_get_many_updates_recency(self):
+        cache = LRUCache(capacity=3)
+        cache.put_many([("a", 1), ("b", 2), ("c", 3)])
+        cache.get_many(["a", "b"])
+        cache.put("d", 4)  # 'c' is now least recent
+        assert "c" not in cache
+
+    def test_delete_many(self):
+        cache = LRUCache(capacity=5)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+        assert cache.delete_many(["a", "b", "x"]) == 2
+        assert len(cache) == 1
+
+    def test_put_many_with_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=5, clock=clock)
+        cache.put_many({"a": 1, "b": 2}, ttl=5)
+        clock.now = 6
+        assert cache.get_many(["a", "b"]) == {}
+        assert cache.stats()["expirations"] == 2
+
+    def test_put_many_respects_weight(self):
+        cache = LRUCache(max_weight=10, weigher=lambda k, v: len(v))
+        cache.put_many([("a", "xxxx"), ("b", "xxxx"), ("c", "xxxx")])
+        assert "a" not in cache
+        assert cache.stats()["weight"] == 8
+
+
+class TestLRUEvictHook:
+    """Test the synchronous on_evict hook."""
+
+    def test_called_on_eviction_and_expiry_only(self):
+        clock = FakeClock()
+        dropped = []
+        cache = LRUCache(capacity=2, clock=clock, on_evict=lambda k, v: dropped.append((k, v)))
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=5)
+        cache.put("c", 3)      # Evicts 'a'
+        cache.delete("c")      # Explicit delete — no callback
+        clock.now = 10
+        cache.get("b")         # Expired
+        cache.put_many([("x", 1), ("y", 2), ("z", 3)])  # Batch evicts 'x'
+
+        assert dropped == [("a", 1), ("b", 2), ("x", 1)]
+
+
+class TestLRUSnapshot:
+    """Test dump() / load() warm restarts."""
+
+    def test_round_trip_keeps_contents_and_recency(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        cache = LRUCache(capacity=5)
+        values = {"s": "text", "b": b"\x00\xff", "i": -2**70, "f": 1.5, "n": None, "t": True, "p": [1, {"x": 2}]}
+        cache.put_many(list(values.items())[:5])
+        cache.get("s")  # Order now: s, f, i, b, ... → LRU is 'b'
+
+        assert cache.dump(path) == 5
+        restored = LRUCache(capacity=5)
+        assert restored.load(path) == 5
+        for key in ["s", "b", "i", "f", "n"]:
+            assert restored._map[key].value == values[key]
+        assert restored.peek_lru() == cache.peek_lru() == ("b", b"\x00\xff")
+
+    def test_int_keys(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        cache = LRUCache(capacity=100)
+        cache.put_many((i, i * i) for i in range(100))
+        cache.dump(path)
+        restored = LRUCache(capacity=100)
+        restored.load(path)
+        assert restored.get(7) == 49
+        assert restored.peek_lru() == (0, 0)
+
+    def test_load_keeps_most_recent_when_smaller(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        cache = LRUCache(capacity=10)
+        cache.put_many((f"k{i}", i) for i in range(10))
+        cache.dump(path)
+
+        small = LRUCache(capacity=3)
+        small.put("live", 1)
+        assert small.load(path) == 2
+        assert "live" in small and "k9" in small and "k8" in small
+        assert small.peek_lru() == ("k8", 8)  # Restored entries rank below live ones
+
+    def test_ttl_saved_as_remaining_time(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        clock = FakeClock()
+        cache = LRUCache(capacity=10, clock=clock)
+        cache.put("short", 1, ttl=5)
+        cache.put("long", 2, ttl=50)
+        cache.put("forever", 3)
+        clock.now = 10  # 'short' already expired
+        assert cache.dump(path) == 2
+
+        later = FakeClock()
+        later.now = 1000
+        restored = LRUCache(capacity=10, clock=later)
+        restored.load(path)
+        assert restored.get("forever") == 3
+        later.now = 1039
+        assert restored.get("long") == 2
+        later.now = 1041
+        assert restored.get("long") is None
+
+    def test_failed_dump_keeps_old_snapshot_and_no_tmp_file(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        cache = LRUCache(capacity=10)
+        cache.put("a", 1)
+        cache.dump(str(path))
+        before = path.read_bytes()
+
+        cache.put("bad", lambda: None)  # Functions cannot be pickled
+        try:
+            cache.dump(str(path))
+            assert False, "Should have raised"
+        except Exception:
+            pass
+        assert path.read_bytes() == before
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_rejects_non_snapshot(self, tmp_path):
+        path = tmp_path / "junk"
+        path.write_bytes(b"not a snapshot")
+        try:
+            LRUCache(capacity=1).load(str(path))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+    def test_truncated_snapshot_leaves_cache_consistent(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        cache = LRUCache(capacity=10)
+        cache.put_many((f"k{i}", "v" * 10) for i in range(10))
+        cache.dump(str(path))
+        path.write_bytes(path.read_bytes()[:-3])
+
+        restored = LRUCache(capacity=10)
+        try:
+            restored.load(str(path))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+        assert len(restored) == 9
+        restored.put("new", 1)
+        assert restored.peek_lru() == ("k1", "v" * 10)
+
+
+class TestLRUMetrics:
+    """Test hit ratio, eviction rate, latency histograms and export."""
+
+    def test_hit_rate_ignores_evictions(self):
+        cache = LRUCache(capacity=1)
+        cache.put("a", 1)
+        cache.put("b", 2)   # Eviction — not a lookup
+        cache.get("b")      # Hit
+        cache.get("a")      # Miss
+
+        stats = cache.stats()
+        assert stats["hit_rate"] == "50.0%"
+        assert stats["hit_ratio"] == 0.5
+        assert LRUCache(capacity=1).hit_ratio() == 0.0
+
+    def test_eviction_rate(self):
+        clock = FakeClock()
+        cache = LRUCache(capacity=1, clock=clock)
+        for i in range(11):
+            cache.put(i, i)
+        clock.now = 5
+        assert cache.eviction_rate() == 2.0
+
+    def test_enable_and_disable_metrics(self):
+        cache = LRUCache(capacity=10, metrics=True)
+        assert cache.metrics_enabled
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.delete("a")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["get_p99_us"] >= stats["get_p50_us"] > 0
+        assert cache._latency["get"].count == 2
+        assert cache._latency["delete"].count == 1
+
+        cache.disable_metrics()
+        assert "get" not in cache.__dict__  # Back to the plain class method
+        assert "get_p50_us" not in cache.stats()
+        assert cache.get("missing") is None
+
+    def test_export_prometheus(self):
+        cache = LRUCache(capacity=10, metrics=True)
+        cache.put("a", 1)
+        cache.get("a")
+        text = cache.export_prometheus(labels={"cache": "users"})
+
+        assert "# TYPE cache_hits_total counter" in text
+        assert 'cache_hits_total{cache="users"} 1' in text
+        assert 'cache_size{cache="users"} 1' in text
+        assert "cache_weight" not in text  # No weight budget
+        assert 'cache_op_duration_seconds_bucket{cache="users",op="get",le="+Inf"} 1' in text
+        assert 'cache_op_duration_seconds_count{cache="users",op="put"} 1' in text
+        assert "op_duration" not in LRUCache(capacity=1).export_prometheus()
+
+
+class TestLatencyHistogram:
+    """Log-linear buckets keep relative error under 1/8."""
+
+    def test_buckets_are_contiguous(self):
+        for value in range(10_000):
+            index = bucket_index(value)
+            assert bucket_upper_bound(index) > value
+            assert index == 0 or bucket_upper_bound(index - 1) <= value
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        assert abs(histogram.percentile(50) - 500_000) / 500_000 < 0.125
+        assert histogram.percentile(100) == 1_000_000
+        assert histogram.cumulative([(1 << 10) - 1, (1 << 30) - 1]) == [1, 1000]
+
+    def test_cumulative_counts_values_on_the_bound(self):
+        histogram = LatencyHistogram()
+        for value in (255, 256, 1023, 1024):
+            histogram.record(value)
+        # le is "less than or equal": a value exactly on the bound counts
+        assert histogram.cumulative([255, 1023]) == [1, 3]
+        text = prometheus_text("cache", {}, {}, {"get": histogram})
+        assert 'le="2.55e-07"} 1' in text and 'le="1.023e-06"} 3' in text
+
+
+class TestLRUMissRatioSampling:
+    """SHARDS monitor: hit ratio estimates at other capacities."""
+
+    def _replay(self, cache, trace):
+        for key in trace:
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    def _exact_hit_ratio(self, trace, capacity):
+        cache = LRUCache(capacity)
+        self._replay(cache, trace)
+        return cache.hit_ratio()
+
+    def test_full_sample_matches_lru(self):
+        # rate=1 samples every key: only the histogram buckets approximate
+        trace = list(zipf_trace(20_000, 2_000, seed=4))
+        cache = LRUCache(capacity=100)
+        cache.enable_mrc_sampling(sample_size=10_000, rate=1.0)
+        self._replay(cache, trace)
+        for capacity in (16, 100, 400, 2_000):
+            assert abs(cache.estimate_hit_ratio(capacity) - self._exact_hit_ratio(trace, capacity)) < 0.02
+
+    def test_fixed_size_sample_lowers_rate(self):
+        trace = list(zipf_trace(100_000, 50_000, alpha=0.8, seed=5))
+        cache = LRUCache(capacity=1_000)
+        cache.enable_mrc_sampling(sample_size=500, rate=0.1)
+        self._replay(cache, trace)
+
+        summary = cache.stats()["mrc_sampling"]
+        assert summary["sampled_keys"] <= 500
+        assert summary["rate"] < 0.02
+        for capacity in (1_000, 4_000):
+            assert abs(cache.estimate_hit_ratio(capacity) - self._exact_hit_ratio(trace, capacity)) < 0.05
+
+    def test_batch_lookups_are_sampled(self):
+        # Same trace through get() and through get_many batches: same estimate
+        trace = list(zipf_trace(20_000, 2_000, seed=6))
+        single = LRUCache(capacity=100)
+        single.enable_mrc_sampling(sample_size=10_000, rate=0.2)
+        self._replay(single, trace)
+
+        mixed = LRUCache(capacity=100)
+        mixed.enable_mrc_sampling(sample_size=10_000, rate=0.2)
+        for start in range(0, len(trace), 10):
+            chunk = trace[start:start + 10]
+            if start % 20:
+                self._replay(mixed, chunk)
+                continue
+            for key in chunk:  # One key per batch keeps the access order
+                if not mixed.get_many([key]):
+                    mixed.put_many({key: key})
+        for capacity in (50, 100, 400):
+            assert abs(mixed.estimate_hit_ratio(capacity) - single.estimate_hit_ratio(capacity)) < 1e-9
+        assert mixed.stats()["mrc_sampling"]["sampled_lookups"] == single.stats()["mrc_sampling"]["sampled_lookups"]
+
+    def test_stats_and_disable(self):
+        cache = LRUCache(capacity=10, mrc_sampling=True, metrics=True)
+        cache.put("a", 1)
+        cache.get("a")
+        estimates = cache.stats()["estimated_hit_ratio"]
+        assert list(estimates) == [5, 10, 20, 40]
+        assert all(0.0 <= ratio <= 1.0 for ratio in estimates.values())
+
+        cache.disable_mrc_sampling()
+        assert "estimated_hit_ratio" not in cache.stats()
+        assert cache.metrics_enabled and "get" in cache.__dict__  # Still timed
+        cache.disable_metrics()
+        assert not {"get", "put", "get_many", "put_many"} & cache.__dict__.keys()
+        try:
+            cache.estimate_hit_ratio(10)
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError:
+            pass
+
+
+class TestLRUResize:
+    """Grow immediately, shrink a chunk at a time."""
+
+    def test_grow_is_immediate(self):
+        cache = LRUCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.resize(4) == 0
+        cache.put("c", 3)
+        cache.put("d", 4)
+        assert len(cache) == 4 and cache.capacity == 4
+        assert "get" not in cache.__dict__
+
+    def test_shrink_evicts_lru_in_chunks(self):
+        evicted = []
+        cache = LRUCache(capacity=100, on_evict=lambda key, value: evicted.append(key))
+        for i in range(100):
+            cache.put(i, i)
+        assert cache.resize(10, chunk=30) == 60
+        assert len(cache) == 70 and cache.resize_pending
+        assert cache.stats()["resize_target"] == 10
+
+        cache.get(99)                 # One step per operation
+        assert len(cache) == 40
+        cache.put("new", 1)           # Step, then the put evicts instead of growing
+        assert len(cache) == 10
+        assert not cache.resize_pending
+        assert "resize_target" not in cache.stats()
+        assert cache.capacity == 10
+        assert "get" not in cache.__dict__  # Shadows removed when done
+
+        assert evicted[:3] == [0, 1, 2]  # Least recent first
+        assert 99 in cache and "new" in cache
+        assert cache.stats()["evictions"] == 91
+
+    def test_puts_during_shrink_do_not_grow(self):
+        cache = LRUCache(capacity=50)
+        for i in range(50):
+            cache.put(i, i)
+        cache.resize(5, chunk=1)
+        for i in range(50, 60):
+            size = len(cache)
+            cache.put(i, i)
+            assert len(cache) <= size
+        while cache.resize_step():
+            pass
+        assert len(cache) == 5 and list(range(55, 60)) == [k for k in range(55, 60) if k in cache]
+
+    def test_grow_cancels_pending_shrink(self):
+        cache = LRUCache(capacity=10, metrics=True)
+        for i in range(10):
+            cache.put(i, i)
+        cache.resize(2, chunk=3)
+        assert cache.resize(20) == 0
+        assert not cache.resize_pending and cache.capacity == 20 and len(cache) == 7
+        assert cache.metrics_enabled and cache.get(9) == 9
+
+    def test_invalid_resize(self):
+        for bad in ({"new_capacity": 0}, {"new_capacity": 5, "chunk": 0}):
+            try:
+                LRUCache(capacity=3).resize(**bad)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
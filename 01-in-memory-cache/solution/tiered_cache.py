@@ -0,0 +1,174 @@
+"""
+Tiered Cache — a small LRUCache in RAM over a large DiskTier.
+
+    get(k) ──► memory LRUCache ──hit──► value
+                   │ miss
+                   ▼
+               DiskTier (mmap) ──hit──► PROMOTE: move k back into memory
+                   │ miss                (which may demote another entry)
+                   ▼
+                 None
+
+    put(k) ──► memory LRUCache ──evicts LRU entry──► DEMOTE: append to disk
+
+The tiers are EXCLUSIVE: a key lives in exactly one of them. Demotion
+rides on LRUCache's on_evict hook, so the memory tier stays a plain
+LRUCache with all its fast paths.
+
+The memory tier holds the hottest `capacity` entries; the disk tier
+holds everything evicted from it (up to disk_max_bytes live bytes),
+compacting itself in the background as promotions and overwrites leave
+dead records behind (see disk_tier.py).
+
+Not thread-safe, like LRUCache; the disk tier's compaction thread only
+touches its own state under its own lock. No TTLs: an expired entry
+would otherwise be demoted instead of dropped.
+"""
+
+import os
+import tempfile
+from typing import Any, Optional
+
+from disk_tier import DiskTier
+from lru_cache import LRUCache
+
+
+class TieredCache:
+    """
+    LRU cache in memory, spilling evicted entries to a memory-mapped disk tier.
+    """
+    def __init__(
+        self,
+        capacity: int,
+        path: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1 << 20,
+    ):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="tiered-cache-", suffix=".log")
+            os.close(fd)
+
+        self._memory = LRUCache(capacity, on_evict=self._demote)
+        self._disk = DiskTier(
+            path, max_bytes=disk_max_bytes, compact_ratio=compact_ratio, compact_min_bytes=compact_min_bytes
+        )
+
+        # stats
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._promotions = 0
+        self._demotions = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._memory.capacity
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from memory, else from disk (promoting it).
+        """
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory_hits += 1
+            return value
+
+        value = self._disk.pop(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._disk_hits += 1
+        self._promotions += 1
+        self._memory.put(key, value)
+        return value
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the memory tier; a stale disk copy is dropped.
+        """
+        if key not in self._memory:
+            self._disk.delete(key)
+        self._memory.put(key, value)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from whichever tier holds it.
+        """
+        return self._memory.delete(key) or self._disk.delete(key)
+
+    def _demote(self, key: str, value: Any):
+        """
+        LRUCache eviction hook: the evicted entry moves to disk.
+        """
+        self._disk.put(key, value)
+        self._demotions += 1
+
+    def close(self):
+        """
+        Stop compaction and delete the disk tier's file.
+        """
+        self._disk.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Per-tier hits plus promotion/demotion counts and disk usage.
+        """
+        total = self._memory_hits + self._disk_hits + self._misses
+        disk = self._disk.stats()
+        return {
+            "size": len(self),
+            "memory_size": len(self._memory),
+            "disk_size": disk["entries"],
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "promotions": self._promotions,
+            "demotions": self._demotions,
+            "disk_live_bytes": disk["live_bytes"],
+            "disk_garbage_bytes": disk["garbage_bytes"],
+            "disk_file_bytes": disk["file_bytes"],
+            "compactions": disk["compactions"],
+            "disk_evictions": disk["evictions"],
+            "hit_rate": f"{((self._memory_hits + self._disk_hits) / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or key in self._disk
+
+    def __repr__(self) -> str:
+        return f"TieredCache(capacity={self.capacity}, memory={len(self._memory)}, disk={len(self._disk)})"
+
+
+if __name__ == "__main__":
+    import time
+
+    from traces import zipf_trace
+
+    keyspace, capacity = 200_000, 10_000  # working set 20x the memory tier
+    requests = list(zipf_trace(300_000, keyspace, alpha=0.9))
+    value = b"v" * 200
+
+    for name, cache in [("LRUCache only", LRUCache(capacity)), ("TieredCache", TieredCache(capacity))]:
+        started = time.perf_counter()
+        misses = 0
+        for key in requests:
+            if cache.get(key) is None:
+                misses += 1
+                cache.put(key, value)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<14} miss ratio {misses / len(requests):6.1%}   {len(requests) / elapsed:>10,.0f} ops/s")
+        if isinstance(cache, TieredCache):
+            stats = cache.stats()
+            print(f"{'':<14} promotions={stats['promotions']:,} compactions={stats['compactions']} "
+                  f"disk={stats['disk_live_bytes'] / 1e6:.1f} MB live, {stats['disk_file_bytes'] / 1e6:.1f} MB file")
+            cache.close()
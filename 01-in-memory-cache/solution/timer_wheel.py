@@ -0,0 +1,190 @@
+"""
+Hierarchical Timer Wheel — O(1) scheduling and expiry of per-key deadlines.
+
+Checking every entry for expiry is O(n) per sweep; a heap is O(log n)
+per insert and needs lazy deletion. A timer wheel buckets deadlines by
+time, like the hands of a clock:
+
+    level 0:  64 slots × 1 tick        (covers the next 64 ticks)
+    level 1:  64 slots × 64 ticks      (covers the next 4,096 ticks)
+    level 2:  64 slots × 4,096 ticks   (covers the next 262,144 ticks)
+    level 3:  64 slots × 262,144 ticks ...
+
+    schedule(key, deadline):
+        Pick the lowest level whose range covers the deadline, drop the
+        key into the slot for that deadline → O(1)
+
+    advance(now):
+        For every tick that passed, fire level-0 slot (tick % 64).
+        When level 0 wraps around (tick % 64 == 0), "cascade" the next
+        level-1 slot: its keys are now close enough to be re-placed into
+        level 0. Same for higher levels. → O(1) amortized per key
+        (each key cascades at most once per level)
+        Ticks where nothing would fire or cascade are skipped: the wheel
+        jumps straight to the next non-empty level-0 slot or non-empty
+        cascade boundary, so a long idle gap costs a few slot scans
+        instead of one loop iteration per tick.
+
+    cancel(key): remember each key's (level, slot) → O(1)
+
+Deadlines are rounded UP to whole ticks, so a key never fires early; it
+may fire up to one tick late. Callers that need exactness (LRUCache.get)
+also compare the real deadline lazily.
+
+NEW CONCEPT — bit shifts for powers of two:
+    With 64 = 2**6 slots, "tick // 64**level" is "tick >> (6 * level)"
+    and "x % 64" is "x & 63".
+"""
+
+import math
+from typing import Hashable
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+
+class TimerWheel:
+    """
+    Hashed hierarchical timer wheel keyed by cache key.
+    """
+    def __init__(self, tick: float = 1.0, levels: int = 4, start: float = 0.0):
+        if tick <= 0:
+            raise ValueError("Tick must be positive")
+        # Deadlines beyond the top level are parked there and re-placed on
+        # cascade; a single level would FIRE its parked keys instead
+        if levels < 2:
+            raise ValueError("Levels must be at least 2")
+
+        self.tick = tick
+        self.levels = levels
+        self._now_tick = math.floor(start / tick)
+
+        # _wheels[level][slot] → {key: deadline_tick}
+        self._wheels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(SLOTS)] for _ in range(levels)
+        ]
+        # key → (level, slot), for O(1) cancel
+        self._where: dict[Hashable, tuple[int, int]] = {}
+
+    def schedule(self, key: Hashable, deadline: float):
+        """
+        Schedule (or reschedule) key to fire once the clock reaches deadline.
+        """
+        self.cancel(key)
+        deadline_tick = max(math.ceil(deadline / self.tick), self._now_tick + 1)
+        self._place(key, deadline_tick)
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Remove a pending timer. Returns False if key had none.
+        """
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        level, slot = where
+        del self._wheels[level][slot][key]
+        return True
+
+    def advance(self, now: float) -> list[Hashable]:
+        """
+        Move the wheel forward to time now and return every key that fired.
+        """
+        target = math.floor(now / self.tick)
+        fired: list[Hashable] = []
+
+        # Nothing scheduled — jump straight to the target tick
+        if not self._where:
+            self._now_tick = max(self._now_tick, target)
+            return fired
+
+        while self._where:
+            tick = self._now_tick + 1
+            # Busy wheel or a one-tick step: just take it. Otherwise jump.
+            if tick < target and not self._wheels[0][tick & SLOT_MASK]:
+                tick = self._next_tick(target)
+            if tick > target:
+                break
+            self._now_tick = tick
+
+            # Cascade from the highest level that wrapped down to level 1,
+            # so keys can fall through several levels in the same tick
+            cascade_levels = []
+            for level in range(1, self.levels):
+                if tick & ((1 << (SLOT_BITS * level)) - 1):
+                    break
+                cascade_levels.append(level)
+            for level in reversed(cascade_levels):
+                self._cascade(level, (tick >> (SLOT_BITS * level)) & SLOT_MASK)
+
+            bucket = self._wheels[0][tick & SLOT_MASK]
+            if bucket:
+                fired.extend(bucket)
+                for key in bucket:
+                    del self._where[key]
+                bucket.clear()
+
+        self._now_tick = max(self._now_tick, target)
+        return fired
+
+    def _next_tick(self, limit: int) -> int:
+        """
+        First tick after now where a non-empty slot fires (level 0) or
+        cascades (higher levels); limit + 1 if there is none up to limit.
+        """
+        best = limit + 1
+        for level in range(self.levels):
+            shift = SLOT_BITS * level
+            position = self._now_tick >> shift
+            # Higher levels only act on multiples of 64**level — if even
+            # the next one is too late, so is every level above
+            if (position + 1) << shift >= best:
+                break
+            wheel = self._wheels[level]
+            for step in range(1, SLOTS + 1):
+                tick = (position + step) << shift
+                if tick >= best:
+                    break
+                if wheel[(position + step) & SLOT_MASK]:
+                    best = tick
+                    break
+        return best
+
+    def _place(self, key: Hashable, deadline_tick: int):
+        """
+        Put key into the lowest level whose range covers its deadline.
+        """
+        slot_tick = deadline_tick
+        delta = deadline_tick - self._now_tick
+        for level in range(self.levels):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                break
+        else:
+            # Beyond the top level's range — park it in the farthest top
+            # slot; it is re-placed with its real deadline when cascaded
+            level = self.levels - 1
+            slot_tick = self._now_tick + (1 << (SLOT_BITS * self.levels)) - 1
+        slot = (slot_tick >> (SLOT_BITS * level)) & SLOT_MASK
+        self._wheels[level][slot][key] = deadline_tick
+        self._where[key] = (level, slot)
+
+    def _cascade(self, level: int, slot: int):
+        """
+        Re-place every key of a higher-level slot into lower levels.
+        """
+        bucket = self._wheels[level][slot]
+        self._wheels[level][slot] = {}
+        for key, deadline_tick in bucket.items():
+            self._place(key, deadline_tick)
+
+    def __len__(self) -> int:
+        """
+        Return the number of pending timers.
+        """
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def __repr__(self) -> str:
+        return f"TimerWheel(tick={self.tick}, levels={self.levels}, pending={len(self._where)})"
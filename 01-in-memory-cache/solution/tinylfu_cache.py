@@ -0,0 +1,152 @@
+"""
+W-TinyLFU Cache — frequency-based admission in front of LRUCache.
+
+Plain LRU admits everything: one pass over a large catalog pushes every
+hot key out, and the hit rate takes minutes to recover. TinyLFU asks one
+question before a new key may displace a cached one:
+
+    "Is the newcomer estimated to be MORE popular than the victim?"
+
+    get / put ──► CountMinSketch.increment(key)   (every access counts)
+
+    put(new key):
+        ┌──────────────┐  overflow   ┌──────────────────────────┐
+        │ window LRU   │ ──────────► │ admission:                │
+        │ (~1% of cap) │  candidate  │ freq(candidate) >         │
+        └──────────────┘             │ freq(main's LRU victim)?  │
+                                     └─────┬──────────────┬──────┘
+                                       yes │              │ no
+                                           ▼              ▼
+                                  ┌─────────────────┐   candidate
+                                  │ main LRU (~99%) │   dropped
+                                  └─────────────────┘
+
+The small window LRU gives brand-new keys a short grace period to build
+up frequency (bursty keys still get hits); the sketch keeps scans and
+one-off keys out of the main region.
+
+Memory overhead: the sketch is depth × width_factor bytes per entry of
+capacity (4 × 4 = 16 by default), independent of how many distinct keys
+pass through.
+"""
+
+from typing import Any, Optional
+
+from count_min_sketch import CountMinSketch
+from lru_cache import LRUCache
+
+
+class TinyLFUCache:
+    """
+    Window LRU + TinyLFU admission + main LRU, with the LRUCache interface.
+    """
+    def __init__(
+        self,
+        capacity: int,
+        window_ratio: float = 0.01,
+        sketch_depth: int = 4,
+        sketch_width_factor: int = 4,
+    ):
+        if capacity < 2:
+            raise ValueError("Capacity must be at least 2 (one window + one main entry)")
+        if not 0 < window_ratio < 1:
+            raise ValueError("Window ratio must be in (0, 1)")
+
+        self.capacity = capacity
+        # window + main == capacity exactly, each region at least 1
+        window_capacity = min(max(1, int(capacity * window_ratio)), capacity - 1)
+        main_capacity = capacity - window_capacity
+
+        self._window = LRUCache(window_capacity)
+        self._main = LRUCache(main_capacity)
+        self._sketch = CountMinSketch(capacity, depth=sketch_depth, width_factor=sketch_width_factor)
+
+        # stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejections = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the window or the main region.
+        """
+        self._sketch.increment(key)
+        for region in (self._window, self._main):
+            if key in region:
+                self._hits += 1
+                return region.get(key)
+        self._misses += 1
+        return None
+
+    def put(self, key: str, value: Any):
+        """
+        Put a value into the cache. New keys enter the window.
+        """
+        self._sketch.increment(key)
+
+        # Case 1: Key already cached — update in place
+        for region in (self._window, self._main):
+            if key in region:
+                region.put(key, value)
+                return
+
+        # Case 2: Window full — its LRU entry competes for the main region
+        if len(self._window) >= self._window.capacity:
+            candidate, candidate_value = self._window.peek_lru()
+            self._window.delete(candidate)
+            self._admit(candidate, candidate_value)
+
+        # Case 3: New key — always enters the window
+        self._window.put(key, value)
+
+    def _admit(self, candidate: str, value: Any):
+        """
+        Move a window candidate into main if it beats main's LRU victim.
+        """
+        if len(self._main) < self._main.capacity:
+            self._main.put(candidate, value)
+            return
+
+        victim, _ = self._main.peek_lru()
+        if self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+            self._main.put(candidate, value)  # Evicts victim
+        else:
+            self._rejections += 1
+        self._evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from whichever region holds it.
+        """
+        return self._window.delete(key) or self._main.delete(key)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the stats of the cache.
+
+        evictions counts every entry that left the cache; rejections is
+        the subset where the candidate lost and the victim stayed.
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "rejections": self._rejections,
+            "window_size": len(self._window),
+            "main_size": len(self._main),
+            "sketch_bytes": self._sketch.memory_bytes,
+            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+        }
+
+    def __len__(self) -> int:
+        return len(self._window) + len(self._main)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._window or key in self._main
+
+    def __repr__(self) -> str:
+        return f"TinyLFUCache(capacity={self.capacity}, window={self._window}, main={self._main})"
@@ -0,0 +1,178 @@
+"""
+Synthetic access traces for cache benchmarks.
+
+Every generator yields integer keys lazily, so traces of any length can
+be replayed without holding them in memory.
+
+    zipf_trace  → a few keys are very hot, a long tail is cold
+                  (the shape of most real key-value workloads)
+    scan_trace  → a Zipfian hot set interrupted by long one-off scans
+                  (batch jobs, catalog crawls) — flushes plain LRU
+    loop_trace  → the same keys cycled in order (iterative jobs) — LRU's
+                  worst case: a loop one key larger than the cache misses
+                  on EVERY request
+    mixed_trace → zipf, loop and scan phases interleaved in fixed-size
+                  bursts, so a policy must adapt as the pattern shifts
+
+Recorded traces are streamed from disk the same way:
+
+    read_csv_trace     → one key per row (any column), as strings
+    read_binary_trace  → fixed-size struct records, e.g. "<Q" for raw
+                         u64 keys; read in 1 MiB chunks
+
+NEW CONCEPT — itertools.accumulate + bisect:
+    Sampling from a fixed discrete distribution: precompute cumulative
+    weights once, then each draw is a binary search for a uniform random
+    number. random.choices(cum_weights=...) does exactly that.
+"""
+
+import csv
+import random
+import struct
+from itertools import accumulate
+from typing import Iterable, Iterator
+
+
+def zipf_weights(keyspace: int, alpha: float) -> list[float]:
+    """
+    Cumulative Zipf weights: key i has probability proportional to 1 / (i+1)^alpha.
+    """
+    return list(accumulate(1.0 / (rank ** alpha) for rank in range(1, keyspace + 1)))
+
+
+def zipf_trace(length: int, keyspace: int, alpha: float = 1.0, seed: int = 0) -> Iterator[int]:
+    """
+    Yield length keys drawn from a Zipf(alpha) distribution over keyspace keys.
+    """
+    rng = random.Random(seed)
+    cum_weights = zipf_weights(keyspace, alpha)
+    keys = range(keyspace)
+    chunk = 10_000
+    for start in range(0, length, chunk):
+        yield from rng.choices(keys, cum_weights=cum_weights, k=min(chunk, length - start))
+
+
+def scan_trace(
+    length: int,
+    keyspace: int,
+    alpha: float = 1.0,
+    scan_length: int = 10_000,
+    scan_every: int = 50_000,
+    seed: int = 0,
+) -> Iterator[int]:
+    """
+    Zipfian traffic with a sequential scan of never-repeated keys every
+    scan_every requests. Scan keys start at keyspace, so they never
+    collide with the hot set.
+    """
+    hot = zipf_trace(length, keyspace, alpha, seed)
+    next_scan_key = keyspace
+    emitted = 0
+    while emitted < length:
+        for _ in range(min(scan_every, length - emitted)):
+            yield next(hot)
+            emitted += 1
+        for _ in range(min(scan_length, length - emitted)):
+            yield next_scan_key
+            next_scan_key += 1
+            emitted += 1
+
+
+def loop_trace(length: int, loop_size: int, start: int = 0) -> Iterator[int]:
+    """
+    Yield keys start .. start + loop_size - 1 in order, over and over.
+    """
+    for i in range(length):
+        yield start + i % loop_size
+
+
+def mixed_trace(
+    length: int,
+    keyspace: int,
+    alpha: float = 1.0,
+    loop_size: int = 0,
+    burst: int = 10_000,
+    weights: tuple[float, float, float] = (0.6, 0.3, 0.1),
+    seed: int = 0,
+) -> Iterator[int]:
+    """
+    Bursts of zipf / loop / scan traffic, the kind of each burst drawn
+    with the given (zipf, loop, scan) weights.
+
+    Loop keys are offset past the Zipf keyspace and scan keys past the
+    loop, so the three phases never share keys. loop_size defaults to
+    keyspace // 10.
+    """
+    rng = random.Random(seed)
+    loop_size = loop_size or max(1, keyspace // 10)
+    hot = zipf_trace(length, keyspace, alpha, seed)
+    loop = loop_trace(length, loop_size, start=keyspace)
+    next_scan_key = keyspace + loop_size
+    emitted = 0
+    while emitted < length:
+        count = min(burst, length - emitted)
+        kind = rng.choices(("zipf", "loop", "scan"), weights=weights)[0]
+        if kind == "zipf":
+            for _ in range(count):
+                yield next(hot)
+        elif kind == "loop":
+            for _ in range(count):
+                yield next(loop)
+        else:
+            yield from range(next_scan_key, next_scan_key + count)
+            next_scan_key += count
+        emitted += count
+
+
+def read_csv_trace(path: str, column: int | str = 0, header: bool = False) -> Iterator[str]:
+    """
+    Stream keys from one column of a CSV file, row by row.
+
+    column is an index, or a column name (which implies a header row).
+    """
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        if isinstance(column, str):
+            column = next(reader).index(column)
+        elif header:
+            next(reader, None)
+        for row in reader:
+            if row:
+                yield row[column]
+
+
+def read_binary_trace(path: str, record_format: str = "<Q", key_field: int = 0) -> Iterator[int]:
+    """
+    Stream keys from a file of fixed-size struct records.
+
+    The default reads raw little-endian u64 keys. Richer formats pick
+    the key out of each record, e.g. record_format="<IQIq", key_field=1
+    for (timestamp, object id, size, next access) records.
+    """
+    record = struct.Struct(record_format)
+    chunk_size = record.size * max(1, (1 << 20) // record.size)
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            if len(chunk) % record.size:
+                raise ValueError(f"Truncated trace record in '{path}'")
+            for fields in record.iter_unpack(chunk):
+                yield fields[key_field]
+
+
+def write_binary_trace(path: str, keys: Iterable[int], record_format: str = "<Q") -> int:
+    """
+    Write integer keys as single-field struct records (the inverse of
+    read_binary_trace's default). Returns how many were written.
+    """
+    record = struct.Struct(record_format)
+    count = 0
+    with open(path, "wb") as file:
+        buf = bytearray()
+        for key in keys:
+            buf += record.pack(key)
+            count += 1
+            if len(buf) >= 1 << 16:
+                file.write(buf)
+                buf.clear()
+        file.write(buf)
+    return count